@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+casting throughput benchmarks for pyching_engine
+
+run from the repository root:
+    python benchmarks/bench_casting.py
+"""
+
+import random
+import sys
+import threading
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+
+def report(label: str, seconds: float, readings: int) -> None:
+    """print one benchmark result as readings per second"""
+    print(f'{label:<40} {readings / seconds:>14,.0f} readings/s')
+
+
+def bench_newline(readings: int = 20000) -> None:
+    """step by step casting with Hexagrams.NewLine"""
+    def cast() -> None:
+        for _ in range(readings):
+            hexes = pyching_engine.Hexagrams('coin')
+            for _ in range(6):
+                hexes.NewLine()
+    report('Hexagrams.NewLine x 6', min(timeit.repeat(cast, number=1, repeat=3)), readings)
+
+
+def bench_coin_line(lines: int = 200000) -> None:
+    """one coin line: three random choices summed with reduce, against one 3 bit draw"""
+    from functools import reduce
+    rng = pyching_engine.thread_rng()
+    def choices() -> None:
+        rc = rng.choice
+        for _ in range(lines):
+            values = [rc([2,3]), rc([2,3]), rc([2,3])]
+            reduce(lambda x,y: x+y, values)
+    oracle = pyching_engine.get_oracle('coin')
+    def draw() -> None:
+        castLine, lineValue = oracle.cast_line, oracle.line_value
+        for _ in range(lines):
+            lineValue(castLine(rng))
+    for label, cast in (('three choices + reduce', choices), ('one 3 bit draw', draw)):
+        seconds = min(timeit.repeat(cast, number=1, repeat=3))
+        print(f'{"coin line, " + label:<40} {lines / seconds:>14,.0f} lines/s')
+
+
+def bench_reuse(readings: int = 20000) -> None:
+    """step by step casting with a new Hexagrams per reading, one recast instance and a pool"""
+    def new() -> None:
+        for _ in range(readings):
+            hexes = pyching_engine.Hexagrams('coin')
+            hexes.SetQuestion('question')
+            for _ in range(6):
+                hexes.NewLine()
+    hexes = pyching_engine.Hexagrams('coin')
+    def recast() -> None:
+        for _ in range(readings):
+            hexes.recast('question')
+    pool = pyching_engine.HexagramsPool('coin')
+    def pooled() -> None:
+        for _ in range(readings):
+            with pool.reading('question') as hexes:
+                for _ in range(6):
+                    hexes.NewLine()
+    for label, cast in (('new Hexagrams', new), ('Hexagrams.recast', recast), ('HexagramsPool', pooled)):
+        report(f'NewLine x 6, {label}', min(timeit.repeat(cast, number=1, repeat=3)), readings)
+
+
+def bench_cast_many(readings: int = 500000) -> None:
+    """bulk casting with cast_many"""
+    seconds = min(timeit.repeat(lambda: pyching_engine.cast_many(readings), number=1, repeat=3))
+    report('cast_many', seconds, readings)
+
+
+def bench_iter_readings(readings: int = 500000) -> None:
+    """streamed casting with iter_readings"""
+    def cast() -> None:
+        for _ in pyching_engine.iter_readings(readings):
+            pass
+    report('iter_readings', min(timeit.repeat(cast, number=1, repeat=3)), readings)
+
+
+def bench_cast_arrays(readings: int = 2000000) -> None:
+    """vectorized casting with cast_arrays (numpy, or the cast_many fallback)"""
+    seconds = min(timeit.repeat(lambda: pyching_engine.cast_arrays(readings), number=1, repeat=3))
+    backend = 'numpy' if pyching_engine._Numpy() is not None else 'fallback'
+    report(f'cast_arrays ({backend})', seconds, readings)
+
+
+def bench_entropy_sources(readings: int = 10000) -> None:
+    """step by step and bulk casting with each of the selectable entropy sources"""
+    for name in pyching_engine.ENTROPY_SOURCES:
+        rng = pyching_engine.GetEntropySource(name)
+        def cast() -> None:
+            for _ in range(readings):
+                hexes = pyching_engine.Hexagrams('coin', entropy=rng)
+                for _ in range(6):
+                    hexes.NewLine()
+        report(f'NewLine x 6, {name}', min(timeit.repeat(cast, number=1, repeat=3)), readings)
+        seconds = min(timeit.repeat(lambda: pyching_engine.cast_many(readings * 10, rng), number=1, repeat=3))
+        report(f'cast_many, {name}', seconds, readings * 10)
+
+
+def bench_oracles(readings: int = 5000) -> None:
+    """every registered oracle: step by step, batch and vectorized casting"""
+    for oracle in pyching_engine.ORACLES:
+        def cast() -> None:
+            for _ in range(readings):
+                hexes = pyching_engine.Hexagrams(oracle)
+                for _ in range(6):
+                    hexes.NewLine()
+        report(f'NewLine x 6, {oracle}', min(timeit.repeat(cast, number=1, repeat=3)), readings)
+        seconds = min(timeit.repeat(lambda: pyching_engine.cast_many(readings * 10, oracle=oracle),
+                                    number=1, repeat=3))
+        report(f'cast_many, {oracle}', seconds, readings * 10)
+        seconds = min(timeit.repeat(lambda: pyching_engine.cast_arrays(readings * 10, oracle=oracle),
+                                    number=1, repeat=3))
+        report(f'cast_arrays, {oracle}', seconds, readings * 10)
+
+
+def bench_threads(readings: int = 40000, threadCounts: tuple[int, ...] = (1, 2, 4, 8)) -> None:
+    """
+    total casting throughput as threads are added, one step by step reading
+    for every ten bulk ones, with each thread's own generator against one
+    generator shared by every thread. with the GIL the
+    totals stay flat, free-threaded builds should scale with the per-thread ones.
+    """
+    def run(threads: int, shared: bool) -> float:
+        def cast() -> None:
+            rng = random if shared else None
+            for _ in range(readings // threads):
+                hexes = pyching_engine.Hexagrams('coin', entropy=rng)
+                for _ in range(6):
+                    hexes.NewLine()
+            pyching_engine.cast_many(readings * 10 // threads, rng)
+        workers = [threading.Thread(target=cast) for _ in range(threads)]
+        start = timeit.default_timer()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return timeit.default_timer() - start
+    for threads in threadCounts:
+        for shared in (False, True):
+            seconds = min(run(threads, shared) for _ in range(3))
+            report(f'{threads} threads, {"shared" if shared else "per-thread"} generator',
+                   seconds, readings * 11)
+
+
+if __name__ == '__main__':
+    bench_newline()
+    bench_coin_line()
+    bench_reuse()
+    bench_cast_many()
+    bench_iter_readings()
+    bench_cast_arrays()
+    bench_entropy_sources()
+    bench_oracles()
+    bench_threads()
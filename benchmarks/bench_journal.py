@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+reading journal benchmarks for pyching_journal
+
+run from the repository root:
+    python benchmarks/bench_journal.py [readings]
+
+covers both the sqlite ReadingJournal and the append-only JournalLog
+"""
+
+import random
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+import pyching_journal
+
+
+def build_batch(readings: int) -> pyching_engine.ReadingBatch:
+    """readings spread evenly over 2024 to 2026, with a thousand different questions"""
+    rng = random.Random(2025)
+    start, end = datetime(2024, 1, 1).timestamp(), datetime(2027, 1, 1).timestamp()
+    batch = pyching_engine.ReadingBatch()
+    batch.extend(pyching_engine.cast_many(readings, rng),
+                 [f'question number {number % 1000}' for number in range(readings)],
+                 sorted(rng.uniform(start, end) for _ in range(readings)))
+    return batch
+
+
+def bench_journal(readings: int = 1000000) -> None:
+    """batched insert, then typical queries against the full journal"""
+    batch = build_batch(readings)
+    with tempfile.TemporaryDirectory() as directory:
+        with pyching_journal.ReadingJournal(Path(directory) / 'journal.db') as journal:
+            seconds = timeit.timeit(lambda: journal.add_batch(batch), number=1)
+            print(f'{"add_batch":<50} {readings / seconds:>12,.0f} readings/s')
+            queries = (
+                ('hexagram 29 in 2025', lambda: journal.query(
+                    hexagram=29, start=datetime(2025, 1, 1), end=datetime(2026, 1, 1))),
+                ('count hex1 29 in 2025', lambda: journal.count(
+                    hex1=29, start=datetime(2025, 1, 1), end=datetime(2026, 1, 1))),
+                ('count all six lines moving', lambda: journal.count(moving=0b111111)),
+                ('first 20 questions matching "number 7"', lambda: journal.query(text='number 7', limit=20)),
+            )
+            for label, query in queries:
+                seconds = min(timeit.repeat(query, number=1, repeat=5))
+                print(f'{label:<50} {seconds * 1000:>12,.2f} ms')
+
+
+def bench_journal_log(readings: int = 1000000) -> None:
+    """appends at several fsync intervals, then random record reads and timestamp seeks"""
+    batch = build_batch(readings)
+    entries = list(zip(batch, batch.timestamps))
+    rng = random.Random(23)
+    with tempfile.TemporaryDirectory() as directory:
+        for syncInterval in (None, 1.0, 0.0):
+            path = Path(directory) / f'journal{syncInterval}.log'
+            appends = readings if syncInterval != 0.0 else min(readings, 20000)
+            def append() -> None:
+                with pyching_journal.JournalLog(path, syncInterval=syncInterval) as log:
+                    for reading, timestamp in entries[:appends]:
+                        log.append(reading, timestamp)
+            seconds = timeit.timeit(append, number=1)
+            label = 'no fsync' if syncInterval is None else f'fsync every {syncInterval}s'
+            print(f'{"JournalLog.append, " + label:<50} '
+                  f'{appends / seconds:>12,.0f} readings/s')
+        with pyching_journal.JournalLogReader(Path(directory) / 'journalNone.log') as reader:
+            numbers = [rng.randrange(readings) for _ in range(10000)]
+            seconds = timeit.timeit(lambda: [reader[number] for number in numbers], number=1)
+            print(f'{"JournalLogReader[n], random n":<50} {seconds / len(numbers) * 1e6:>12,.2f} us')
+            times = [rng.uniform(batch.timestamps[0], batch.timestamps[-1]) for _ in range(10000)]
+            seconds = timeit.timeit(lambda: [reader.seek_time(when) for when in times], number=1)
+            print(f'{"JournalLogReader.seek_time, random time":<50} {seconds / len(times) * 1e6:>12,.2f} us')
+
+
+if __name__ == '__main__':
+    readings = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    bench_journal(readings)
+    bench_journal_log(readings)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+memory per reading benchmarks for pyching_engine
+
+run from the repository root:
+    python benchmarks/bench_memory.py
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+# targets in bytes per reading, not counting the question text (which is shared
+# in these measurements): a Reading value held in a list, and a ReadingBatch row
+READING_TARGET_BYTES = 100
+BATCH_TARGET_BYTES = 20
+
+
+def measure(build, readings: int) -> float:
+    """return the bytes allocated per reading by build(readings), kept alive while measured"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build(readings)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del kept
+    return allocated / readings
+
+
+def build_hexagrams(readings: int) -> list:
+    """a list of complete Hexagrams instances"""
+    kept = []
+    for _ in range(readings):
+        hexes = pyching_engine.Hexagrams('coin')
+        hexes.question = 'question'
+        for _ in range(6):
+            hexes.NewLine()
+        kept.append(hexes)
+    return kept
+
+
+def build_readings(readings: int) -> list:
+    """a list of Reading value objects"""
+    Reading = pyching_engine.Reading
+    return [Reading(lines, 'question', 'coin') for lines in pyching_engine.cast_many(readings)]
+
+
+def build_batch(readings: int) -> pyching_engine.ReadingBatch:
+    """a columnar ReadingBatch"""
+    return pyching_engine.ReadingBatch.cast(readings, question='question')
+
+
+def report(label: str, bytesPerReading: float, target: float | None = None) -> None:
+    """print one benchmark result, and how it compares to its target"""
+    result = f'{label:<40} {bytesPerReading:>10,.1f} bytes/reading'
+    if target is not None:
+        result += f'   target <= {target}: {"ok" if bytesPerReading <= target else "MISSED"}'
+    print(result)
+
+
+if __name__ == '__main__':
+    report('Hexagrams', measure(build_hexagrams, 20000))
+    report('Reading', measure(build_readings, 200000), READING_TARGET_BYTES)
+    report('ReadingBatch', measure(build_batch, 1000000), BATCH_TARGET_BYTES)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+save file benchmarks for pyching_engine, binary against legacy pickle
+
+run from the repository root, optionally with the number of files to index:
+    python benchmarks/bench_storage.py [files]
+"""
+
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+
+def report(label: str, seconds: float, operations: int) -> None:
+    """print one benchmark result as microseconds per operation"""
+    print(f'{label:<40} {seconds / operations * 1e6:>10,.1f} us each')
+
+
+def bench_save_load(files: int = 2000) -> None:
+    """save and load latency and file size of each save file format"""
+    hexes = pyching_engine.Hexagrams('coin')
+    hexes.recast('Will the benchmark finish quickly?')
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [Path(directory) / f'reading{number}.psv' for number in range(files)]
+        for fileFormat in ('binary', 'pickle'):
+            def save() -> None:
+                for path in paths:
+                    hexes.Save(path, fileFormat)
+            report(f'Save, {fileFormat}', min(timeit.repeat(save, number=1, repeat=3)), files)
+            loaded = pyching_engine.Hexagrams()
+            def load() -> None:
+                for path in paths:
+                    loaded.Load(path)
+            report(f'Load, {fileFormat}', min(timeit.repeat(load, number=1, repeat=3)), files)
+            def peek() -> None:
+                for path in paths:
+                    pyching_engine.peek_save_info(path)
+            report(f'peek_save_info, {fileFormat}', min(timeit.repeat(peek, number=1, repeat=3)), files)
+            print(f'{"file size, " + fileFormat:<40} {paths[0].stat().st_size:>10,} bytes')
+
+
+def bench_encode_decode(readings: int = 100000) -> None:
+    """in memory encoding and decoding, without any file system cost"""
+    hexes = pyching_engine.Hexagrams('coin')
+    hexes.recast('Will the benchmark finish quickly?')
+    data = pyching_engine.encode_save(hexes)
+    seconds = min(timeit.repeat(lambda: pyching_engine.encode_save(hexes), number=readings, repeat=3))
+    report('encode_save', seconds, readings)
+    seconds = min(timeit.repeat(lambda: pyching_engine.decode_save(data), number=readings, repeat=3))
+    report('decode_save', seconds, readings)
+
+
+def bench_save_index(files: int = 20000) -> None:
+    """listing a save directory through SaveIndex, cold, after no changes and cached"""
+    hexes = pyching_engine.Hexagrams('coin')
+    with tempfile.TemporaryDirectory() as directory:
+        for number in range(files):
+            hexes.recast(f'Question number {number}?')
+            hexes.Save(Path(directory) / f'reading{number}.psv')
+        start = time.perf_counter()
+        pyching_engine.SaveIndex(directory).refresh()
+        report('SaveIndex build, per file', time.perf_counter() - start, files)
+        start = time.perf_counter()
+        index = pyching_engine.SaveIndex(directory)
+        report('SaveIndex read cache, per file', time.perf_counter() - start, files)
+        start = time.perf_counter()
+        index.refresh()
+        report('SaveIndex refresh unchanged, per file', time.perf_counter() - start, files)
+        start = time.perf_counter()
+        index.readings()
+        report('SaveIndex sort by date, per file', time.perf_counter() - start, files)
+
+
+if __name__ == '__main__':
+    bench_save_load()
+    bench_encode_decode()
+    bench_save_index(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,146 @@
+##---------------------------------------------------------------------------##
+##
+## pyChing -- a Python program to cast and interpret I Ching hexagrams
+##
+## Copyright (C) 1999-2006 Stephen M. Gava
+## Copyright (C) 2025 - Batch casting implementation
+##
+## This program is free software; you can redistribute it and/or modify
+## it under the terms of the GNU General Public License as published by
+## the Free Software Foundation; either version 2 of the License, or
+## (at your option) any later version.
+##
+## This program is distributed in the hope that it will be of some
+## interest to somebody, but WITHOUT ANY WARRANTY; without even the 
+## implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+## See the GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with this program; see the file COPYING or COPYING.txt. If not, 
+##  write to the Free Software Foundation, Inc.,
+## 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+## The license can also be found at the GNU/FSF website: http://www.gnu.org
+##
+##---------------------------------------------------------------------------##
+"""
+batch casting module for pyching
+casts and tallies very large numbers of readings across a pool of processes
+"""
+#python library imports
+import os
+import secrets
+from array import array
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+#pyching imports
+import pyching_engine
+
+class BatchTally:
+    """
+    merged counts of a batch of readings, public class
+
+    readings are counted by packed line values, so every other tally (hexagram
+    frequencies, hex1/hex2 pairs, moving lines) can be derived without keeping
+    the readings themselves
+    """
+    def __init__(self, seed: int, packedCounts: Optional[array] = None) -> None:
+        self.seed: int = seed  # master seed of the CastingStream the readings came from
+        self.packedCounts: array = packedCounts if packedCounts is not None else array('Q', bytes(8 * 4096))
+
+    @property
+    def readings(self) -> int:
+        """
+        total number of readings tallied
+        """
+        return sum(self.packedCounts)
+
+    def merge(self, packedCounts: array) -> None:
+        """
+        add another set of packed reading counts to this tally, public method
+        """
+        for packed, count in enumerate(packedCounts):
+            if count: self.packedCounts[packed] = self.packedCounts[packed] + count
+
+    def hex1_counts(self) -> list[int]:
+        """
+        return hex1 frequencies indexed by King Wen number, index 0 is unused, public method
+        """
+        counts = [0] * 65
+        for packed, count in enumerate(self.packedCounts):
+            counts[pyching_engine.HEX1_BY_PACKED[packed]] += count
+        return counts
+
+    def hex2_counts(self) -> list[int]:
+        """
+        return hex2 frequencies indexed by King Wen number, public method
+
+        index 0 counts the readings with no moving lines (and so no hex2)
+        """
+        counts = [0] * 65
+        for packed, count in enumerate(self.packedCounts):
+            counts[pyching_engine.HEX2_BY_PACKED[packed]] += count
+        return counts
+
+    def pair_counts(self) -> list[list[int]]:
+        """
+        return (hex1, hex2) frequencies as a 65 x 65 matrix indexed by King Wen numbers, public method
+
+        column 0 counts the readings with no moving lines
+        """
+        counts = [[0] * 65 for _ in range(65)]
+        for packed, count in enumerate(self.packedCounts):
+            counts[pyching_engine.HEX1_BY_PACKED[packed]][pyching_engine.HEX2_BY_PACKED[packed]] += count
+        return counts
+
+def _TallyRange(seed: int, blockSize: int, start: int, stop: int) -> bytes:
+    """
+    cast readings start to stop - 1 of a CastingStream and count them, private function
+
+    runs in a worker process, returns the 4096 packed reading counts as the bytes
+    of an array('Q') so that only 32KB goes back to the parent process
+    """
+    stream = pyching_engine.CastingStream(seed, blockSize)
+    counter: Counter[int] = Counter()
+    for blockStart in range(start, stop, blockSize):
+        counter.update(stream.cast(blockStart, min(blockStart + blockSize, stop)))
+    counts = array('Q', bytes(8 * 4096))
+    for packed, count in counter.items():
+        counts[packed] = count
+    return counts.tobytes()
+
+def tally_readings(total: int, seed: Optional[int] = None, workers: Optional[int] = None,
+                   progress: Optional[Callable[[int, int], None]] = None,
+                   taskSize: int = 1 << 20, blockSize: int = 4096) -> BatchTally:
+    """
+    cast and tally total coin readings across a pool of worker processes, public function
+
+    readings come from a pyching_engine.CastingStream, so for a given seed the
+    tally is the same whatever the number of workers. a random seed is chosen if
+    none is given, it is kept in the returned BatchTally. the work is split into
+    tasks of about taskSize readings, and progress (if given) is called as
+    progress(readingsDone, total) as each task finishes. workers defaults to the
+    cpu count, with workers=1 everything runs in the calling process.
+    """
+    if seed is None:
+        seed = secrets.randbits(64)
+    stream = pyching_engine.CastingStream(seed, blockSize)
+    tasks = stream.shards(total, max(1, -(-total // taskSize)))
+    tally = BatchTally(seed)
+    done = 0
+    if workers == 1:
+        for start, stop in tasks:
+            tally.merge(array('Q', _TallyRange(seed, blockSize, start, stop)))
+            done = done + stop - start
+            if progress: progress(done, total)
+        return tally
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {executor.submit(_TallyRange, seed, blockSize, start, stop): stop - start
+                   for start, stop in tasks}
+        for future in as_completed(futures):
+            tally.merge(array('Q', future.result()))
+            done = done + futures[future]
+            if progress: progress(done, total)
+    return tally
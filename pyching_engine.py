@@ -34,10 +34,534 @@ import sys
 import os
 import random
 import pickle
+import pickletools
+import struct
+import hashlib
+import unicodedata
 import time
-from functools import reduce
+import threading
+from array import array
+from fractions import Fraction
+from functools import cache, lru_cache, reduce
+from itertools import repeat
+from math import comb
 from pathlib import Path
-from typing import Optional, Any
+from dataclasses import dataclass
+from collections import Counter
+from contextlib import contextmanager
+from collections.abc import Callable, Iterator, Sequence
+from typing import Optional, Any, NamedTuple
+
+#
+# hexagram tables
+################
+
+# the King Wen sequence of hexagrams, the hexagram number is the table index + 1
+# each entry is (unmoving line values from the bottom line up, hexagram name)
+_KING_WEN = (
+    ((7,7,7,7,7,7), "Tch'ien"),  # 1
+    ((8,8,8,8,8,8), "Koun"),  # 2
+    ((7,8,8,8,7,8), "T'oun"),  # 3
+    ((8,7,8,8,8,7), "Mong"),  # 4
+    ((7,7,7,8,7,8), "Hsu"),  # 5
+    ((8,7,8,7,7,7), "Song"),  # 6
+    ((8,7,8,8,8,8), "Cheu"),  # 7
+    ((8,8,8,8,7,8), "Pi"),  # 8
+    ((7,7,7,8,7,7), "Siao Tch'ou"),  # 9
+    ((7,7,8,7,7,7), "Li"),  # 10
+    ((7,7,7,8,8,8), "T'ai"),  # 11
+    ((8,8,8,7,7,7), "P'i"),  # 12
+    ((7,8,7,7,7,7), "Tong Jen"),  # 13
+    ((7,7,7,7,8,7), "Ta You"),  # 14
+    ((8,8,7,8,8,8), "Tchien"),  # 15
+    ((8,8,8,7,8,8), "Yu"),  # 16
+    ((7,8,8,7,7,8), "Souei"),  # 17
+    ((8,7,7,8,8,7), "Kou"),  # 18
+    ((7,7,8,8,8,8), "Lin"),  # 19
+    ((8,8,8,8,7,7), "Kouan"),  # 20
+    ((7,8,8,7,8,7), "Che Ho"),  # 21
+    ((7,8,7,8,8,7), "Pi"),  # 22
+    ((8,8,8,8,8,7), "Po"),  # 23
+    ((7,8,8,8,8,8), "Fou"),  # 24
+    ((7,8,8,7,7,7), "Wou Wang"),  # 25
+    ((7,7,7,8,8,7), "Ta Tch'ou"),  # 26
+    ((7,8,8,8,8,7), "I"),  # 27
+    ((8,7,7,7,7,8), "Ta Kouo"),  # 28
+    ((8,7,8,8,7,8), "K'an"),  # 29
+    ((7,8,7,7,8,7), "Li"),  # 30
+    ((8,8,7,7,7,8), "Hsien"),  # 31
+    ((8,7,7,7,8,8), "Hong"),  # 32
+    ((8,8,7,7,7,7), "Toun"),  # 33
+    ((7,7,7,7,8,8), "Ta Tch'ouang"),  # 34
+    ((8,8,8,7,8,7), "Tchin"),  # 35
+    ((7,8,7,8,8,8), "Ming Yi"),  # 36
+    ((7,8,7,8,7,7), "Tchia Jen"),  # 37
+    ((7,7,8,7,8,7), "K'ouei"),  # 38
+    ((8,8,7,8,7,8), "Tch'ien"),  # 39
+    ((8,7,8,7,8,8), "Tchieh"),  # 40
+    ((7,7,8,8,8,7), "Soun"),  # 41
+    ((7,8,8,8,7,7), "Yi"),  # 42
+    ((7,7,7,7,7,8), "Kouai"),  # 43
+    ((8,7,7,7,7,7), "Keou"),  # 44
+    ((8,8,8,7,7,8), "Ts'ouei"),  # 45
+    ((8,7,7,8,8,8), "Cheng"),  # 46
+    ((8,7,8,7,7,8), "K'oun"),  # 47
+    ((8,7,7,8,7,8), "Tsing"),  # 48
+    ((7,8,7,7,7,8), "Keu"),  # 49
+    ((8,7,7,7,8,7), "Ting"),  # 50
+    ((7,8,8,7,8,8), "Tchen"),  # 51
+    ((8,8,7,8,8,7), "Ken"),  # 52
+    ((8,8,7,8,7,7), "Tchien"),  # 53
+    ((7,7,8,7,8,8), "Kouei Mei"),  # 54
+    ((7,8,7,7,8,8), "Fong"),  # 55
+    ((8,8,7,7,8,7), "Lu"),  # 56
+    ((8,7,7,8,7,7), "Hsuan"),  # 57
+    ((7,7,8,7,7,8), "Touei"),  # 58
+    ((8,7,8,8,7,7), "Houan"),  # 59
+    ((7,7,8,8,7,8), "Tchieh"),  # 60
+    ((7,7,8,8,7,7), "Tchong Fou"),  # 61
+    ((8,8,7,7,8,8), "Siao Kouo"),  # 62
+    ((7,8,7,8,7,8), "Tchi Tchi"),  # 63
+    ((8,7,8,7,8,7), "Wei Tchi"),  # 64
+)
+
+# a hexagram code is a 6 bit integer, bit 0 holds the bottom line and bit 5 the
+# topmost line, a yang line (7 or 9) sets its bit and a yin line (6 or 8) clears it
+YANG: int = 1
+YIN: int = 0
+_LINE_BITS = {6: YIN, 7: YANG, 8: YIN, 9: YANG}
+
+def hexagram_code(lineValues: Sequence[int]) -> int:
+    """
+    return the 6 bit hexagram code for a sequence of six line values, public function
+
+    moving lines (6 and 9) are coded as their unmoving form (8 and 7), raises
+    ValueError if there aren't six line values of 6, 7, 8 or 9
+    """
+    if len(lineValues) != 6:
+        raise ValueError(f'a hexagram needs six line values, got {list(lineValues)}')
+    code = 0
+    try:
+        for bit, value in enumerate(lineValues):
+            code |= _LINE_BITS[value] << bit
+    except KeyError:
+        raise ValueError(f'invalid line values: {list(lineValues)}') from None
+    return code
+
+# hexagram code indexed by King Wen number, index 0 is unused (-1)
+CODE_BY_NUMBER: tuple[int, ...] = (-1,) + tuple(hexagram_code(lines) for lines, name in _KING_WEN)
+# King Wen number (1-64) indexed by hexagram code
+NUMBER_BY_CODE: tuple[int, ...] = tuple(sorted(range(1, 65), key=CODE_BY_NUMBER.__getitem__))
+# hexagram name indexed by King Wen number, index 0 is unused ('')
+NAME_BY_NUMBER: tuple[str, ...] = ('',) + tuple(name for lines, name in _KING_WEN)
+# hexagram name indexed by hexagram code
+NAME_BY_CODE: tuple[str, ...] = tuple(NAME_BY_NUMBER[number] for number in NUMBER_BY_CODE)
+
+def hexagram_details(code: int) -> tuple[str, str]:
+    """
+    lookup hexagram number and name by hexagram code, public function
+
+    returns a tuple of Hexagram details in the form (number, name), as
+    stored in the Hexagram.number and Hexagram.name attributes
+    """
+    return (str(NUMBER_BY_CODE[code]), NAME_BY_CODE[code])
+
+# packed line values hold 2 bits per line, bits 2i and 2i+1 for line i counting from
+# the bottom line, each storing the line value - 6 (6 -> 0, 7 -> 1, 8 -> 2, 9 -> 3),
+# so every possible reading is one of 4**6 = 4096 packed values
+_LINE_CODES = {6: 0, 7: 1, 8: 2, 9: 3}
+
+def pack_lines(lineValues: Sequence[int]) -> int:
+    """
+    return the packed 12 bit form of six line values, public function
+
+    raises ValueError if there aren't six line values of 6, 7, 8 or 9
+    """
+    if len(lineValues) != 6:
+        raise ValueError(f'a reading needs six line values, got {list(lineValues)}')
+    packed = 0
+    try:
+        for shift, value in zip((0, 2, 4, 6, 8, 10), lineValues):
+            packed |= _LINE_CODES[value] << shift
+    except KeyError:
+        raise ValueError(f'invalid line values: {list(lineValues)}') from None
+    return packed
+
+def unpack_lines(packed: int) -> tuple[int, ...]:
+    """
+    return the six line values held in a packed 12 bit value, public function
+    """
+    return tuple(6 + ((packed >> shift) & 3) for shift in (0, 2, 4, 6, 8, 10))
+
+class Completion(NamedTuple):
+    """
+    everything needed to complete a reading from its packed line values, public class
+
+    the hex2 fields are empty ('', None, all 0 line values, code -1) when
+    there are no moving lines
+    """
+    movingMask: int  # bit i is set when line i is moving (6 or 9)
+    hex1Code: int
+    hex1Number: str
+    hex1Name: str
+    hex1InfoSource: str
+    hex2Code: int
+    hex2Number: str
+    hex2Name: str
+    hex2InfoSource: Optional[str]
+    hex2LineValues: tuple[int, ...]
+
+def _BuildCompletion(packed: int) -> Completion:
+    """
+    work out the completion of one packed reading, private function
+    """
+    lineValues = unpack_lines(packed)
+    movingMask = 0
+    for bit, value in enumerate(lineValues):
+        if value in (6, 9): movingMask |= 1 << bit
+    hex1Code = hexagram_code(lineValues)
+    hex1Number, hex1Name = hexagram_details(hex1Code)
+    if movingMask:
+        hex2Code = hex1Code ^ movingMask
+        hex2Number, hex2Name = hexagram_details(hex2Code)
+        hex2InfoSource = 'pyching_int_data.in'+hex2Number+'data()'
+        hex2LineValues = tuple(8 - ((hex2Code >> bit) & 1) for bit in range(6))
+    else:
+        hex2Code, hex2Number, hex2Name, hex2InfoSource = -1, '', '', None
+        hex2LineValues = (0, 0, 0, 0, 0, 0)
+    return Completion(movingMask, hex1Code, hex1Number, hex1Name,
+                      'pyching_int_data.in'+hex1Number+'data()',
+                      hex2Code, hex2Number, hex2Name, hex2InfoSource, hex2LineValues)
+
+# the completion of every possible reading, indexed by its packed line values
+COMPLETIONS: tuple[Completion, ...] = tuple(_BuildCompletion(packed) for packed in range(4096))
+# flat byte lookup tables indexed by packed line values, for the bulk casting paths
+HEX1_BY_PACKED: bytes = bytes(NUMBER_BY_CODE[c.hex1Code] for c in COMPLETIONS)  # hex1 King Wen number
+HEX2_BY_PACKED: bytes = bytes(int(c.hex2Number or 0) for c in COMPLETIONS)  # hex2 King Wen number, 0 if none
+MOVING_BY_PACKED: bytes = bytes(c.movingMask for c in COMPLETIONS)  # moving line mask
+
+
+#
+# oracle methods
+################
+
+class AliasTable:
+    """
+    alias method sampler for a discrete distribution with integer weights, public class
+
+    every sample takes one random integer and at most one comparison. all the
+    arithmetic is done in integers, so the sampled probabilities are exactly
+    weight / sum(weights).
+    """
+    def __init__(self, outcomes: Sequence[Any], weights: Sequence[int]) -> None:
+        self.outcomes: tuple[Any, ...] = tuple(outcomes)
+        self.total: int = sum(weights)  # the capacity of every column
+        self.size: int = len(self.outcomes) * self.total  # range of the random integer drawn per sample
+        #when size is a power of 2 a sample only needs getrandbits, which is much cheaper than randrange
+        self.bits: Optional[int] = self.size.bit_length() - 1 if self.size & (self.size - 1) == 0 else None
+        columns = len(self.outcomes)
+        scaled = [weight * columns for weight in weights] #column shares in units of 1/total
+        self.accept: list[int] = [self.total] * columns  # below this a column gives its own outcome
+        self.alias: list[Any] = list(self.outcomes)  # otherwise it gives its alias outcome
+        small = [i for i in range(columns) if scaled[i] < self.total]
+        large = [i for i in range(columns) if scaled[i] >= self.total]
+        while small and large: #Vose's method, top up each small column from a large one
+            less, more = small.pop(), large.pop()
+            self.accept[less] = scaled[less]
+            self.alias[less] = self.outcomes[more]
+            scaled[more] = scaled[more] - (self.total - scaled[less])
+            if scaled[more] < self.total: small.append(more)
+            else: large.append(more)
+
+    def sample(self, rng: Any) -> Any:
+        """
+        return one outcome drawn using rng, public method
+        """
+        if self.bits is not None: draw = rng.getrandbits(self.bits)
+        else: draw = rng.randrange(self.size)
+        column, threshold = divmod(draw, self.total)
+        if threshold < self.accept[column]:
+            return self.outcomes[column]
+        return self.alias[column]
+
+# yarrow stalk line values have probabilities 6: 1/16, 7: 5/16, 8: 7/16, 9: 3/16
+YARROW_LINES = AliasTable((6, 7, 8, 9), (1, 5, 7, 3))
+_YARROW_CODES = AliasTable((0, 1, 2, 3), (1, 5, 7, 3)) #the same, as packed line codes
+
+def YarrowStalkCounts(rng: Any) -> list[int]:
+    """
+    cast one line by a faithful simulation of the yarrow stalk method, public function
+
+    of the 50 stalks one is set aside, then the remaining 49 are divided three
+    times. each division splits the bundle into two heaps, every stalk falling to
+    the left or right at random, takes one stalk from the right heap and counts
+    off both heaps by fours to leave a remainder of 1-4 stalks in each. the
+    stalks removed (5 or 9 the first time, 4 or 8 afterwards) count 3 when few
+    and 2 when many. returns the three counts, the line value is their sum.
+    """
+    stalks = 49
+    counts = []
+    for division in range(3):
+        left = 0
+        while not 0 < left < stalks - 1: #neither heap can be empty after taking a stalk from the right
+            left = bin(rng.getrandbits(stalks)).count('1')
+        right = stalks - left - 1
+        removed = 1 + (left % 4 or 4) + (right % 4 or 4)
+        stalks = stalks - removed
+        counts.append(3 if removed < 6 else 2)
+    return counts
+
+# the sixteen equally likely outcomes of the marble and dice methods, by yarrow probability
+SIXTEEN_LINES: tuple[int, ...] = (6,) + (7,) * 5 + (8,) * 7 + (9,) * 3
+
+class _ReplayRandom(random.Random):
+    """
+    random number generator replaying one path through a cast's random choices, private class
+
+    each getrandbits or _randbelow call (which randrange, randint, choice and
+    shuffle are built on) is a choice point among its equally likely results.
+    path holds the result to give at each choice point, extended with 0 for
+    new ones, and sizes is filled with the number of results at each.
+    """
+    def __init__(self, path: list[int]) -> None:
+        self.path: list[int] = path
+        self.sizes: list[int] = []
+        super().__init__(0)
+
+    def _Choose(self, size: int) -> int:
+        position = len(self.sizes)
+        self.sizes.append(size)
+        if position == len(self.path):
+            self.path.append(0)
+        return self.path[position]
+
+    def getrandbits(self, k: int) -> int:
+        return self._Choose(1 << k)
+
+    def _randbelow(self, n: int) -> int:
+        return self._Choose(n)
+
+    def random(self) -> float:
+        raise ValueError('continuous random numbers have no exact outcomes')
+
+def _EnumerateLineProbabilities(oracle: 'Oracle', limit: int = 1 << 20) -> dict[int, Fraction]:
+    """
+    work out the exact line value probabilities of an oracle from its cast_line, private function
+
+    casts one line for every possible path through its random choices, each
+    path weighted by the product of its choices' probabilities. raises
+    ValueError if cast_line has more than limit paths, or draws continuous
+    random numbers.
+    """
+    lineProbabilities = {6: Fraction(0), 7: Fraction(0), 8: Fraction(0), 9: Fraction(0)}
+    path: list[int] = []
+    for _ in range(limit):
+        rng = _ReplayRandom(path)
+        lineValue = oracle.line_value(oracle.cast_line(rng))
+        if lineValue not in lineProbabilities:
+            raise ValueError(f'oracle {oracle.name!r} cast line value {lineValue}')
+        lineProbabilities[lineValue] += reduce(lambda x,y: x*y, (Fraction(1, size) for size in rng.sizes),
+                                               Fraction(1))
+        del path[len(rng.sizes):]
+        while path and path[-1] == rng.sizes[len(path) - 1] - 1: #last result of that choice point
+            path.pop()
+        if not path:
+            return lineProbabilities
+        path[-1] += 1
+    raise ValueError(f'oracle {oracle.name!r} has too many random outcomes to enumerate')
+
+class Oracle:
+    """
+    a casting method in the oracle registry, public class
+
+    subclasses give the method a name and provide cast_line, which casts one
+    line step by step and returns its oracle values (coins, stalk counts, dice
+    and so on) as stored in Hexagrams.currentOracleValues. line_value turns
+    those into the line value, by default their sum. the batch methods below
+    cast many lines or readings at once. their defaults are built on cast_line,
+    so a new method only needs cast_line to work everywhere, and overrides them
+    when it can do better. lineWeights gives the integer weights of line values
+    6-9 when they are exact and small, which lets cast_arrays vectorize it.
+    """
+    name: str = ''  # registry key, the Hexagrams oracle type
+    lineWeights: Optional[tuple[int, int, int, int]] = None  # weights of line values 6, 7, 8 and 9
+
+    def cast_line(self, rng: Any) -> list[int]:
+        """
+        cast one line, return its oracle values, public method
+        """
+        raise NotImplementedError
+
+    def line_value(self, oracleValues: Sequence[int]) -> int:
+        """
+        return the line value (6-9) given by a line's oracle values, public method
+        """
+        return sum(oracleValues)
+
+    def cast_lines(self, rng: Any, count: int) -> array:
+        """
+        cast count lines at once, return an array('B') of line values, public method
+        """
+        castLine, lineValue = self.cast_line, self.line_value
+        return array('B', [lineValue(castLine(rng)) for _ in range(count)])
+
+    def cast_readings(self, rng: Any, count: int) -> array:
+        """
+        cast count readings at once, return an array('H') of packed line values, public method
+        """
+        lines = iter(self.cast_lines(rng, 6 * count))
+        return array('H', [a - 6 | (b - 6) << 2 | (c - 6) << 4 | (d - 6) << 6 | (e - 6) << 8 | (f - 6) << 10
+                           for a, b, c, d, e, f in zip(lines, lines, lines, lines, lines, lines)])
+
+    def cast_numpy(self, generator: Any, count: int) -> Any:
+        """
+        cast count readings with a numpy Generator, return a uint16 array of packed line values, public method
+
+        methods with lineWeights draw every line as one array operation, the rest
+        fall back to cast_readings using a random.Random seeded from generator
+        """
+        numpy = _Numpy()
+        if self.lineWeights is None:
+            rng = random.Random(int(generator.integers(1 << 63)))
+            return numpy.frombuffer(self.cast_readings(rng, count), dtype=numpy.uint16)
+        codes = numpy.repeat(numpy.arange(4, dtype=numpy.uint16), self.lineWeights)
+        draws = generator.integers(0, sum(self.lineWeights), size=(count, 6))
+        return (codes[draws] << numpy.arange(0, 12, 2, dtype=numpy.uint16)).sum(axis=1, dtype=numpy.uint16)
+
+    def line_probabilities(self) -> dict[int, Fraction]:
+        """
+        return the exact probability of each line value (6-9), public method
+
+        without lineWeights they are worked out from every possible outcome of
+        cast_line's random choices
+        """
+        if self.lineWeights is None:
+            return _EnumerateLineProbabilities(self)
+        total = sum(self.lineWeights)
+        return {value: Fraction(weight, total) for value, weight in zip((6, 7, 8, 9), self.lineWeights)}
+
+class CoinOracle(Oracle):
+    """
+    three coins, heads counting 3 and tails 2, public class
+    """
+    name = 'coin'
+    lineWeights = (1, 3, 3, 1)
+    #coin faces and line value of 3 coin bits, a set bit is heads (3) and a clear bit tails (2)
+    _faces = tuple(tuple(3 if bits >> coin & 1 else 2 for coin in range(3)) for bits in range(8))
+    _lines = tuple(sum(faces) for faces in _faces)
+
+    def cast_line(self, rng: Any) -> list[int]:
+        #all three coins from one 3 bit draw, rather than a random choice per coin
+        return list(self._faces[rng.getrandbits(3)])
+
+    def cast_lines(self, rng: Any, count: int) -> array:
+        return array('B', map(self._lines.__getitem__, map(rng.getrandbits, repeat(3, count))))
+
+    def cast_readings(self, rng: Any, count: int) -> array:
+        #18 random bits, one per coin, split into two lookups of three lines
+        low, high = _COIN_LOW, _COIN_HIGH
+        return array('H', [low[bits & 511] | high[bits >> 9] for bits in map(rng.getrandbits, repeat(18, count))])
+
+    def cast_numpy(self, generator: Any, count: int) -> Any:
+        tables = _NumpyTables()
+        bits = generator.integers(0, 1 << 18, size=count, dtype=_Numpy().uint32)
+        return tables['low'][bits & 511] | tables['high'][bits >> 9]
+
+class YarrowOracle(Oracle):
+    """
+    fast yarrow sampler, draws the line value itself from an alias table, public class
+    """
+    name = 'yarrow'
+    lineWeights = (1, 5, 7, 3)
+
+    def cast_line(self, rng: Any) -> list[int]:
+        return [YARROW_LINES.sample(rng)]
+
+    def cast_readings(self, rng: Any, count: int) -> array:
+        sample = _YARROW_CODES.sample
+        return array('H', [sample(rng) | sample(rng) << 2 | sample(rng) << 4 |
+                           sample(rng) << 6 | sample(rng) << 8 | sample(rng) << 10
+                           for _ in range(count)])
+
+class YarrowStalksOracle(Oracle):
+    """
+    faithful yarrow stalk simulation, the oracle values are the three stalk counts, public class
+    """
+    name = 'yarrow-stalks'
+
+    def cast_line(self, rng: Any) -> list[int]:
+        return YarrowStalkCounts(rng)
+
+    def line_probabilities(self) -> dict[int, Fraction]:
+        return _YarrowStalkProbabilities()
+
+class SixteenMarbleOracle(Oracle):
+    """
+    one marble drawn from a bag of sixteen, coloured 1:5:7:3 for line values 6-9, public class
+
+    gives the yarrow probabilities, the oracle value is the drawn marble's line value
+    """
+    name = 'sixteen-marble'
+    lineWeights = (1, 5, 7, 3)
+    #packed line codes of two lines, indexed by two 4 bit marble draws
+    _pairs = tuple(_LINE_CODES[SIXTEEN_LINES[draws & 15]] | _LINE_CODES[SIXTEEN_LINES[draws >> 4]] << 2
+                   for draws in range(256))
+
+    def cast_line(self, rng: Any) -> list[int]:
+        return [SIXTEEN_LINES[rng.getrandbits(4)]]
+
+    def cast_lines(self, rng: Any, count: int) -> array:
+        return array('B', map(SIXTEEN_LINES.__getitem__, map(rng.getrandbits, repeat(4, count))))
+
+    def cast_readings(self, rng: Any, count: int) -> array:
+        #24 random bits, one marble per 4 bits, split into three lookups of two lines
+        pairs = self._pairs
+        return array('H', [pairs[bits & 255] | pairs[bits >> 8 & 255] << 4 | pairs[bits >> 16] << 8
+                           for bits in map(rng.getrandbits, repeat(24, count))])
+
+class TwoDiceOracle(SixteenMarbleOracle):
+    """
+    two four sided dice, the sixteen face pairs stand for the sixteen marbles, public class
+
+    the oracle values are the two faces (1-4), so unlike the other methods the
+    line value is looked up rather than summed
+    """
+    name = 'two-dice'
+
+    def cast_line(self, rng: Any) -> list[int]:
+        return [rng.randint(1, 4), rng.randint(1, 4)]
+
+    def line_value(self, oracleValues: Sequence[int]) -> int:
+        first, second = oracleValues
+        return SIXTEEN_LINES[(first - 1) * 4 + second - 1]
+
+ORACLES: dict[str, Oracle] = {}  # registered casting methods by name
+
+def register_oracle(oracle: Oracle) -> Oracle:
+    """
+    add a casting method to the oracle registry, public function
+
+    names can't be registered twice, as probabilities are cached by name
+    """
+    if not oracle.name or oracle.name in ORACLES:
+        raise ValueError(f'oracle name is empty or already registered: {oracle.name!r}')
+    ORACLES[oracle.name] = oracle
+    return oracle
+
+def get_oracle(name: str) -> Oracle:
+    """
+    return the registered casting method called name, public function
+    """
+    try:
+        return ORACLES[name]
+    except KeyError:
+        raise ValueError(f'unknown oracle type: {name!r}') from None
+
+register_oracle(CoinOracle())
+register_oracle(YarrowOracle())
+register_oracle(YarrowStalksOracle())
+register_oracle(SixteenMarbleOracle())
+register_oracle(TwoDiceOracle())
 
 #
 # classes
@@ -57,6 +581,17 @@ class Hexagram:
         self.lineValues: list[int] = [0,0,0,0,0,0]
         self.infoSource: Optional[str] = None
 
+    def Reset(self) -> None:
+        """
+        clear self back to its initial state, reusing the line values list
+        """
+        self.number = ''
+        self.name = ''
+        self.lineValues[:] = _NO_LINES
+        self.infoSource = None
+
+_NO_LINES = (0,0,0,0,0,0)  # line values of an uncast Hexagram
+
 #public classes
 class PychingAppDetails:
     """
@@ -72,6 +607,7 @@ class PychingAppDetails:
         self.savePath: Path = self.configPath
         self.configFile: Path = self.configPath / 'pychingrc'
         self.saveFileExt: str = '.psv'
+        self.saveIndexFile: Path = self.savePath / 'psvindex' #SaveIndex cache of the save files
         self.internalImageExt: str = '.#@~'
         self.internalHtmlExt: str = '.~@#'
         self.saveFileID: tuple[str, str] = ('pyching_save_file', self.version)
@@ -116,20 +652,160 @@ class PychingAppDetails:
         return userDir
 
 # create an instance of the app details for use throughout this module
+# it is only ever read after this, so all threads can share it
 #
 pyching = PychingAppDetails()
 #
 #
 
+class UrandomPool(random.Random):
+    """
+    random number generator reading os.urandom in large blocks, public class
+
+    random bits are sliced from a pooled block of operating system entropy, so
+    casting a whole reading costs a small fraction of one os.urandom call. like
+    random.SystemRandom it can't be seeded and has no state to save or restore.
+    instances aren't thread safe, use one per thread.
+    """
+    def __init__(self, blockSize: int = 4096) -> None:
+        self.blockSize: int = blockSize  # bytes of entropy fetched per os.urandom call
+        self._block: bytes = b''  # the current block of pooled entropy
+        self._offset: int = 0  # bytes of self._block already used
+        self._word: int = 0  # unused random bits left over from the last 8 bytes read
+        self._wordBits: int = 0  # number of bits held in self._word
+        super().__init__()
+
+    def _Read(self, nbytes: int) -> bytes:
+        """
+        return nbytes of pooled entropy, fetching a new block when needed, private method
+        """
+        if self._offset + nbytes > len(self._block):
+            self._block = self._block[self._offset:] + os.urandom(max(self.blockSize, nbytes))
+            self._offset = 0
+        data = self._block[self._offset:self._offset + nbytes]
+        self._offset = self._offset + nbytes
+        return data
+
+    def getrandbits(self, k: int) -> int:
+        """
+        return a non-negative int with k random bits, public method
+        """
+        if k <= self._wordBits: #enough bits left over
+            bits = self._word & ((1 << k) - 1)
+            self._word = self._word >> k
+            self._wordBits = self._wordBits - k
+            return bits
+        if k < 0:
+            raise ValueError('number of bits must be non-negative')
+        if k > 64: #large requests go straight to the pool
+            nbytes = (k + 7) // 8
+            return int.from_bytes(self._Read(nbytes), 'little') >> (nbytes * 8 - k)
+        need = k - self._wordBits #bits still needed after using up the leftovers
+        word = int.from_bytes(self._Read(8), 'little')
+        bits = self._word | ((word & ((1 << need) - 1)) << self._wordBits)
+        self._word = word >> need
+        self._wordBits = 64 - need
+        return bits
+
+    def random(self) -> float:
+        """
+        return a random float in the interval [0.0, 1.0), public method
+        """
+        return self.getrandbits(53) * 2.0 ** -53
+
+    def randbytes(self, n: int) -> bytes:
+        """
+        return n random bytes, public method
+        """
+        return self._Read(n)
+
+    def seed(self, *args: Any, **kwds: Any) -> None:
+        """
+        stub method, pooled os entropy can't be seeded
+        """
+        return None
+
+    def getstate(self, *args: Any, **kwds: Any) -> Any:
+        raise NotImplementedError('UrandomPool has no state to save')
+
+    setstate = getstate
+
+# the selectable entropy sources for casting, each value creates a new generator
+ENTROPY_SOURCES: dict[str, Callable[[], random.Random]] = {
+    'mersenne': random.Random,  # Mersenne Twister, seeded from the os
+    'system': random.SystemRandom,  # one os.urandom call per random number
+    'urandom': UrandomPool,  # os.urandom read in blocks and sliced into bits
+}
+
+_threadRngs = threading.local()  # each thread's own casting generator, see thread_rng
+
+def thread_rng() -> random.Random:
+    """
+    return the calling thread's own random number generator, public function
+
+    every thread gets a separately seeded random.Random on first use, so threads
+    casting at the same time never share generator state or wait on each other.
+    a forked child process starts with fresh generators, not copies of its parent's.
+    """
+    try:
+        return _threadRngs.rng
+    except AttributeError:
+        _threadRngs.rng = random.Random()
+        return _threadRngs.rng
+
+def _ResetThreadRngs() -> None:
+    """
+    drop every thread's generators after a fork, private function
+    """
+    global _threadRngs
+    _threadRngs = threading.local()
+
+if hasattr(os, 'register_at_fork'): #not on windows, which can't fork
+    os.register_at_fork(after_in_child=_ResetThreadRngs)
+
+def GetEntropySource(source: str | random.Random | None) -> Any:
+    """
+    return a random number generator for casting, public function
+
+    source can be the name of one of the ENTROPY_SOURCES, an existing
+    random.Random (or compatible) instance, which is returned as is, or None for
+    the calling thread's own generator (see thread_rng). each thread keeps one
+    generator per named source, so a UrandomPool's block serves many readings.
+    raises ValueError for unknown names.
+    """
+    if source is None:
+        return thread_rng()
+    if isinstance(source, str):
+        try:
+            sources = _threadRngs.sources
+        except AttributeError:
+            sources = _threadRngs.sources = {}
+        try:
+            return sources[source]
+        except KeyError:
+            pass
+        try:
+            rng = sources[source] = ENTROPY_SOURCES[source]()
+        except KeyError:
+            raise ValueError(f'unknown entropy source: {source!r}, '
+                             f'use one of {", ".join(ENTROPY_SOURCES)}') from None
+        return rng
+    return source
+
 class Hexagrams:
     """
     holds both Hexagrams for a reading, public class
     """
-    def __init__(self, oracleType: str = 'coin') -> None:
+    def __init__(self, oracleType: str = 'coin', entropy: str | random.Random | None = None) -> None:
         """
-        initialise self by setting oracle type
-        defaults to coin, if specified must be a valid oracle type (coin or yarrow)
+        initialise self by setting oracle type and entropy source
+        oracle type defaults to coin, if specified must be the name of a registered
+        oracle (see ORACLES), others raise ValueError here rather than at the first cast
+        entropy defaults to the creating thread's own generator, if specified must be
+        the name of one of the ENTROPY_SOURCES or a random.Random instance (see
+        GetEntropySource). a Hexagrams instance should only be cast from one thread
         """
+        get_oracle(oracleType) #raises ValueError for unknown oracle types
         #public data attributes - should read but not written to from outside this module
         #any attributes that need to be modified from outside this module have a 'set_xxx'
         #method available below
@@ -139,118 +815,53 @@ class Hexagrams:
         self.hex2: Hexagram = Hexagram()  # Hexagram 2 data structure
         self.currentLine: int = 0  # current line being cast in Hex1
         self.currentOracleValues: list[int] = []  # list of oracle values for current line
-
-    def __GetHexDetails(self, hexKey: list[int]) -> tuple[str, str]:
-        """
-        lookup hex name and number, private method
-
-        hexKey value should be a list of the non-moving line numbers for the
-        Hexagram being enquired upon (Hex?.Key)
-        returns a tuple of Hexagram details in the form (number, name)
-        """
-        if hexKey == [7,7,7,7,7,7]: return ('1', "Tch'ien")
-        elif hexKey == [8,8,8,8,8,8]: return ('2', "Koun")
-        elif hexKey == [7,8,8,8,7,8]: return ('3', "T'oun")
-        elif hexKey == [8,7,8,8,8,7]: return ('4', "Mong")
-        elif hexKey == [7,7,7,8,7,8]: return ('5', "Hsu")
-        elif hexKey == [8,7,8,7,7,7]: return ('6', "Song")
-        elif hexKey == [8,7,8,8,8,8]: return ('7', "Cheu")
-        elif hexKey == [8,8,8,8,7,8]: return ('8', "Pi")
-        elif hexKey == [7,7,7,8,7,7]: return ('9', "Siao Tch'ou")
-        elif hexKey == [7,7,8,7,7,7]: return ('10', "Li")
-        elif hexKey == [7,7,7,8,8,8]: return ('11', "T'ai")
-        elif hexKey == [8,8,8,7,7,7]: return ('12', "P'i")
-        elif hexKey == [7,8,7,7,7,7]: return ('13', "Tong Jen")
-        elif hexKey == [7,7,7,7,8,7]: return ('14', "Ta You")
-        elif hexKey == [8,8,7,8,8,8]: return ('15', "Tchien")
-        elif hexKey == [8,8,8,7,8,8]: return ('16', "Yu")
-        elif hexKey == [7,8,8,7,7,8]: return ('17', "Souei")
-        elif hexKey == [8,7,7,8,8,7]: return ('18', "Kou")
-        elif hexKey == [7,7,8,8,8,8]: return ('19', "Lin")
-        elif hexKey == [8,8,8,8,7,7]: return ('20', "Kouan")
-        elif hexKey == [7,8,8,7,8,7]: return ('21', "Che Ho")
-        elif hexKey == [7,8,7,8,8,7]: return ('22', "Pi")
-        elif hexKey == [8,8,8,8,8,7]: return ('23', "Po")
-        elif hexKey == [7,8,8,8,8,8]: return ('24', "Fou")
-        elif hexKey == [7,8,8,7,7,7]: return ('25', "Wou Wang")
-        elif hexKey == [7,7,7,8,8,7]: return ('26', "Ta Tch'ou")
-        elif hexKey == [7,8,8,8,8,7]: return ('27', "I")
-        elif hexKey == [8,7,7,7,7,8]: return ('28', "Ta Kouo")
-        elif hexKey == [8,7,8,8,7,8]: return ('29', "K'an")
-        elif hexKey == [7,8,7,7,8,7]: return ('30', "Li")
-        elif hexKey == [8,8,7,7,7,8]: return ('31', "Hsien")
-        elif hexKey == [8,7,7,7,8,8]: return ('32', "Hong")
-        elif hexKey == [8,8,7,7,7,7]: return ('33', "Toun")
-        elif hexKey == [7,7,7,7,8,8]: return ('34', "Ta Tch'ouang")
-        elif hexKey == [8,8,8,7,8,7]: return ('35', "Tchin")
-        elif hexKey == [7,8,7,8,8,8]: return ('36', "Ming Yi")
-        elif hexKey == [7,8,7,8,7,7]: return ('37', "Tchia Jen")
-        elif hexKey == [7,7,8,7,8,7]: return ('38', "K'ouei")
-        elif hexKey == [8,8,7,8,7,8]: return ('39', "Tch'ien")
-        elif hexKey == [8,7,8,7,8,8]: return ('40', "Tchieh")
-        elif hexKey == [7,7,8,8,8,7]: return ('41', "Soun")
-        elif hexKey == [7,8,8,8,7,7]: return ('42', "Yi")
-        elif hexKey == [7,7,7,7,7,8]: return ('43', "Kouai")
-        elif hexKey == [8,7,7,7,7,7]: return ('44', "Keou")
-        elif hexKey == [8,8,8,7,7,8]: return ('45', "Ts'ouei")
-        elif hexKey == [8,7,7,8,8,8]: return ('46', "Cheng")
-        elif hexKey == [8,7,8,7,7,8]: return ('47', "K'oun")
-        elif hexKey == [8,7,7,8,7,8]: return ('48', "Tsing")
-        elif hexKey == [7,8,7,7,7,8]: return ('49', "Keu")
-        elif hexKey == [8,7,7,7,8,7]: return ('50', "Ting")
-        elif hexKey == [7,8,8,7,8,8]: return ('51', "Tchen")
-        elif hexKey == [8,8,7,8,8,7]: return ('52', "Ken")
-        elif hexKey == [8,8,7,8,7,7]: return ('53', "Tchien")
-        elif hexKey == [7,7,8,7,8,8]: return ('54', "Kouei Mei")
-        elif hexKey == [7,8,7,7,8,8]: return ('55', "Fong")
-        elif hexKey == [8,8,7,7,8,7]: return ('56', "Lu")
-        elif hexKey == [8,7,7,8,7,7]: return ('57', "Hsuan")
-        elif hexKey == [7,7,8,7,7,8]: return ('58', "Touei")
-        elif hexKey == [8,7,8,8,7,7]: return ('59', "Houan")
-        elif hexKey == [7,7,8,8,7,8]: return ('60', "Tchieh")
-        elif hexKey == [7,7,8,8,7,7]: return ('61', "Tchong Fou")
-        elif hexKey == [8,8,7,7,8,8]: return ('62', "Siao Kouo")
-        elif hexKey == [7,8,7,8,7,8]: return ('63', "Tchi Tchi")
-        elif hexKey == [8,7,8,7,8,7]: return ('64', "Wei Tchi")
-        else: #raise an exception
-            return (0, "lookup error")
-            # pass
+        self.timestamp: float = 0.0  # time the sixth line was cast (seconds since the epoch), 0.0 if unknown
+        self.rng: Any = GetEntropySource(entropy)  # random number generator used for casting
 
     def NewLine(self) -> None:
         """
         builds next line in Hex1 and completes both Hexagrams after line 6, public method
         """
         if self.currentLine < 6: #build a new Hex1 line
-            rc = random.choice #returns a random value from the specified sequence 
-            #handle each oracle type
-            if self.oracle == 'coin':
-                self.currentOracleValues = [rc([2,3]), rc([2,3]), rc([2,3])]
-                #for item in self.currentOracleValues: #line value = sum of oracle values 
-                # self.hex1.lineValues[self.currentLine] = self.hex1.lineValues[self.currentLine] + item
-            self.hex1.lineValues[self.currentLine] = reduce(lambda x,y: x+y, self.currentOracleValues) #line value = sum of oracle values
-            #elif self.oracle == 'yarrow':
-            # self.oracleValues = [0, 0, 0] #dummy results
-            # self.hex1.lineValues[CurrentLine] = 0 #dummy result
+            oracle = get_oracle(self.oracle) #the registered casting method for this oracle type
+            self.currentOracleValues = oracle.cast_line(self.rng)
+            self.hex1.lineValues[self.currentLine] = oracle.line_value(self.currentOracleValues)
             self.currentLine = self.currentLine + 1 #next line is current
+            if self.currentLine == 6: self.timestamp = time.time()
         if self.currentLine == 6: #Hex1 is all built
-            hex1Key = [0,0,0,0,0,0] #Hex1's details lookup key
-            i = 0 #used as a counter in the loop below
-            for item in self.hex1.lineValues: #populate Hex1's details lookup key
-                if item == 6: hex1Key[i] = 8 #revert to unmoving line number
-                elif item == 9: hex1Key[i] = 7 #revert to unmoving line number
-                else: hex1Key[i] = item #no change
-                i = i + 1 #increment counter    
-            [self.hex1.number, self.hex1.name] = self.__GetHexDetails(hex1Key) #lookup Hex1 details
-            self.hex1.infoSource = 'pyching_int_data.in'+self.hex1.number+'data()'
-            if self.hex1.lineValues != hex1Key: #if there are some moving lines in Hex1
-                i = 0 #used as a counter in the loop below
-                for item in self.hex1.lineValues: #populate Hex2.lineValues
-                    if item == 6: self.hex2.lineValues[i] = 7 #move to new line number
-                    elif item == 9: self.hex2.lineValues[i] = 8 #move to new line number
-                    else: self.hex2.lineValues[i] = item #no change
-                    i = i + 1 #increment counter      
-                [self.hex2.number, self.hex2.name] = self.__GetHexDetails(self.hex2.lineValues) #lookup Hex2 details
-                self.hex2.infoSource = 'pyching_int_data.in'+self.hex2.number+'data()'
+            completion = COMPLETIONS[pack_lines(self.hex1.lineValues)] #lookup both Hexagrams' details
+            self.hex1.number = completion.hex1Number
+            self.hex1.name = completion.hex1Name
+            self.hex1.infoSource = completion.hex1InfoSource
+            if completion.movingMask: #if there are some moving lines in Hex1
+                self.hex2.lineValues[:] = completion.hex2LineValues #in place, so reset instances allocate nothing
+                self.hex2.number = completion.hex2Number
+                self.hex2.name = completion.hex2Name
+                self.hex2.infoSource = completion.hex2InfoSource
+
+    def reset(self, question: str = '') -> None:
+        """
+        reinitialise self in place for a new reading, public method
+
+        both Hexagrams and their line values lists are reused, so a reset
+        instance allocates little more than a new one had. the oracle type
+        and entropy source are kept.
+        """
+        self.question = question
+        self.hex1.Reset()
+        self.hex2.Reset()
+        self.currentLine = 0
+        self.currentOracleValues = [] #not cleared in place, oracles may return tuples
+        self.timestamp = 0.0
+
+    def recast(self, question: str = '') -> 'Hexagrams':
+        """
+        reset self and cast a complete new reading, returns self, public method
+        """
+        self.reset(question)
+        for line in range(6):
+            self.NewLine()
+        return self
 
     def SetQuestion(self, questionText: str) -> None:
         """
@@ -258,39 +869,72 @@ class Hexagrams:
         """
         self.question = questionText
     
-    def __HexStorage(self, file: Path | str, action: str) -> Optional[tuple[str, str]]:
+    def __HexStorage(self, file: Path | str, action: str,
+                     fileFormat: str = 'binary') -> Optional[tuple[str, str]]:
         """
-        store or load a Hexagrams instance to/from disk file using the utility routine
-        Storage(), private method
+        store or load a Hexagrams instance to/from disk file, private method
 
         this private method should be called from the public load and save
-        routines below. action should be 'save' or 'load' .
+        routines below. action should be 'save' or 'load' . saves are written
+        in fileFormat, 'binary' (see encode_save) or the legacy 'pickle' format
+        written by Storage(). loads detect the format from the file itself.
         """
-        try:
-            # Failsafe if user deleted ~/.pyching while program running
-            if not pyching.savePath.exists():
+        if action == 'save':
+            try:
+                # Failsafe if user deleted ~/.pyching while program running,
+                # exist_ok makes this safe when several threads save at once
                 pyching.savePath.mkdir(parents=True, exist_ok=True)
-        except (RuntimeError, OSError):
-            pass  # If we can't determine home, Storage() will handle the error
+            except (RuntimeError, OSError):
+                pass  # If we can't determine home, Storage() will handle the error
         try:
             if action == 'save':
-                hexData = (pyching.saveFileID, self.question, self.oracle, self.hex1, 
-                                self.hex2, self.currentLine, self.currentOracleValues)
-                Storage(file, data=hexData)
+                if fileFormat == 'binary':
+                    data = encode_save(self) #before opening, so a failure leaves no empty file
+                    with open(file, 'wb') as saveFile:
+                        saveFile.write(data)
+                elif fileFormat == 'pickle':
+                    hexData = (pyching.saveFileID, self.question, self.oracle, self.hex1, 
+                                    self.hex2, self.currentLine, self.currentOracleValues)
+                    Storage(file, data=hexData)
+                else:
+                    raise ValueError(f'unknown save file format: {fileFormat!r}')
             elif action == 'load': 
-                hexData = Storage(file)
+                with open(file, 'rb') as saveFile:
+                    data = saveFile.read()
+                if not data.startswith(SAVE_MAGIC): #a legacy pickled save file, see Storage
+                    try:
+                        hexData = pickle.loads(data)
+                    except Exception as e:
+                        raise Exception('pychingUnpickleError') from e
         except IOError: #pass the error back up the line
             raise #re-raise the exception
         else: #no exception, so proceed
             if action == 'load':
+                if data.startswith(SAVE_MAGIC):
+                    saveData = decode_save(data)
+                    self.reset(saveData.question)
+                    self.oracle = saveData.oracle
+                    for line in range(saveData.currentLine):
+                        self.hex1.lineValues[line] = 6 + (saveData.lines >> (2 * line) & 3)
+                    self.currentLine = saveData.currentLine
+                    self.currentOracleValues = list(saveData.oracleValues)
+                    if self.currentLine == 6: self.NewLine() #completes both Hexagrams
+                    self.timestamp = saveData.timestamp
+                    #the second item is the binary format version, not the program version
+                    return (pyching.saveFileID[0], str(saveData.version))
                 saveFileID, self.question, self.oracle, self.hex1, self.hex2, \
                                 self.currentLine, self.currentOracleValues = hexData
+                self.timestamp = os.path.getmtime(file) #legacy files don't record the time
                 return saveFileID #to enable savefile verification and version checking
 
-    def Save(self, file: Path | str) -> None:
+    def Save(self, file: Path | str, fileFormat: str = 'binary') -> None:
         """
         save instance data to disk file, public method
 
+        fileFormat is 'binary' (the default) or 'pickle' for the legacy format
+        read by older versions. raises ValueError, before writing anything, for
+        a reading that can't be stored in fileFormat
+
         this function should be called in a
         try:
         except IOError:
@@ -298,7 +942,7 @@ class Hexagrams:
         """
         #fileName = time.strftime('%Y_%m_%d_%H_%M_%S.sav', time.localtime(time.time()))
         try:
-            self.__HexStorage(file, 'save')
+            self.__HexStorage(file, 'save', fileFormat)
         except IOError:  # pass the error back up the line
             raise  # re-raise the exception
 
@@ -306,6 +950,10 @@ class Hexagrams:
         """
         load instance data from disk file, public method, returns savefile version
 
+        binary and legacy pickle save files are both read. the savefile version is
+        a (save file id, version) tuple, for binary files version is the format
+        version
+
         this function should be called in a
         try:
         except IOError:
@@ -323,35 +971,384 @@ class Hexagrams:
         create a multi-line text representation of the reading as a formatted string, public method,
         returns the string
         """
-        #textReading = [] 
-        
-        lineStrings = {6:'---X---',7:'-------',8:'--- ---',9:'---O---',0:''}#the 0 takes care of an empty Hex2 
-        linePositions = {1:'bottom',2:'second',3:'third',4:'fourth',5:'fifth',6:'topmost'}
-        lineTypes = {6:'(6 moving yin)',7:'(7 yang)',8:'(8 yin)',9:'(9 moving yang)',0:''}#the 0 takes care of an empty Hex2 
-        
-        textReadingParts = []
-
-        textReadingParts.append( '\n              '+self.hex1.number.ljust(2)+\
-                        ' '+self.hex1.name.ljust(30)+\
-                        ' '+self.hex2.number.ljust(2)+' '+self.hex2.name+'\n\n' )
-        
-        for i in range(5,-1,-1):
-            if i == 3: 
-                if (6 in self.hex1.lineValues) or (9 in self.hex1.lineValues): #if there are moving lines
-                    separator = '  becomes  '
-                else:
-                    separator = '  no moving lines'
+        if self.currentLine == 6: #complete readings are rendered once per key
+            try:
+                key = self.key()
+            except ValueError:
+                pass
+            else:
+                if key.question == self.question: #the key's question renders the same
+                    return reading_text(key)
+        return ReadingDiagram(self.hex1, self.hex2) + '\n '+self.question+'\n\n'
+
+    def key(self) -> 'ReadingKey':
+        """
+        return the canonical, hashable key of a complete reading, public method
+
+        raises ValueError if not all six lines have been cast
+        """
+        return ReadingKey(pack_lines(self.hex1.lineValues), self.oracle, normalize_question(self.question))
+
+class HexagramsPool:
+    """
+    small pool of reusable Hexagrams instances for request handlers, public class
+
+    acquire a reset instance, cast with it and release it when done, or use the
+    reading() context manager to do both. at most size idle instances are kept.
+    acquire and release can be called from any thread, and every acquired
+    instance casts from a generator of the acquiring thread's own: its default
+    generator, its generator for a named entropy source, or one made from an
+    entropy instance. os entropy stays os entropy: a random.SystemRandom is
+    shared as it has no state, a UrandomPool gets one pool per thread. other
+    random.Random instances seed one generator per thread and are never shared.
+    """
+    def __init__(self, oracleType: str = 'coin', entropy: str | random.Random | None = None,
+                 size: int = 16) -> None:
+        get_oracle(oracleType) #raises ValueError for unknown oracle types
+        self.oracle: str = oracleType  # oracle type of every pooled instance
+        self.entropy: str | random.Random | None = entropy  # entropy source of acquired instances
+        self.size: int = size  # most idle instances kept
+        self._idle: list[Hexagrams] = []  # released instances, list pop and append are atomic
+        self._threadRngs = threading.local()  # generators seeded from an entropy instance, one per thread
+        self._seedLock = threading.Lock()  # guards seeding them from the shared instance
+
+    def _ThreadRng(self) -> Any:
+        """
+        return the acquiring thread's generator for the pool's entropy source, private method
+        """
+        if self.entropy is None or isinstance(self.entropy, str):
+            return GetEntropySource(self.entropy)
+        if isinstance(self.entropy, random.SystemRandom): #stateless, so safe to share
+            return self.entropy
+        try:
+            return self._threadRngs.rng
+        except AttributeError:
+            pass
+        if isinstance(self.entropy, UrandomPool): #os entropy too, only its pooled block is state
+            rng = type(self.entropy)(self.entropy.blockSize)
+        else: #a seedable generator, seeded from the shared one
+            with self._seedLock:
+                seed = self.entropy.getrandbits(128)
+            rng = random.Random(seed)
+        self._threadRngs.rng = rng
+        return rng
+
+    def acquire(self, question: str = '') -> Hexagrams:
+        """
+        return a reset Hexagrams instance, reused if one is idle, public method
+        """
+        try:
+            hexes = self._idle.pop()
+        except IndexError:
+            hexes = Hexagrams(self.oracle, self._ThreadRng())
+            hexes.question = question
+            return hexes
+        hexes.reset(question)
+        hexes.rng = self._ThreadRng() #the releasing thread's generator isn't ours to use
+        return hexes
+
+    def release(self, hexes: Hexagrams) -> None:
+        """
+        hand an acquired instance back for reuse, public method
+
+        the instance must not be used after it is released
+        """
+        if len(self._idle) < self.size:
+            self._idle.append(hexes)
+
+    @contextmanager
+    def reading(self, question: str = '') -> Iterator[Hexagrams]:
+        """
+        context manager that acquires an instance and releases it on exit, public method
+        """
+        hexes = self.acquire(question)
+        try:
+            yield hexes
+        finally:
+            self.release(hexes)
+
+def normalize_question(question: str) -> str:
+    """
+    return the canonical form of a question used in reading keys, public function
+
+    unicode is NFC normalized and runs of whitespace become single spaces, with
+    none at either end. case is kept, as it shows in the rendered reading.
+    """
+    return ' '.join(unicodedata.normalize('NFC', question).split())
+
+class ReadingKey(NamedTuple):
+    """
+    canonical, hashable key of a complete reading, public class
+
+    two readings with the same key render identically, so rendered output can
+    be memoized on it. get one with Hexagrams.key() or Reading.key().
+    """
+    lines: int  # packed line values
+    oracle: str  # oracle type
+    question: str  # question, see normalize_question
+
+@lru_cache(maxsize=4096)
+def reading_text(key: ReadingKey) -> str:
+    """
+    return the text of a complete reading as given by Hexagrams.ReadingAsText, memoized, public function
+    """
+    return shape_of(key.lines).diagram + '\n '+key.question+'\n\n'
+
+@dataclass(frozen=True, slots=True)
+class Reading:
+    """
+    compact, immutable value form of a complete reading, public class
+
+    holds only the packed line values (see pack_lines), the question and the
+    oracle type, everything else is looked up in the completion table. use
+    Hexagrams for casting a reading step by step.
+    """
+    lines: int  # packed line values
+    question: str = ''
+    oracle: str = 'coin'
+
+    @classmethod
+    def from_hexagrams(cls, hexes: 'Hexagrams') -> 'Reading':
+        """
+        return the Reading of a complete Hexagrams instance, public method
+
+        raises ValueError if not all six lines have been cast
+        """
+        return cls(pack_lines(hexes.hex1.lineValues), hexes.question, hexes.oracle)
+
+    def key(self) -> ReadingKey:
+        """
+        return the canonical, hashable key of this reading, public method
+        """
+        return ReadingKey(self.lines, self.oracle, normalize_question(self.question))
+
+    def to_hexagrams(self) -> 'Hexagrams':
+        """
+        return a new, complete Hexagrams instance for this reading, public method
+        """
+        hexes = Hexagrams(self.oracle)
+        hexes.question = self.question
+        hexes.hex1.lineValues = list(unpack_lines(self.lines))
+        hexes.currentLine = 6
+        hexes.NewLine() #complete both Hexagrams
+        return hexes
+
+    @property
+    def lineValues(self) -> tuple[int, ...]:
+        """
+        the six line values from the bottom line up
+        """
+        return unpack_lines(self.lines)
+
+    @property
+    def shape(self) -> 'ReadingShape':
+        """
+        the interned ReadingShape shared by all readings with these line values
+        """
+        return shape_of(self.lines)
+
+    @property
+    def completion(self) -> Completion:
+        """
+        both Hexagrams' details, from the completion table
+        """
+        return COMPLETIONS[self.lines]
+
+    @property
+    def hex1(self) -> int:
+        """
+        King Wen number of the first Hexagram
+        """
+        return HEX1_BY_PACKED[self.lines]
+
+    @property
+    def hex2(self) -> int:
+        """
+        King Wen number of the second Hexagram, 0 when there are no moving lines
+        """
+        return HEX2_BY_PACKED[self.lines]
+
+    @property
+    def movingMask(self) -> int:
+        """
+        moving line mask, bit i is set when line i is moving
+        """
+        return MOVING_BY_PACKED[self.lines]
+
+@dataclass(frozen=True, slots=True)
+class ReadingShape:
+    """
+    the shared, immutable part of every reading with the same line values, public class
+
+    there are only 4096 reading shapes, get them with shape_of() so that all
+    readings with the same line values share one instance, its strings and its
+    rendered diagram. a reading itself then only needs its question, timestamp
+    and oracle.
+    """
+    lines: int  # packed line values
+    completion: Completion  # both Hexagrams' numbers, names and infoSources
+    lineValues: tuple[int, ...]  # hex1 line values from the bottom line up
+    movingLines: tuple[int, ...]  # positions (1-6) of the moving lines
+    diagram: str  # the reading as text, as used by Hexagrams.ReadingAsText, without the question
+
+    @classmethod
+    def build(cls, lines: int) -> 'ReadingShape':
+        """
+        return a new shape for packed line values, public method
+
+        use shape_of() instead, to get the interned instance
+        """
+        completion = COMPLETIONS[lines]
+        hex1, hex2 = Hexagram(), Hexagram()
+        hex1.number, hex1.name = completion.hex1Number, completion.hex1Name
+        hex1.lineValues = list(unpack_lines(lines))
+        hex2.number, hex2.name = completion.hex2Number, completion.hex2Name
+        hex2.lineValues = list(completion.hex2LineValues)
+        return cls(lines, completion, tuple(hex1.lineValues),
+                   tuple(bit + 1 for bit in range(6) if completion.movingMask >> bit & 1),
+                   ReadingDiagram(hex1, hex2))
+
+# the per process interning pool of reading shapes, indexed by packed line values
+_SHAPES: list[Optional[ReadingShape]] = [None] * 4096
+
+def shape_of(lines: int) -> ReadingShape:
+    """
+    return the shared ReadingShape for packed line values, public function
+
+    shapes are built the first time they are asked for and kept for the life
+    of the process. threads racing to build the same shape build equal ones,
+    and one of them is kept.
+    """
+    shape = _SHAPES[lines]
+    if shape is None:
+        shape = _SHAPES[lines] = ReadingShape.build(lines)
+    return shape
+
+def ReadingDiagram(hex1: Hexagram, hex2: Hexagram) -> str:
+    """
+    create the multi-line text diagram of both Hexagrams of a reading, public function,
+    returns the string
+
+    this is Hexagrams.ReadingAsText without the question, it also works for
+    partly cast readings
+    """
+    lineStrings = {6:'---X---',7:'-------',8:'--- ---',9:'---O---',0:''}#the 0 takes care of an empty Hex2 
+    linePositions = {1:'bottom',2:'second',3:'third',4:'fourth',5:'fifth',6:'topmost'}
+    lineTypes = {6:'(6 moving yin)',7:'(7 yang)',8:'(8 yin)',9:'(9 moving yang)',0:''}#the 0 takes care of an empty Hex2 
+    
+    textReadingParts = []
+
+    textReadingParts.append( '\n              '+hex1.number.ljust(2)+\
+                    ' '+hex1.name.ljust(30)+\
+                    ' '+hex2.number.ljust(2)+' '+hex2.name+'\n\n' )
+    
+    for i in range(5,-1,-1):
+        if i == 3: 
+            if (6 in hex1.lineValues) or (9 in hex1.lineValues): #if there are moving lines
+                separator = '  becomes  '
             else:
-                    separator = '           '
-            textReadingParts.append( ' '+linePositions[i +1].rjust(9)+'   '+lineStrings[self.hex1.lineValues[i]]+\
-                            ' '+lineTypes[self.hex1.lineValues[i]].ljust(15)+separator+\
-                            lineStrings[self.hex2.lineValues[i]]+' '+lineTypes[self.hex2.lineValues[i]]+'\n'  )
-        
-        textReadingParts.append('\n '+self.question+'\n\n')
+                separator = '  no moving lines'
+        else:
+                separator = '           '
+        textReadingParts.append( ' '+linePositions[i +1].rjust(9)+'   '+lineStrings[hex1.lineValues[i]]+\
+                        ' '+lineTypes[hex1.lineValues[i]].ljust(15)+separator+\
+                        lineStrings[hex2.lineValues[i]]+' '+lineTypes[hex2.lineValues[i]]+'\n'  )
+
+    return ''.join(textReadingParts)
+
+class ReadingBatch:
+    """
+    columnar store for large numbers of complete readings of one oracle type, public class
+
+    readings are kept as packed line values in an array('H'), 2 bytes each,
+    with questions and timestamps in side columns. accessors work over whole
+    columns using the flat completion lookup tables, no per reading objects
+    are made unless a single Reading is asked for.
+    """
+    def __init__(self, oracle: str = 'coin') -> None:
+        self.oracle: str = oracle
+        self.lines: array = array('H')  # packed line values
+        self.questions: list[str] = []  # question of each reading
+        self.timestamps: array = array('d')  # casting time of each reading, seconds since the epoch
+
+    @classmethod
+    def cast(cls, count: int, rng: Optional[random.Random] = None, oracle: str = 'coin',
+             question: str = '', timestamp: Optional[float] = None) -> 'ReadingBatch':
+        """
+        return a new batch of count readings cast with cast_many, public method
+
+        every reading gets the same question and timestamp (now, if not given)
+        """
+        batch = cls(oracle)
+        batch.extend(cast_many(count, rng, oracle), [question] * count,
+                     [time.time() if timestamp is None else timestamp] * count)
+        return batch
+
+    def append(self, lines: int, question: str = '', timestamp: float = 0.0) -> None:
+        """
+        add one reading by its packed line values, public method
+        """
+        self.lines.append(lines)
+        self.questions.append(question)
+        self.timestamps.append(timestamp)
+
+    def extend(self, lines: Sequence[int], questions: Optional[Sequence[str]] = None,
+               timestamps: Optional[Sequence[float]] = None) -> None:
+        """
+        add many readings by their packed line values, public method
 
-        textReading = ''.join(textReadingParts)
+        questions and timestamps default to '' and 0.0, if given they must be
+        the same length as lines
+        """
+        count = len(lines)
+        if questions is not None and len(questions) != count or \
+           timestamps is not None and len(timestamps) != count:
+            raise ValueError('questions and timestamps must have one entry per reading')
+        self.lines.extend(lines)
+        self.questions.extend(questions if questions is not None else [''] * count)
+        if timestamps is None: self.timestamps.frombytes(bytes(8 * count)) #all 0.0
+        else: self.timestamps.extend(timestamps)
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __getitem__(self, index: int) -> Reading:
+        return Reading(self.lines[index], self.questions[index], self.oracle)
+
+    def __iter__(self) -> Iterator[Reading]:
+        oracle = self.oracle
+        return (Reading(lines, question, oracle) for lines, question in zip(self.lines, self.questions))
 
-        return textReading
+    def hex1_numbers(self) -> array:
+        """
+        return the hex1 King Wen number of every reading as an array('B'), public method
+        """
+        return array('B', map(HEX1_BY_PACKED.__getitem__, self.lines))
+
+    def hex2_numbers(self) -> array:
+        """
+        return the hex2 King Wen number of every reading (0 for none) as an array('B'), public method
+        """
+        return array('B', map(HEX2_BY_PACKED.__getitem__, self.lines))
+
+    def moving_masks(self) -> array:
+        """
+        return the moving line mask of every reading as an array('B'), public method
+        """
+        return array('B', map(MOVING_BY_PACKED.__getitem__, self.lines))
+
+    def hexagram_counts(self, hexagram: int = 1) -> list[int]:
+        """
+        return how often each hexagram was cast, indexed by King Wen number, public method
+
+        hexagram selects hex1 (1) or hex2 (2) counts, index 0 of the hex2 counts
+        is the number of readings with no moving lines
+        """
+        table = {1: HEX1_BY_PACKED, 2: HEX2_BY_PACKED}[hexagram]
+        counts = [0] * 65
+        for lines, count in Counter(self.lines).items():
+            counts[table[lines]] += count
+        return counts
 
 #
 # utility routines 
@@ -390,3 +1387,704 @@ def Storage(file: Path | str, data: Any = None) -> Any:
                 else:
                     raise Exception('pychingUnpickleError') from e
         finally: pickleFile.close()
+
+SAVE_MAGIC = b'PYCH'  # first bytes of every binary save file
+SAVE_VERSION = 1  # binary save file format version written by encode_save
+# oracle ids of binary save files, never reorder this, only append to it
+SAVE_ORACLE_IDS: tuple[str, ...] = ('coin', 'yarrow', 'yarrow-stalks', 'sixteen-marble', 'two-dice')
+_OTHER_ORACLE = 255  # oracle id of oracles not in SAVE_ORACLE_IDS, their name ends the file
+# magic, version, lines cast, packed line values, oracle id, oracle values count,
+# timestamp, question length (in utf-8 bytes)
+SAVE_HEADER = struct.Struct('<4sBBHBBdI')
+
+class SaveData(NamedTuple):
+    """
+    the contents of a binary save file, as returned by decode_save, public class
+    """
+    version: int  # format version
+    lines: int  # packed line values of the lines cast, uncast lines are 0 bits
+    currentLine: int  # number of lines cast (0-6)
+    oracle: str  # oracle type
+    timestamp: float  # time the reading was completed, or saved if incomplete, 0.0 if unknown
+    oracleValues: tuple[int, ...]  # oracle values of the last line cast
+    question: str
+
+def _PackSave(currentLine: int, lines: int, oracle: str, oracleValues: Sequence[int],
+              timestamp: float, question: str) -> bytes:
+    """
+    return the binary save file form of a reading's parts, private function
+
+    raises ValueError for parts too large for the header fields
+    """
+    try:
+        oracleId = SAVE_ORACLE_IDS.index(oracle)
+        oracleName = b''
+    except ValueError:
+        oracleId = _OTHER_ORACLE
+        oracleName = oracle.encode()
+    questionBytes = question.encode()
+    try:
+        header = SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, currentLine, lines, oracleId,
+                                  len(oracleValues), timestamp, len(questionBytes))
+    except struct.error as error:
+        raise ValueError(f'reading too large to save: {error}') from None
+    return b''.join((header, bytes(oracleValues), questionBytes, oracleName))
+
+def encode_save(hexes: 'Hexagrams') -> bytes:
+    """
+    return the binary save file form of a Hexagrams instance, public function
+
+    a fixed SAVE_HEADER is followed by the oracle values of the last line
+    cast (one byte each), the utf-8 question and, for oracles without an id in
+    SAVE_ORACLE_IDS, the utf-8 oracle name. readings without a timestamp, as
+    partial readings are, are dated with the time they are saved. raises
+    ValueError for invalid line or oracle values.
+    """
+    lines = 0
+    try:
+        for line in range(hexes.currentLine):
+            lines |= _LINE_CODES[hexes.hex1.lineValues[line]] << (2 * line)
+    except KeyError:
+        raise ValueError(f'invalid line values: {hexes.hex1.lineValues}') from None
+    return _PackSave(hexes.currentLine, lines, hexes.oracle, hexes.currentOracleValues,
+                     hexes.timestamp or time.time(), hexes.question)
+
+def encode_reading(reading: Reading, timestamp: float = 0.0) -> bytes:
+    """
+    return the binary save file form of a complete Reading value, public function
+
+    the same layout as encode_save, without any oracle values
+    """
+    return _PackSave(6, reading.lines, reading.oracle, (), timestamp, reading.question)
+
+def _UnpackSaveHeader(data: bytes) -> tuple[int, int, int, int, int, float, int]:
+    """
+    return the header fields of a binary save file after its magic, private function
+
+    raises ValueError if data doesn't start with the header of a version this
+    program can read
+    """
+    try:
+        magic, *fields = SAVE_HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError('not a binary save file, too short') from None
+    if magic != SAVE_MAGIC:
+        raise ValueError('not a binary save file')
+    if fields[0] > SAVE_VERSION:
+        raise ValueError(f'save file format version {fields[0]} is newer than this program')
+    return tuple(fields)
+
+def decode_save(data: bytes) -> SaveData:
+    """
+    return the contents of a binary save file, public function
+
+    raises ValueError if data isn't a binary save file of a version this
+    program can read
+    """
+    version, currentLine, lines, oracleId, valuesCount, timestamp, questionLength = \
+        _UnpackSaveHeader(data)
+    start = SAVE_HEADER.size
+    questionStart = start + valuesCount
+    questionEnd = questionStart + questionLength
+    if len(data) < questionEnd or currentLine > 6:
+        raise ValueError('damaged binary save file')
+    if oracleId == _OTHER_ORACLE:
+        oracle = data[questionEnd:].decode()
+    elif oracleId < len(SAVE_ORACLE_IDS):
+        oracle = SAVE_ORACLE_IDS[oracleId]
+    else:
+        raise ValueError(f'unknown oracle id {oracleId} in save file')
+    return SaveData(version, lines, currentLine, oracle, timestamp,
+                    tuple(data[start:questionStart]), data[questionStart:questionEnd].decode())
+
+PEEK_SIZE = 256  # bytes read from a legacy pickle save file by peek_save_info
+# pickle opcodes holding a string, in any protocol
+_PICKLE_STRINGS = frozenset(('STRING', 'BINSTRING', 'SHORT_BINSTRING', 'UNICODE',
+                             'BINUNICODE', 'SHORT_BINUNICODE', 'BINUNICODE8'))
+
+class SaveInfo(NamedTuple):
+    """
+    a summary of a save file, as returned by peek_save_info, public class
+    """
+    fileType: str  # 'binary' or 'pickle'
+    version: str  # binary format version, or the program version that wrote a pickle file
+    timestamp: float  # as SaveData, the modification time for pickle files and undated readings
+    currentLine: Optional[int]  # number of lines cast, None if unknown (pickle files)
+    hex1: int  # primary hexagram number, 0 if the reading is incomplete or unknown
+    hex2: int  # relating hexagram number, 0 if there are no moving lines or it is unknown
+
+def _PickleStrings(data: bytes, count: int) -> list[str]:
+    """
+    return the first count strings a pickle pushes, fewer if it ends first, private function
+
+    the pickle opcodes are only parsed, never executed. strings pushed again
+    from the pickle memo count too, so repeated strings aren't missed.
+    """
+    strings, memo, last = [], {}, None
+    try:
+        for opcode, arg, position in pickletools.genops(data):
+            name = opcode.name
+            if name in _PICKLE_STRINGS:
+                last = arg
+            elif name in ('GET', 'BINGET', 'LONG_BINGET'):
+                last = memo.get(arg)
+            elif name in ('PUT', 'BINPUT', 'LONG_BINPUT'):
+                memo[arg] = last
+                continue
+            elif name == 'MEMOIZE':
+                memo[len(memo)] = last
+                continue
+            else:
+                last = None
+                continue
+            if isinstance(last, str):
+                strings.append(last)
+                if len(strings) == count:
+                    break
+    except Exception: #truncated or not a pickle at all
+        pass
+    return strings
+
+def _PeekPickle(head: bytes) -> str:
+    """
+    return the program version in the start of a legacy pickle save file, private function
+
+    only the save file id tuple that begins every legacy save file is read,
+    see _PickleStrings. raises ValueError if head doesn't begin with one.
+    """
+    strings = _PickleStrings(head, 2)
+    if len(strings) < 2 or strings[0] != pyching.saveFileID[0]:
+        raise ValueError('not a save file')
+    return strings[1]
+
+def peek_save_info(path: Path | str) -> SaveInfo:
+    """
+    return a summary of a save file without loading it, public function
+
+    only the fixed SAVE_HEADER of a binary save file is read (PEEK_SIZE bytes
+    of a legacy pickle file, whose hexagrams can't be known without a full
+    Load), so listings and file dialogs can check many save files cheaply.
+    raises ValueError if the file isn't a save file this program can read,
+    IOError if it can't be read at all.
+    """
+    with open(path, 'rb') as saveFile:
+        head = saveFile.read(max(SAVE_HEADER.size, PEEK_SIZE))
+        stat = os.fstat(saveFile.fileno())
+    size = stat.st_size
+    if not head.startswith(SAVE_MAGIC):
+        return SaveInfo('pickle', _PeekPickle(head), stat.st_mtime, None, 0, 0)
+    version, currentLine, lines, oracleId, valuesCount, timestamp, questionLength = \
+        _UnpackSaveHeader(head)
+    timestamp = timestamp or stat.st_mtime #undated, as written by encode_reading
+    if size < SAVE_HEADER.size + valuesCount + questionLength or currentLine > 6:
+        raise ValueError('damaged binary save file')
+    if oracleId >= len(SAVE_ORACLE_IDS) and oracleId != _OTHER_ORACLE:
+        raise ValueError(f'unknown oracle id {oracleId} in save file')
+    if currentLine == 6:
+        return SaveInfo('binary', str(version), timestamp, 6,
+                        HEX1_BY_PACKED[lines], HEX2_BY_PACKED[lines])
+    return SaveInfo('binary', str(version), timestamp, currentLine, 0, 0)
+
+#
+# save directory index
+######################
+
+SAVE_INDEX_MAGIC = b'PYCHSDX1'  # first bytes of a SaveIndex cache file
+# magic and entry count, then per entry: mtime (ns), size, timestamp, file type, lines
+# cast, hex1, hex2, name length, question length (in utf-8 bytes). each entry's utf-8
+# name and question follow the last entry, in the same order
+_SAVE_INDEX_HEADER = struct.Struct('<8sI')
+_SAVE_INDEX_ENTRY = struct.Struct('<qqdBBBBHI')
+_SAVE_FILE_TYPES = ('', 'binary', 'pickle')  # file types by id, '' for unreadable files
+_UNKNOWN_LINES = 255  # lines cast of entries that don't know them, in the cache file
+SAVE_SORT_KEYS: dict[str, Callable[['SaveEntry'], Any]] = {
+    'date': lambda entry: entry.timestamp,
+    'name': lambda entry: entry.name,
+    'hexagram': lambda entry: (entry.hex1, entry.hex2, entry.timestamp),
+    'question': lambda entry: (entry.question.casefold(), entry.timestamp),
+}
+
+class SaveEntry(NamedTuple):
+    """
+    the cached summary of one file in the save directory, public class
+    """
+    name: str  # file name
+    mtime: int  # modification time (ns) when summarised
+    size: int  # size when summarised
+    fileType: str  # 'binary', 'pickle', or '' if the file couldn't be read as a save file
+    timestamp: float  # time the reading was completed
+    currentLine: Optional[int]  # number of lines cast, None if unknown (pickle files)
+    hex1: int  # primary hexagram number, 0 if the reading is incomplete or unknown
+    hex2: int  # relating hexagram number, 0 if there are no moving lines or it is unknown
+    question: str
+
+def _SummariseSave(path: Path, name: str, mtime: int, size: int) -> SaveEntry:
+    """
+    return the SaveEntry of a save file, reading it once, private function
+    """
+    try:
+        info = peek_save_info(path)
+        if info.fileType == 'binary':
+            question = decode_save(path.read_bytes()).question
+            return SaveEntry(name, mtime, size, 'binary', info.timestamp, info.currentLine,
+                             info.hex1, info.hex2, question)
+        #legacy files are never unpickled here, their question is the string after the
+        #save file id, and their lines and hexagrams stay unknown
+        strings = _PickleStrings(path.read_bytes(), 3)
+        if len(strings) < 3:
+            raise ValueError('damaged legacy save file')
+        return SaveEntry(name, mtime, size, 'pickle', info.timestamp, None, 0, 0, strings[2])
+    except OSError:
+        raise
+    except Exception: #not a save file, remembered so it isn't read again
+        return SaveEntry(name, mtime, size, '', 0.0, 0, 0, 0, '')
+
+class SaveIndex:
+    """
+    a cached index of the readings in the save directory, public class
+
+    each save file is summarised (date, question and hexagram numbers) once
+    and kept in a cache file keyed by file name, modification time and size.
+    refresh() only stats the directory and re-reads the files that were
+    added or changed since, so listing many saved readings stays fast.
+    """
+    def __init__(self, directory: Optional[Path | str] = None,
+                 indexFile: Optional[Path | str] = None) -> None:
+        self.directory = Path(directory) if directory is not None else pyching.savePath
+        if indexFile is not None:
+            self.indexFile = Path(indexFile)
+        elif directory is None:
+            self.indexFile = pyching.saveIndexFile
+        else:
+            self.indexFile = self.directory / pyching.saveIndexFile.name
+        self.entries: dict[str, SaveEntry] = self._ReadIndex()
+
+    def _ReadIndex(self) -> dict[str, SaveEntry]:
+        """
+        return the entries of the cache file, none if it is missing or damaged, private method
+        """
+        try:
+            data = self.indexFile.read_bytes()
+            magic, count = _SAVE_INDEX_HEADER.unpack_from(data)
+            if magic != SAVE_INDEX_MAGIC:
+                return {}
+            start = _SAVE_INDEX_HEADER.size
+            textStart = start + count * _SAVE_INDEX_ENTRY.size
+            entries = {}
+            for mtime, size, timestamp, fileType, currentLine, hex1, hex2, nameLength, \
+                    questionLength in _SAVE_INDEX_ENTRY.iter_unpack(data[start:textStart]):
+                nameEnd = textStart + nameLength
+                questionEnd = nameEnd + questionLength
+                name = data[textStart:nameEnd].decode()
+                if currentLine == _UNKNOWN_LINES: currentLine = None
+                entries[name] = SaveEntry(name, mtime, size, _SAVE_FILE_TYPES[fileType], timestamp,
+                                          currentLine, hex1, hex2, data[nameEnd:questionEnd].decode())
+                textStart = questionEnd
+            if textStart != len(data):
+                return {}
+            return entries
+        except (OSError, ValueError, IndexError, struct.error): #rebuilt by the next refresh
+            return {}
+
+    def _WriteIndex(self) -> None:
+        """
+        write the entries to the cache file, replacing it atomically, private method
+        """
+        records, text = [], []
+        for entry in self.entries.values():
+            name, question = entry.name.encode(), entry.question.encode()
+            records.append(_SAVE_INDEX_ENTRY.pack(
+                entry.mtime, entry.size, entry.timestamp, _SAVE_FILE_TYPES.index(entry.fileType),
+                _UNKNOWN_LINES if entry.currentLine is None else entry.currentLine,
+                entry.hex1, entry.hex2, len(name), len(question)))
+            text += (name, question)
+        temporary = self.indexFile.with_name(self.indexFile.name + '.tmp')
+        try:
+            temporary.write_bytes(b''.join((_SAVE_INDEX_HEADER.pack(SAVE_INDEX_MAGIC, len(records)),
+                                            *records, *text)))
+            os.replace(temporary, self.indexFile)
+        except OSError:
+            pass #a read only save directory just means no cache
+
+    def refresh(self) -> bool:
+        """
+        bring the index up to date with the save directory, public method, returns
+        True if anything changed
+
+        raises OSError if the save directory can't be read
+        """
+        changed = False
+        seen = set()
+        with os.scandir(self.directory) as scan:
+            for dirEntry in scan:
+                if not dirEntry.name.endswith(pyching.saveFileExt):
+                    continue
+                try:
+                    if not dirEntry.is_file():
+                        continue
+                    stat = dirEntry.stat()
+                    seen.add(dirEntry.name)
+                    entry = self.entries.get(dirEntry.name)
+                    if entry is None or entry.mtime != stat.st_mtime_ns or entry.size != stat.st_size:
+                        self.entries[dirEntry.name] = _SummariseSave(
+                            Path(dirEntry.path), dirEntry.name, stat.st_mtime_ns, stat.st_size)
+                        changed = True
+                except OSError: #removed while scanning
+                    seen.discard(dirEntry.name)
+        for name in self.entries.keys() - seen:
+            del self.entries[name]
+            changed = True
+        if changed:
+            self._WriteIndex()
+        return changed
+
+    def readings(self, sort: str = 'date', reverse: bool = True) -> list[SaveEntry]:
+        """
+        return the entries of readable save files in sort order, public method
+
+        sort is a key of SAVE_SORT_KEYS, by default the newest readings come first
+        """
+        try:
+            key = SAVE_SORT_KEYS[sort]
+        except KeyError:
+            raise ValueError(f'unknown sort order: {sort!r}') from None
+        return sorted((entry for entry in self.entries.values() if entry.fileType),
+                      key=key, reverse=reverse)
+
+#
+# bulk casting
+######################
+
+def _BuildCoinTable() -> tuple[int, ...]:
+    """
+    build the coin toss lookup table used for bulk casting, private function
+
+    the table is indexed by 9 random bits, 3 coins for each of 3 lines, a set bit
+    is heads (3) and a clear bit tails (2), so each line value is 6 + the number
+    of heads and every one of the 512 entries is equally likely. each entry holds
+    the 3 resulting lines in packed form.
+    """
+    table = []
+    for bits in range(512):
+        packed = 0
+        for line in range(3):
+            heads = bin((bits >> (3 * line)) & 7).count('1')
+            packed |= _LINE_CODES[6 + heads] << (2 * line)
+        table.append(packed)
+    return tuple(table)
+
+_COIN_LOW = _BuildCoinTable()  # lines 1-3 of a reading from 9 coin bits
+_COIN_HIGH = tuple(packed << 6 for packed in _COIN_LOW)  # lines 4-6 of a reading from 9 coin bits
+
+def cast_many(count: int, rng: Optional[random.Random] = None, oracle: str = 'coin') -> array:
+    """
+    cast count complete readings at once, public function
+
+    returns an array('H') of packed line values (see pack_lines), one per reading,
+    which can be completed with COMPLETIONS[packed]. rng can be a random.Random
+    instance or the random module, it defaults to the calling thread's own
+    generator (see thread_rng). oracle is
+    the name of a registered oracle, whose cast_readings does the work, so the
+    probabilities are exactly those of Hexagrams.NewLine. a coin reading uses
+    18 random bits, one per coin.
+    """
+    return get_oracle(oracle).cast_readings(rng or thread_rng(), count)
+
+def iter_readings(count: Optional[int] = None, rng: Optional[random.Random] = None,
+                  chunkSize: int = 1024, oracle: str = 'coin') -> Iterator[int]:
+    """
+    lazily yield the packed line values of readings, public function
+
+    yields count readings, or keeps going forever if count is None. readings are
+    cast chunkSize at a time with cast_many, so the same rng gives the same
+    readings whichever of the two is used.
+    """
+    if count is None:
+        while True:
+            yield from cast_many(chunkSize, rng, oracle)
+    while count > 0:
+        yield from cast_many(min(count, chunkSize), rng, oracle)
+        count = count - chunkSize
+
+@cache
+def _Numpy() -> Any:
+    """
+    return the numpy module, or None if it isn't installed, private function
+
+    numpy is optional and only used by the vectorized casting backend, so it
+    is imported on first use rather than by every importer of this module
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+@cache
+def _NumpyTables() -> dict[str, Any]:
+    """
+    return the lookup arrays of the vectorized casting backend, built on first use, private function
+    """
+    numpy = _Numpy()
+    return {
+        'low': numpy.array(_COIN_LOW, dtype=numpy.uint16),
+        'high': numpy.array(_COIN_HIGH, dtype=numpy.uint16),
+        'moving': numpy.frombuffer(MOVING_BY_PACKED, dtype=numpy.uint8),
+        'hex1': numpy.frombuffer(HEX1_BY_PACKED, dtype=numpy.uint8),
+        'hex2': numpy.frombuffer(HEX2_BY_PACKED, dtype=numpy.uint8),
+    }
+
+class CastArrays(NamedTuple):
+    """
+    column arrays of many readings returned by cast_arrays, public class
+
+    numpy arrays when numpy is installed, otherwise array module arrays
+    """
+    lines: Any  # packed line values (uint16)
+    movingMasks: Any  # moving line masks (uint8)
+    hex1: Any  # hex1 King Wen numbers (uint8)
+    hex2: Any  # hex2 King Wen numbers, 0 when there are no moving lines (uint8)
+
+def cast_arrays(count: int, seed: Optional[int] = None, oracle: str = 'coin') -> CastArrays:
+    """
+    cast count complete readings as column arrays, public function
+
+    with numpy installed the oracle's cast_numpy casts every line, and each
+    hexagram lookup is done as a single array operation, using a numpy Generator
+    seeded from seed. otherwise this falls back to cast_many with a random.Random
+    seeded from seed (or the thread's own generator if seed is None). the two backends give
+    the same probabilities but not the same readings for a given seed.
+    """
+    numpy = _Numpy()
+    if numpy is None:
+        lines = cast_many(count, None if seed is None else random.Random(seed), oracle)
+        return CastArrays(lines,
+                          array('B', map(MOVING_BY_PACKED.__getitem__, lines)),
+                          array('B', map(HEX1_BY_PACKED.__getitem__, lines)),
+                          array('B', map(HEX2_BY_PACKED.__getitem__, lines)))
+    lines = get_oracle(oracle).cast_numpy(numpy.random.default_rng(seed), count)
+    tables = _NumpyTables()
+    return CastArrays(lines, tables['moving'][lines], tables['hex1'][lines], tables['hex2'][lines])
+
+class CastingStream:
+    """
+    reproducible, seeded stream of coin readings, public class
+
+    the stream is split into blocks of blockSize readings and every block draws
+    from its own random.Random, seeded from a hash of the master seed and the block
+    number. any range of readings can therefore be cast on its own, in any order
+    or process, and always gives the same readings as casting the whole stream.
+    """
+    def __init__(self, seed: int, blockSize: int = 4096) -> None:
+        self.seed: int = seed  # master seed
+        self.blockSize: int = blockSize  # readings per independently seeded block
+
+    def block_rng(self, block: int) -> random.Random:
+        """
+        return a fresh random number generator for one block of the stream, public method
+        """
+        digest = hashlib.blake2b(f'pyching:{self.seed}:{block}'.encode(), digest_size=32).digest()
+        return random.Random(int.from_bytes(digest, 'little'))
+
+    def cast(self, start: int, stop: int) -> array:
+        """
+        return the packed line values of readings start to stop - 1, public method
+        """
+        readings = array('H')
+        block = start // self.blockSize
+        while block * self.blockSize < stop:
+            blockStart = block * self.blockSize
+            lines = cast_many(self.blockSize, self.block_rng(block))
+            readings.extend(lines[max(start - blockStart, 0):stop - blockStart])
+            block = block + 1
+        return readings
+
+    def shards(self, total: int, workers: int) -> list[tuple[int, int]]:
+        """
+        split readings 0 to total - 1 into at most workers (start, stop) ranges, public method
+
+        ranges are aligned to whole blocks, so no block is cast by more than one worker
+        """
+        if total <= 0:
+            return []
+        blocks = -(-total // self.blockSize)
+        perWorker = -(-blocks // max(workers, 1)) * self.blockSize
+        return [(start, min(start + perWorker, total)) for start in range(0, total, perWorker)]
+
+#
+# outcome probabilities
+######################
+
+def _YarrowStalkProbabilities() -> dict[int, Fraction]:
+    """
+    work out the exact line value probabilities of YarrowStalkCounts, private function
+
+    follows every possible heap split through the three divisions, each split
+    weighted by its binomial probability among the allowed splits
+    """
+    states = {(49, 0): Fraction(1)} #(stalks left, sum of counts): probability
+    for division in range(3):
+        nextStates: dict[tuple[int, int], Fraction] = {}
+        for (stalks, countSum), probability in states.items():
+            splits = range(1, stalks - 1)
+            allowed = sum(comb(stalks, left) for left in splits)
+            for left in splits:
+                removed = 1 + (left % 4 or 4) + ((stalks - left - 1) % 4 or 4)
+                key = (stalks - removed, countSum + (3 if removed < 6 else 2))
+                nextStates[key] = nextStates.get(key, 0) + probability * Fraction(comb(stalks, left), allowed)
+        states = nextStates
+    lineProbabilities = {6: Fraction(0), 7: Fraction(0), 8: Fraction(0), 9: Fraction(0)}
+    for (stalks, lineValue), probability in states.items():
+        lineProbabilities[lineValue] = lineProbabilities[lineValue] + probability
+    return lineProbabilities
+
+@cache
+def line_probabilities(oracle: str = 'coin') -> dict[int, Fraction]:
+    """
+    return the exact probability of each line value (6-9) for an oracle type, public function
+    """
+    return get_oracle(oracle).line_probabilities()
+
+class OutcomeDistribution:
+    """
+    exact probabilities of every reading for one oracle type, public class
+
+    use outcome_distribution() to get the cached instance for an oracle
+    """
+    def __init__(self, oracle: str) -> None:
+        self.oracle: str = oracle
+        lineProbabilities = line_probabilities(oracle)
+        codeProbabilities = [lineProbabilities[6 + code] for code in range(4)]
+        #probability of each of the 4096 line configurations, indexed by packed line values
+        self.packed: tuple[Fraction, ...] = tuple(
+            reduce(lambda x,y: x*y, (codeProbabilities[(packed >> shift) & 3] for shift in (0, 2, 4, 6, 8, 10)))
+            for packed in range(4096))
+        pairs = [[Fraction(0)] * 65 for _ in range(65)]
+        for packed, probability in enumerate(self.packed):
+            pairs[HEX1_BY_PACKED[packed]][HEX2_BY_PACKED[packed]] += probability
+        #probability of each (hex1, hex2) outcome indexed by King Wen numbers, hex2 0 means no moving lines
+        self.pairs: tuple[tuple[Fraction, ...], ...] = tuple(tuple(row) for row in pairs)
+
+    def probability(self, hex1: int, hex2: int = 0) -> Fraction:
+        """
+        return the probability of casting hex1 becoming hex2, public method
+
+        hex1 and hex2 are King Wen numbers, hex2 = 0 (or hex2 = hex1) means no moving lines
+        """
+        return self.pairs[hex1][0 if hex2 == hex1 else hex2]
+
+    def hex1_probabilities(self) -> list[Fraction]:
+        """
+        return the probability of each hex1 indexed by King Wen number, index 0 is unused, public method
+        """
+        return [sum(row) for row in self.pairs]
+
+    def matrix(self, exact: bool = True) -> list[list[Fraction | float]]:
+        """
+        return a 64 x 64 matrix of (hex1, hex2) probabilities, public method
+
+        rows are hex1 and columns hex2, both King Wen number - 1. a hexagram can't
+        become itself through moving lines, so the diagonal holds the probability
+        of each hexagram with no moving lines. with exact=False the matrix holds
+        floats instead of Fractions.
+        """
+        convert = (lambda x: x) if exact else float
+        return [[convert(self.probability(hex1, hex2)) for hex2 in range(1, 65)] for hex1 in range(1, 65)]
+
+@cache
+def outcome_distribution(oracle: str = 'coin') -> OutcomeDistribution:
+    """
+    return the exact outcome distribution of an oracle type, computed once and cached, public function
+    """
+    return OutcomeDistribution(oracle)
+
+#
+# reading plans
+######################
+
+JUDGEMENT: int = 0  # section number of a hexagram's main text, sections 1-6 are its line texts
+
+class ReadingPlan(NamedTuple):
+    """
+    which hexagram texts apply to a reading under one set of interpretation rules, public class
+
+    each part is a (King Wen number, sections) pair, sections being JUDGEMENT
+    and/or line positions 1-6. parts are in reading order, and the first section
+    of the first part is the one the rules make most important.
+    """
+    parts: tuple[tuple[int, tuple[int, ...]], ...]
+
+def _ZhuXiPlan(completion: Completion) -> ReadingPlan:
+    """
+    work out the reading plan of one completion by Zhu Xi's rules, private function
+
+    no moving lines: the judgement of hex1
+    1 moving line: that line of hex1
+    2 moving lines: both lines of hex1, the upper one first
+    3 moving lines: the judgements of hex1 then hex2
+    4 moving lines: the two unmoving lines of hex2, the lower one first
+    5 moving lines: the unmoving line of hex2
+    6 moving lines: the judgement of hex2. (for hexagrams 1 and 2 Zhu Xi reads
+    the extra 'use nines' or 'use sixes' text, which isn't in the pyching data,
+    so the judgement of hex2 is used for them too)
+    """
+    hex1 = NUMBER_BY_CODE[completion.hex1Code]
+    moving = [bit + 1 for bit in range(6) if completion.movingMask >> bit & 1]
+    unmoving = [bit + 1 for bit in range(6) if not completion.movingMask >> bit & 1]
+    if not moving:
+        return ReadingPlan(((hex1, (JUDGEMENT,)),))
+    hex2 = NUMBER_BY_CODE[completion.hex2Code]
+    if len(moving) == 1:
+        return ReadingPlan(((hex1, (moving[0],)),))
+    if len(moving) == 2:
+        return ReadingPlan(((hex1, (moving[1], moving[0])),))
+    if len(moving) == 3:
+        return ReadingPlan(((hex1, (JUDGEMENT,)), (hex2, (JUDGEMENT,))))
+    if len(moving) == 6:
+        return ReadingPlan(((hex2, (JUDGEMENT,)),))
+    return ReadingPlan(((hex2, tuple(unmoving)),))
+
+def _WholeTextPlan(completion: Completion) -> ReadingPlan:
+    """
+    work out the reading plan of one completion as the whole text of both hexagrams, private function
+
+    this is what the pyching interfaces have always shown
+    """
+    sections = (JUDGEMENT, 1, 2, 3, 4, 5, 6)
+    parts = [(NUMBER_BY_CODE[completion.hex1Code], sections)]
+    if completion.movingMask:
+        parts.append((NUMBER_BY_CODE[completion.hex2Code], sections))
+    return ReadingPlan(tuple(parts))
+
+# the interpretation rule sets by name, each builds the plan of one completion
+RULE_SETS: dict[str, Callable[[Completion], ReadingPlan]] = {
+    'zhu xi': _ZhuXiPlan,
+    'whole text': _WholeTextPlan,
+}
+
+@cache
+def reading_plans(ruleSet: str = 'zhu xi') -> tuple[ReadingPlan, ...]:
+    """
+    return the reading plans of all 4096 readings under a rule set, public function
+
+    the table is indexed by packed line values, it is built the first time a
+    rule set is used and cached. raises ValueError for unknown rule sets.
+    """
+    try:
+        buildPlan = RULE_SETS[ruleSet]
+    except KeyError:
+        raise ValueError(f'unknown rule set: {ruleSet!r}, use one of {", ".join(RULE_SETS)}') from None
+    return tuple(buildPlan(completion) for completion in COMPLETIONS)
+
+def reading_plan(reading: 'Hexagrams | Reading | ReadingKey | int', ruleSet: str = 'zhu xi') -> ReadingPlan:
+    """
+    return the reading plan of a complete reading, public function
+
+    reading can be a complete Hexagrams instance, a Reading, a ReadingKey or
+    packed line values
+    """
+    if isinstance(reading, Hexagrams):
+        reading = pack_lines(reading.hex1.lineValues)
+    elif isinstance(reading, (Reading, ReadingKey)):
+        reading = reading.lines
+    return reading_plans(ruleSet)[reading]
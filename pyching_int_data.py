@@ -26,38 +26,84 @@
 ##---------------------------------------------------------------------------##
 """"
 data return routines for pyching.
-each of the numbered functions below returns the information text data for one 
-hexagram, after converting it to an html string
+each of the numbered info functions below returns the information text data for
+one hexagram as a dict, and each numbered data function returns it after
+converting it to an html string
 """
+import functools
 
-def BuildHtml(dict):
+def _TextHtml(text):
     """
-    build an html hexagram info string from the passed in dict
+    return the html of a hexagram's main text, with <p>'s between its paragraphs
     """
-    #put the <p>'s between the text paragraphs
-    textList=dict['text'].splitlines(1)
+    textList=text.splitlines(1)
     for i in range(0,len(textList)):
         #print textList[i].strip()
         if textList[i].strip()=='':
-            textList[i]="<p>"                
-    textHtmlStr='\n'.join(textList)
-    htmlStr=(
-            """<html><body><p><h2><img SRC=%s"""%(dict['imgSrc'])+
-            """> %s</h2><p>"""%(dict['title'])+
-            """%s<p>"""%(textHtmlStr)+
-            """<b>The bottom line</b>, as %s<p>"""%(dict[1])+
-            """<b>The second line</b>, as %s<p>"""%(dict[2])+
-            """<b>The third line</b>, as %s<p>"""%(dict[3])+
-            """<b>The fourth line</b>, as %s<p>"""%(dict[4])+
-            """<b>The fifth line</b>, as %s<p>"""%(dict[5])+
-            """<b>The topmost line</b>, as %s<p>"""%(dict[6])+
-            """</body></html>"""
-            )
-    return htmlStr
+            textList[i]="<p>"
+    return """%s<p>"""%('\n'.join(textList))
 
+def _TitleHtml(info):
+    """
+    return the html heading of a hexagram, its image and title
+    """
+    return """<p><h2><img SRC=%s> %s</h2><p>"""%(info['imgSrc'],info['title'])
 
-def in1data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id1data()",
+def _LineHtml(info, line):
+    """
+    return the html of one of a hexagram's line texts, line is 1 (bottom) to 6 (top)
+    """
+    return """<b>The %s line</b>, as %s<p>"""%(linePlaces[line],info[line])
+
+def BuildHtml(dict):
+    """
+    build an html hexagram info string from the passed in dict
+    """
+    return ''.join(["""<html><body>""", _TitleHtml(dict), _TextHtml(dict['text'])] +
+                   [_LineHtml(dict, line) for line in range(1, 7)] + ["""</body></html>"""])
+
+# the line names used in the line texts, indexed by line position
+linePlaces = {1:'bottom',2:'second',3:'third',4:'fourth',5:'fifth',6:'topmost'}
+
+@functools.cache
+def HexagramInfo(number):
+    """
+    return the info dict of a hexagram, as passed to BuildHtml by its data function
+
+    dicts are cached, don't modify them
+    """
+    return globals()['in%dinfo' % number]()
+
+def BuildPlanHtml(plan):
+    """
+    build an html info string holding only the hexagram texts named in a reading plan
+
+    plan should be a pyching_engine.ReadingPlan, section 0 of a hexagram is its
+    main text and sections 1-6 its line texts
+    """
+    htmlParts=["""<html><body>"""]
+    for number, sections in plan.parts:
+        info=HexagramInfo(number)
+        htmlParts.append(_TitleHtml(info))
+        for section in sections:
+            if section == 0:
+                htmlParts.append(_TextHtml(info['text']))
+            else:
+                htmlParts.append(_LineHtml(info, section))
+    htmlParts.append("""</body></html>""")
+    return ''.join(htmlParts)
+
+@functools.lru_cache(maxsize=1024)
+def ReadingHtml(plan):
+    """
+    return the html info string of a reading plan, memoized on the plan
+
+    plan should be a pyching_engine.ReadingPlan, see pyching_engine.reading_plan()
+    """
+    return BuildPlanHtml(plan)
+
+def in1info():
+        return { 'imgSrc':"pyching_idimage_data.id1data()",
                 'title':""" 1. Tch'ien / The Creative""", 
                 'text':"""
 Heaven, in its motion, gives the idea of strength. The superior person, in accordance with this, will nerve their being to ceaseless activity.
@@ -70,9 +116,11 @@ Tch'ien represents what is great and originating, penetrating, advantageous, cor
                 4:"""nine: we see the dragon looking as if they were leaping up, but still in the deep. There will be no mistake. """,
                 5:"""nine: we see the dragon on the wing in the sky. It will be advantageous to meet with the great person. """,
                 6:"""nine: we see the dragon exceeding the proper limits. There will be occasion for repentance."""
-})
-def in2data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id2data()",
+}
+def in1data():
+        return BuildHtml(in1info())
+def in2info():
+        return { 'imgSrc':"pyching_idimage_data.id2data()",
                 'title':""" 2. Koun / The Receptive""", 
                 'text':"""
 The capacity and sustaining power of the earth is what is denoted by Koun. The superior person, in accordance with this, supports people and things with their great virtue.
@@ -85,10 +133,12 @@ Koun represents what is great and originating, penetrating, advantageous, correc
                 4:"""six: shows the symbol of a sack tied up. There will be no ground for blame or for praise. """,
                 5:"""six: shows the yellow lower garment. There will be great good fortune. """,
                 6:"""six: shows dragons fighting in the wild. Their blood is purple and yellow."""
-})
+}
+def in2data():
+        return BuildHtml(in2info())
 
-def in3data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id3data()",
+def in3info():
+        return { 'imgSrc':"pyching_idimage_data.id3data()",
                 'title':""" 3. T'oun / Difficult Beginnings""", 
                 'text':"""
 The trigram representing clouds and that representing thunder form T'oun. The superior person, in accordance with this, adjusts their measures of government as in sorting the threads of the warp and weft.
@@ -101,10 +151,12 @@ T'oun indicates that there can be great progress and success, and the advantage
                 4:"""six: shows a lady, the horses of whose chariot appear to be in retreat. She seeks, however, the help of those who seek her to be their wife. Advance will be fortunate, all will turn out advantageously. """,
                 5:"""nine: shows the difficulties in the way of the subject's dispensing the rich favours that might be expected from them. With firmness and correctness there will be good fortune in small things; but even with them, in great things there will be evil. """,
                 6:"""six: shows its subject with the horses of their chariot obliged to retreat, and weeping tears of blood in streams."""
-})
+}
+def in3data():
+        return BuildHtml(in3info())
 
-def in4data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id4data()",
+def in4info():
+        return { 'imgSrc':"pyching_idimage_data.id4data()",
                 'title':""" 4. Mong / The Immature""", 
                 'text':"""
 The trigram representing a mountain, and beneath it that for a spring issuing forth, form Mong. The superior person, in accordance with this, strives to be resolute in their conduct and nourishes their virtue.
@@ -117,10 +169,12 @@ Mong indicates that there will be progress and success. I do not go and seek the
                 4:"""six: shows that if one is bound to an ignorant person, there will be occasion for regret. """,
                 5:"""six: shows a simple person without experience. There will be good fortune. """,
                 6:"""nine: we see one smiting the ignorant youth. But no advantage will come from doing them an injury. Advantage would come from warding off injury from them."""
-})
+}
+def in4data():
+        return BuildHtml(in4info())
 
-def in5data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id5data()",
+def in5info():
+        return { 'imgSrc':"pyching_idimage_data.id5data()",
                 'title':""" 5. Hsu / The Obstacles""", 
                 'text':"""
 The trigram for clouds ascending over that for the sky, form Hsu. The superior person, in accordance with this, eats and drinks, feasts and enjoys themselves as if there were nothing else to employ them.
@@ -133,10 +187,12 @@ Hsu intimates that, with the sincerity which is declared in it, there will be br
                 4:"""six: shows its subject waiting in the place of blood. But they will get out of the cavern. """,
                 5:"""nine: shows its subject waiting amidst the appliances of a feast. Through their firmness and correctness there will be good fortune.""",
                 6:"""six: shows its subject entered into the cavern. But there are three guests coming, to help them, without being urged. If they receive them respectfully, there will be good fortune in the end."""
-})
+}
+def in5data():
+        return BuildHtml(in5info())
 
-def in6data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id6data()",
+def in6info():
+        return { 'imgSrc':"pyching_idimage_data.id6data()",
                 'title':""" 6. Song / The Conflict""", 
                 'text':"""
 The trigram representing heaven and that representing water, moving away from each other, form Song. The superior person, in accordance with this, in the transaction of affairs takes good counsel about their first steps.
@@ -149,10 +205,12 @@ Song intimates how, though there is sincerity in one's contention, they will mee
                 4:"""nine: shows its subject unequal to the contention. They return to the study of Heaven's ordinances, change their wish to contend and rest in being firm and correct. There will be good fortune. """,
                 5:"""nine: shows its subject contending; and with great good fortune.""",
                 6:"""nine: shows how its subject may have the leathern belt conferred on them by the sovereign, and thrice it shall be taken from them in a morning."""
-})
+}
+def in6data():
+        return BuildHtml(in6info())
 
-def in7data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id7data()",
+def in7info():
+        return { 'imgSrc':"pyching_idimage_data.id7data()",
                 'title':""" 7. Cheu / The Army""", 
                 'text':"""
 The trigram representing the earth and in the midst of it that representing water, form Cheu. The superior person, in accordance with this, nourishes and educates the people, and collects from among them the multitude of the armies.
@@ -165,10 +223,12 @@ Cheu indicates how, in the case which it purposes, with firmness and correctness
                 4:"""six: shows the army in retreat. There is no error. """,
                 5:"""six: shows birds in the fields, which it will be advantageous to seize and destroy. In that case there will be no error. If a learner leads the army, and inexperienced people idly occupy offices assigned to them, however firm and correct they may be, there will be evil. """,
                 6:"""six: shows the great ruler delivering their charges, appointing some to be rulers of states, and others to undertake the leadership of clans ; but inferior people should not be employed in such positions."""
-})
+}
+def in7data():
+        return BuildHtml(in7info())
 
-def in8data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id8data()",
+def in8info():
+        return { 'imgSrc':"pyching_idimage_data.id8data()",
                 'title':""" 8. Pi / Concord""", 
                 'text':"""
 The trigram representing the earth, and over it that representing water, form Pi. The ancient kings, in accordance with this, established the various states and maintained an affectionate relation to their leaders.
@@ -181,10 +241,12 @@ Pi indicates that under the conditions which it supposes, there is good fortune.
                 4:"""six: we see its subject seeking for union with the one beyond themself. With firm correctness there will be good fortune. """,
                 5:"""nine: affords the most illustrious instance of seeking union and attachment. We seem to see in it the king urging his pursuit of the game only in three directions, and allowing the escape of all the animals before him, while the people of his towns do not warn one another to prevent it. There will be good fortune. """,
                 6:"""six: we see one seeking union and attachment without having taken the first step to such an end. There will be evil."""
-})
+}
+def in8data():
+        return BuildHtml(in8info())
 
-def in9data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id9data()",
+def in9info():
+        return { 'imgSrc':"pyching_idimage_data.id9data()",
                 'title':""" 9. Siao Tch'ou / Accumulating Gradually""", 
                 'text':"""
 The trigram representing the sky, and that representing wind moving above it, form Siao Tch'ou. The superior person, in accordance with this, adorns the outward manifestation of their virtue.
@@ -197,10 +259,12 @@ Siao Tch'ou indicates that under its conditions there will be progress and succe
                 4:"""six: shows its subject possessed of sincerity. The danger of bloodshed is thereby averted, and grounds for apprehension dismissed. There will be no mistake.""",
                 5:"""nine: shows its subject possessed of sincerity, and drawing others to unite with them. Rich in resources, they employ their neighbours in the same cause with themselves. """,
                 6:"""nine: shows how the rain has fallen, and the onward progress is stayed; so must we value the full accumulation of the virtue represented by the upper trigram. But a wife exercising excessive restraint, however firm and correct she may be, is in a position of peril, and like the moon approaching to the full. If the superior person prosecutes their measures in such circumstances, there will be evil."""
-})
+}
+def in9data():
+        return BuildHtml(in9info())
 
-def in10data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id10data()",
+def in10info():
+        return { 'imgSrc':"pyching_idimage_data.id10data()",
                 'title':""" 10. Li / Careful Conduct""", 
                 'text':"""
 The trigram representing the sky above, and below it that representing the waters of a marsh, form Li. The superior person, in accordance with this, discriminates between high and low, and gives settlement to the aims of all people.
@@ -213,10 +277,12 @@ Li suggests the idea of one treading on the tail of a tiger, which does not bite
                 4:"""nine: shows its subject treading on the tail of a tiger. They become full of apprehensive caution, and in the end there will be good fortune.""",
                 5:"""nine: shows the resolute tread of its subject. Though they be firm and correct, there will be peril. """,
                 6:"""nine: tells us to look at the whole course that is trodden, and examine the presage which that gives. If it be complete and without failure, there will be great good fortune."""
-})
+}
+def in10data():
+        return BuildHtml(in10info())
 
-def in11data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id11data()",
+def in11info():
+        return { 'imgSrc':"pyching_idimage_data.id11data()",
                 'title':""" 11. T'ai / Peace, Restful Fluidity""", 
                 'text':"""
 The trigrams for heaven and earth in communication together form T'ai. The sage sovereign, in harmony with this, fashions and completes their regulations after the courses of heaven and earth, and assists the application of the adaptations furnished by them, in order to benefit the people.
@@ -229,10 +295,12 @@ In T'ai we see the small gone and the great coming. It indicates that there will
                 4:"""six: shows its subject fluttering down; not relying on their own rich resources, bur calling in their neighbours. They all come not as having received warning, but in the sincerity of their hearts. """,
                 5:"""six: reminds us of king Ti-yi's rule about the marriage of his younger sister. By such a course there is happiness and there will be great good fortune. """,
                 6:"""six: shows us the city wall returned into the moat. It is not the time to use the army. The subject of the line may, indeed, announce their orders to the people of their own city; but however correct and firm they may be, they will have cause for regret."""
-})
+}
+def in11data():
+        return BuildHtml(in11info())
 
-def in12data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id12data()",
+def in12info():
+        return { 'imgSrc':"pyching_idimage_data.id12data()",
                 'title':""" 12. P'i / Stagnation, Obstruction""", 
                 'text':"""
 The trigrams of heaven and earth, not in intercommunication, form P'i. The superior person, in accordance with this, restrains the manifestation of their virtue, and avoids the calamities that threaten them. There is no opportunity of conferring on them the glory of reward in their employment.
@@ -245,10 +313,12 @@ In P'i there is the want of good understanding between people at different level
                 4:"""nine: shows its subject acting in accordance with the ordination of Heaven, and committing no error. Their companions will come and share in their happiness.""",
                 5:"""nine: we see they who bring the distress and obstruction to a close, the person great and fortunate. But let them say, 'We may perish! We may perish !', so shall the state of things become firm, as if bound to a clump of bushy mulberry trees.""",
                 6:"""nine: shows the overthrow and removal of the condition of distress and obstruction. Before this there was that condition. Hereafter there will be joy."""
-})
+}
+def in12data():
+        return BuildHtml(in12info())
 
-def in13data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id13data()",
+def in13info():
+        return { 'imgSrc':"pyching_idimage_data.id13data()",
                 'title':""" 13. Tong Jen / Community""", 
                 'text':"""
 The trigrams for heaven and fire form Tong Jen. The superior person, in accordance with this, distinguishes things according to their kinds and levels.
@@ -261,10 +331,12 @@ Tong Jen or 'Community' appears here as we find it in the remote district of the
                 4:"""nine: shows its subject mounted on the city wall; but they do not proceed to make the attack they contemplate. There will be good fortune.""",
                 5:"""nine: the representative of the community first wails and cries out, and then laughs. Their great host conquers, and they and the subject of the second line meet together. """,
                 6:"""nine: shows the representative of the community in the suburbs. There will be no occasion for repentance."""
-})
+}
+def in13data():
+        return BuildHtml(in13info())
 
-def in14data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id14data()",
+def in14info():
+        return { 'imgSrc':"pyching_idimage_data.id14data()",
                 'title':""" 14. Ta You / Big Strength""", 
                 'text':"""
 The trigram for heaven and that of fire above it form Ta You. The superior person, in accordance with this, represses what is evil and gives distinction to what is good, in sympathy with the excellent Heaven-conferred nature.
@@ -277,10 +349,12 @@ Ta You indicates that, under the circumstances which it implies, there will be g
                 4:"""nine: shows its subject keeping their great resources under restraint. There will be no error. """,
                 5:"""six: shows the sincerity of its subject reciprocated by that of all the others represented in the hexagram. Let them display a proper majesty, and there will be good fortune.""",
                 6:"""nine: shows its subject with help accorded to them from Heaven. There will be good fortune, advantage in every respect."""
-})
+}
+def in14data():
+        return BuildHtml(in14info())
 
-def in15data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id15data()",
+def in15info():
+        return { 'imgSrc':"pyching_idimage_data.id15data()",
                 'title':""" 15. Tchien / Modesty""", 
                 'text':"""
 The trigram for the earth and that of a mountain in the midst of it form Tchien. The superior person, in accordance with this, diminishes what is excessive in their being, and improves where there is any defect, bringing about an equality, according to the nature of the case, in their treatment of themselves and others.
@@ -293,10 +367,12 @@ Tchien indicates progress and success. The superior person, being humble as it i
                 4:"""six: shows one, whose action would be in every way advantageous, bringing forth even more their humility. """,
                 5:"""six: shows one who, without bring rich, is able to employ their neighbours. He may advantageously use the force of arms. All their movements will be advantageous. """,
                 6:"""six: shows us humility that has made itself recognised. The subject of it will with advantage put their hosts in motion; but they will only punish their own towns and state."""
-})
+}
+def in15data():
+        return BuildHtml(in15info())
 
-def in16data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id16data()",
+def in16info():
+        return { 'imgSrc':"pyching_idimage_data.id16data()",
                 'title':""" 16. Yu / Majesty in Connection""", 
                 'text':"""
 The trigrams for the earth, and thunder issuing from it with its crashing noise, form Yu. The ancient kings, in accordance with this, composed their music and did honour to virtue, presenting it especially and most grandly to the supreme being, when they associated with it at the service of their highest ancestor and their parents.
@@ -309,10 +385,12 @@ Yu indicates that, in the state which it implies, feudal princes may be set up,
                 4:"""nine: shows they from whom harmony and satisfaction come. Great is the success which they obtain. Let them not allow suspicions to enter their mind, and thus friends will gather around them.""",
                 5:"""six: shows one with a chronic complaint, but who lives on without dying.""",
                 6:"""six: shows its subject with darkened mind devoted to the pleasure and satisfaction of the time; but if they change their course even when it may be considered as completed, there will be no error."""
-})
+}
+def in16data():
+        return BuildHtml(in16info())
 
-def in17data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id17data()",
+def in17info():
+        return { 'imgSrc':"pyching_idimage_data.id17data()",
                 'title':""" 17. Souei / Submission to the Duty""", 
                 'text':"""
 The trigram for the waters of a marsh and that for thunder hidden in the midst of it, form Souei. The superior person in accordance with this, when it is getting toward dark, enters their house and rests.
@@ -325,10 +403,12 @@ Souei indicates that under its conditions there will be great progress and succe
                 4:"""nine: shows us one followed, and obtaining adherents. Though they be firm and correct, there will be evil. If they be sincere however in their course, and make that evident, into what error can they fall? """,
                 5:"""nine: shows us the ruler sincere in fostering all that is excellent. There will be good fortune. """,
                 6:"""six: shows us sincerity firmly held and clung to, yea, and bound fast. We see the king with this presenting his offerings on the western mountain."""
-})
+}
+def in17data():
+        return BuildHtml(in17info())
 
-def in18data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id18data()",
+def in18info():
+        return { 'imgSrc':"pyching_idimage_data.id18data()",
                 'title':""" 18. Kou / Toward Corruption""",   
                 'text':"""
 The trigram for a mountain, and below it that for wind, form Kou. The superior person, in accordance with this, nourishes their own virtue and helps the people.
@@ -341,10 +421,12 @@ Kou indicates great progress and success to them who deals properly with the con
                 4:"""six: shows a child viewing indulgently the troubles caused by their father. If they go forward, they will find cause to regret it.""",
                 5:"""six: shows a child dealing with the troubles caused by their father. They obtain the praise of using the fit instrument for their work. """,
                 6:"""nine: shows us one who does not serve either king or feudal lord, whose lofty spirit prefers to attend to their own affairs."""
-})
+}
+def in18data():
+        return BuildHtml(in18info())
 
-def in19data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id19data()",
+def in19info():
+        return { 'imgSrc':"pyching_idimage_data.id19data()",
                 'title':""" 19. Lin / Approach""", 
                 'text':"""
 The trigram for the waters of a marsh and that for the earth above it form Lin. The superior person, in accordance with this, has their purpose of instruction that is inexhaustible, and which nourishes and supports the people without limit.
@@ -357,10 +439,12 @@ Lin indicates that under the conditions supposed in it there will be great progr
                 4:"""six: shows one advancing in the highest mode. There will be no error.""",
                 5:"""six: shows the advance of wisdom, such as befits the great ruler. There will be good fortune.""",
                 6:"""six: shows the advance of honesty and generosity. There will be good fortune, and no error.""",
-})
+}
+def in19data():
+        return BuildHtml(in19info())
 
-def in20data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id20data()",
+def in20info():
+        return { 'imgSrc':"pyching_idimage_data.id20data()",
                 'title':""" 20. Kouan / Looking Down""", 
                 'text':"""
 The trigrams representing the earth, and that for wind moving above it, form Kouan. The ancient kings, in accordance with this, examined the different regions of the kingdom, to see the ways of the people, and set forth their instructions.
@@ -373,10 +457,12 @@ Kouan shows how they whom it represents should be like the worshipper who has wa
                 4:"""six: shows one contemplating the glory of the kingdom. It will be advantageous for them, being such as they are, to seek to be a guest of the king.""",
                 5:"""nine: shows its subject contemplating their own life-course. Being a superior person, they will thus fall into no error. """,
                 6:"""nine: shows its subject contemplating their character to see if it is indeed that of a superior person. They will not fall into error."""
-})
+}
+def in20data():
+        return BuildHtml(in20info())
 
-def in21data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id21data()",
+def in21info():
+        return { 'imgSrc':"pyching_idimage_data.id21data()",
                 'title':""" 21. Che Ho / Bite Through""", 
                 'text':"""
 The trigrams representing thunder and lightning form Che Ho. The ancient kings, in accordance with this, framed their penalties with intelligence, and promulgated their laws.
@@ -389,10 +475,12 @@ Che Ho indicates successful progress in the condition of things which it suppose
                 4:"""nine: shows one gnawing the flesh dried on the bone, and getting the pledges of money and arrows. It will be advantageous to them to realise the difficulty of their task and be firm, in which case there will be good fortune. """,
                 5:"""six: shows one gnawing at the firm and correct, realising the peril of their position. There will be no error.""",
                 6:"""nine: shows one wearing the yoke, and deprived of their ears. There will be evil."""
-})
+}
+def in21data():
+        return BuildHtml(in21info())
 
-def in22data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id22data()",
+def in22info():
+        return { 'imgSrc':"pyching_idimage_data.id22data()",
                 'title':""" 22. Pi / Elegance""", 
                 'text':"""
 The trigram representing a mountain with that for fire under it form Pi. The superior person, in accordance with this, throws a brilliancy around their various processes of government, but does not dare in a similar way to decide cases of criminal litigation.
@@ -405,10 +493,12 @@ Pi indicates that there should be free course in what it denotes. There will be
                 4:"""six: shows one looking as if adorned, but only in white. As if mounted on a white horse, and furnished with wings, they seek union with the subject of the first line, while the intervening third pursues, not as a robber, but intent on a matrimonial alliance. """,
                 5:"""six: shows its subject adorned by the occupants of the heights and gardens. They bear their roll of silk, small and slight. They may appear stingy; but there will be good fortune in the end.""",
                 6:"""nine: has its subject with white as their only ornament. There will be no error."""
-})
+}
+def in22data():
+        return BuildHtml(in22info())
 
-def in23data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id23data()",
+def in23info():
+        return { 'imgSrc':"pyching_idimage_data.id23data()",
                 'title':""" 23. Po / Bursting""", 
                 'text':"""
 The trigram representing the earth, and above it that for a mountain which adheres to the earth, form Po. Superiors, in accordance with this, seek to strengthen those below them, to secure the peace and stability of their own position.
@@ -421,10 +511,12 @@ Po indicates that in the state which it symbolises it will not be advantageous t
                 4:"""six: shows its subject having overthrown the couch, and going to injure the skin of they who lie on it. There will be evil. """,
                 5:"""six: shows its subject leading on the others like a string of fishes, and obtaining for them the favour that lights on the inmates of the palace. There will be advantage in every way. """,
                 6:"""nine: shows as a great fruit which has not been eaten. The superior person finds the people again as a chariot carrying them. The small people by their course overthrow their own dwellings."""
-})
+}
+def in23data():
+        return BuildHtml(in23info())
 
-def in24data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id24data()",
+def in24info():
+        return { 'imgSrc':"pyching_idimage_data.id24data()",
                 'title':""" 24. Fou / The Return, Amendment""", 
                 'text':"""
 The trigram representing the earth, and that for thunder in the midst of it, form Fou. The ancient kings, in accordance with this, on the day of the winter solstice, shut the gates of the passes from one state to another, so that the travelling merchants could not then pursue their journeys, nor the princes go on with the inspection of their states.
@@ -437,10 +529,12 @@ Fou indicates that where will be free course and progress in what it denotes; th
                 4:"""six: shows its subject moving right in the centre among those represented by the other divided lines, and yet returning alone to their proper path.""",
                 5:"""six: shows the noble return of its subject. There will be no ground for repentance. """,
                 6:"""six: shows its subject all astray on the subject of returning. There will be evil. There will be calamities and errors. If with their views they put the hosts in motion, the end will be a great defeat, whose issues will extend to the ruler of the state. Even in ten years they will not they able to repair the disaster."""
-})
+}
+def in24data():
+        return BuildHtml(in24info())
 
-def in25data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id25data()",
+def in25info():
+        return { 'imgSrc':"pyching_idimage_data.id25data()",
                 'title':""" 25. Wou Wang / Integrity""", 
                 'text':"""
 The thunder rolls all under the sky, and to everything there is given its nature, free from all insincerity. The ancient kings, in accordance with this, made their regulations in complete accordance with the seasons, thereby nourishing all things.
@@ -453,10 +547,12 @@ Wou Wang indicates great progress and success, while there will be advantage in
                 4:"""nine: shows a case in which, if its subject can remain firm and correct, there will be no error. """,
                 5:"""nine: shows one who is free from insincerity, and yet has fallen ill. Let them not use medicine, and they will have occasion for joy in their recovery.""",
                 6:"""nine: shows its subject free from insincerity, yet sure to fall into error if they take action. Their action will not be advantageous in any way."""
-})
+}
+def in25data():
+        return BuildHtml(in25info())
 
-def in26data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id26data()",
+def in26info():
+        return { 'imgSrc':"pyching_idimage_data.id26data()",
                 'title':""" 26. Ta Tch'ou / The Great Accumulating""", 
                 'text':"""
 The trigram representing a mountain, and in the midst of it that representing heaven, form Ta Tch'ou. The superior person, in accordance with this, remembers the words and deeds of former people, to assist in the accumulation of their virtue.
@@ -469,10 +565,12 @@ Under the condition of Ta Tch'ou it will be advantageous to be firm and correct.
                 4:"""six: shows the young bull, yet it has a piece of wood over its horns. """,
                 5:"""six: shows the teeth of a castrated hog. There will be good fortune. """,
                 6:"""nine: shows itself in command of the firmament of heaven. There will be progress."""
-})
+}
+def in26data():
+        return BuildHtml(in26info())
 
-def in27data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id27data()",
+def in27info():
+        return { 'imgSrc':"pyching_idimage_data.id27data()",
                 'title':""" 27. I / Nourishment""", 
                 'text':"""
 The trigram representing a mountain, and under it that for thunder, form I. The superior person, in accordance with this, enjoins watchfulness over our words, and the temperate regulation of our eating and drinking.
@@ -485,10 +583,12 @@ I indicates that with firm correctness there will be good fortune in what is den
                 4:"""six: looks downwards like a tiger for the power to nourish. There will be good fortune. Looking with a tiger's downward unwavering glare, and with their desire that impels them to spring after spring, they will fall into no error.""",
                 5:"""six: shows one acting contrary to what is regular and proper; but if they abide in firmness, there will be good fortune. They should not, however, try to cross the great stream.""",
                 6:"""nine: shows they from whom comes the nourishing. One's position is perilous, but there will be good fortune. It will be advantageous to cross the great stream."""
-})
+}
+def in27data():
+        return BuildHtml(in27info())
 
-def in28data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id28data()",
+def in28info():
+        return { 'imgSrc':"pyching_idimage_data.id28data()",
                 'title':""" 28. Ta Kouo / Excess""", 
                 'text':"""
 The trigram representing trees, hidden beneath that for the waters of a marsh, form Ta Kouo. The superior person, in accordance with this, stands up alone and has no fear, and stays retired from the world without regret.
@@ -501,10 +601,12 @@ Ta Kouo suggest to us a beam that is weak. There will be advantage in moving und
                 4:"""nine: shows a beam curving upwards. There will be good fortune. If the subject of it looks for support elsewhere, there will be cause for regret. """,
                 5:"""nine: shows a decayed willow producing flowers. There will be occasion neither for blame nor for praise. """,
                 6:"""six: shows its subject with extraordinary boldness wading through a stream, till the water hides the crown of their head. There will be evil, but no ground for blame."""
-})
+}
+def in28data():
+        return BuildHtml(in28info())
 
-def in29data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id29data()",
+def in29info():
+        return { 'imgSrc':"pyching_idimage_data.id29data()",
                 'title':""" 29. K'an / The Abyss, Danger""", 
                 'text':"""
 The representation of water flowing on continuously forms the repeated K'an. The superior person, in accordance with this, maintains constantly the virtue of their heart and the integrity of their conduct, and practises the business of instruction.
@@ -517,10 +619,12 @@ K'an, here repeated, shows the possession of sincerity, though which the mind is
                 4:"""six: shows its subject at a feast, with simply a bottle of spirits and a subsidiary basket of rice, while the cups and howls are only of earthenware. The important lessons are introduced as their ruler's intelligence admits. There will in the end be no error.""",
                 5:"""nine: shows the water of the abyss not yet full, so that it might flow away; but order will soon be brought about. There will be no error. """,
                 6:"""six: shows its subject bound with cords of three strands or two strands, and placed in a thicket of thorns. Still in three years they do not learn the course for them to pursue. There will be evil."""
-})
+}
+def in29data():
+        return BuildHtml(in29info())
 
-def in30data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id30data()",
+def in30info():
+        return { 'imgSrc':"pyching_idimage_data.id30data()",
                 'title':""" 30. Li / Strength and Beauty""", 
                 'text':"""
 The trigram for brightness, repeated, forms Li. The great person, in accordance with this, cultivates more and more their brilliant virtue, and diffuses its brightness over the four quarters of the land.
@@ -533,10 +637,12 @@ Li indicates that, in regard to what it denotes, it will be advantageous to be f
                 4:"""nine: shows the manner of its subject's arrival. How abrupt it is, as with fire, as with death, thus to be rejected by all. """,
                 5:"""six: shows one with tears flowing in torrents, and groaning in sorrow. There will be good fortune. """,
                 6:"""nine: shows the king employing the subject in his punitive expeditions. Achieving admirable merit, they break only the chief of the rebels. Where their prisoners were not their associates, they do not punish. There will be no error.""",
-})
+}
+def in30data():
+        return BuildHtml(in30info())
 
-def in31data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id31data()",
+def in31info():
+        return { 'imgSrc':"pyching_idimage_data.id31data()",
                 'title':""" 31. Hsien / Attraction""", 
                 'text':"""
 The trigram representing a mountain, and above it that for the waters of a marsh, form Hsien. The superior person, in accordance with this, keeps their mind free from pre-occupations, and open to receive the influence of others.
@@ -549,10 +655,12 @@ Hsien indicates that, on the fulfilment of the conditions implied in it, there w
                 4:"""nine: shows that they will be unsettled in their movements, only their friends will follow their purpose.""",
                 5:"""nine: shows one moving the flesh along the spine above the heart. There will be no occasion for repentance. """,
                 6:"""six: shows one moving their jaws and tongue."""
-})
+}
+def in31data():
+        return BuildHtml(in31info())
 
-def in32data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id32data()",
+def in32info():
+        return { 'imgSrc':"pyching_idimage_data.id32data()",
                 'title':""" 32. Hong / The Long Enduring""", 
                 'text':"""
 The trigram representing thunder and that for wind form Hong. The superior person, in accordance with this, stands firm, and does not change their method of operation.
@@ -565,10 +673,12 @@ Hong indicates successful progress and no error in what it denotes. But the adva
                 4:"""nine: shows a field where there is no game. """,
                 5:"""six: shows its subject continuously maintaining the virtue indicated by it. In a wife this will be fortunate; in a husband, evil.""",
                 6:"""six: shows its subject exciting themself to long continuance. There will be evil."""
-})
+}
+def in32data():
+        return BuildHtml(in32info())
 
-def in33data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id33data()",
+def in33info():
+        return { 'imgSrc':"pyching_idimage_data.id33data()",
                 'title':""" 33. Toun / Withdrawal""", 
                 'text':"""
 The trigram representing the sky, and below it that for a mountain, form Toun. The superior person, in accordance with this, keeps small people at distance, not showing that they dislike them, except by their own dignified gravity.
@@ -581,10 +691,12 @@ Toun indicates successful progress in its circumstances. To a small extent it wi
                 4:"""nine: shows its subject withdrawing, notwithstanding their likings. In a superior person this will lead to good fortune; a small person cannot attain to this. """,
                 5:"""nine: shows its subject withdrawing in an admirable way. With firm correctness there will be good fortune. """,
                 6:"""nine: shows its subject withdrawing in a noble way. It will be advantageous in every respect."""
-})
+}
+def in33data():
+        return BuildHtml(in33info())
 
-def in34data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id34data()",
+def in34info():
+        return { 'imgSrc':"pyching_idimage_data.id34data()",
                 'title':""" 34. Ta Tch'ouang / Big Strength""", 
                 'text':"""
 The trigram representing heaven, and above it that for thunder, form Ta Tch'ouang. The superior person, in accordance with this, does not take a step which is not according to propriety.
@@ -597,10 +709,12 @@ Ta Tch'ouang indicates that under the conditions which it symbolises it will be
                 4:"""nine: shows a case in which firm correctness leads to good fortune, and occasion for repentance disappears. We see the fence openned without the horns being entangled. The strength is like that in the wheel-spokes of a large waggon.""",
                 5:"""six: shows one who loses their ram-like strength in the ease of their position, but there will be no occasion for repentance.""",
                 6:"""six: shows one who may be compared to the ram butting against the fence, and unable either to retreat, or to advance as they would fain do. There will not be advantage in any respect; but if they realise the difficulty of their position, there will be good fortune."""
-})
+}
+def in34data():
+        return BuildHtml(in34info())
 
-def in35data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id35data()",
+def in35info():
+        return { 'imgSrc':"pyching_idimage_data.id35data()",
                 'title':""" 35. Tchin / Progress""", 
                 'text':"""
 The trigram representing the earth, and that for the bright sun coming forth above it, form Tchin. The superior person, according to this, gives themself to making more brilliant their bright virtue.
@@ -613,10 +727,12 @@ In Tchin we see a prince who secures the tranquillity of the people presented in
                 4:"""nine: shows its subject, however firm and correct they may be, in a position of peril.""",
                 5:"""six: shows how all occasion for repentance disappears from its subject, but let them not concern themselves about whether they shall fail or succeed. To advance will be fortunate, and in every way advantageous.""",
                 6:"""nine: shows one advancing their horns. But they only use them to punish the rebellious people of their own city. The position is perilous, but there will be good fortune. Still, however firm and correct they may be, there will be occasion for regret."""
-})
+}
+def in35data():
+        return BuildHtml(in35info())
 
-def in36data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id36data()",
+def in36info():
+        return { 'imgSrc':"pyching_idimage_data.id36data()",
                 'title':""" 36. Ming Yi / The Darkening of the Light""", 
                 'text':"""
 The trigram representing the earth, and that for the bright sun entering within it, form Ming Yi. The superior person, in accordance with this, conducts their management of people thusly; they show their intelligence by keeping it obscured.
@@ -629,10 +745,12 @@ Ming Yi indicates that in the circumstances which it denotes, it will be advanta
                 4:"""six: shows its subject just entered into the left side of the belly of the dark land. But they are able to carry out the attitude appropriate in the condition indicated by Ming Yi, quitting the gate and courtyard of the lord of darkness.""",
                 5:"""six: shows how a great person fulfilled the condition indicated by Ming Yi. It will be advantageous to be firm and correct. """,
                 6:"""six: shows the case where there is no light, but only obscurity. Its subject had at first ascended to the top of the sky; their future shall be to go into the earth."""
-})
+}
+def in36data():
+        return BuildHtml(in36info())
 
-def in37data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id37data()",
+def in37info():
+        return { 'imgSrc':"pyching_idimage_data.id37data()",
                 'title':""" 37. Tchia Jen / The Family""", 
                 'text':"""
 The trigram representing fire, and that for wind coming forth from it, form Tchia Jen. The superior person, in accordance with this, orders their word according to the truth of things, and their conduct so that it is uniformly consistent.
@@ -645,10 +763,12 @@ For the realisation of what is taught in Tchia Jen, or for the regulation of the
                 4:"""six: shows its subject enriching the family. There will be great good fortune.""",
                 5:"""nine: shows the influence of the king extending to their family. There need be no anxiety; there will be good fortune. """,
                 6:"""nine: shows its subject possessed of sincerity and arrayed in majesty. In the end there will be good fortune."""
-})
+}
+def in37data():
+        return BuildHtml(in37info())
 
-def in38data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id38data()",
+def in38info():
+        return { 'imgSrc':"pyching_idimage_data.id38data()",
                 'title':""" 38. K'ouei / Opposition""", 
                 'text':"""
 The trigram representing fire above, and that for the waters of a marsh below, form K'ouei. The superior person, in accordance with this, where there is a general agreement, yet admits diversity.
@@ -661,10 +781,12 @@ K'ouei indicates that, notwithstanding the condition of things which it denotes,
                 4:"""nine: shows its subject solitary amidst the prevailing disunion, but they meet with the good person represented by the first line, and they blend their sincere desires together. The position is one of peril, but there will be no mistake.""",
                 5:"""six: shows that for its subject occasion for repentance will disappear. With their relative and minister they unite closely and readily as if they were biting through a piece of skin. When they go forward with this help, what error could there be? """,
                 6:"""nine: shows its subject solitary amidst the prevailing disunion. In the subject of the third line, they seem to see a pig bearing on its back a load of mud, or fancy there is a carrriage full of ghosts. They first bend their bow against them, and afterwards unbend it, for they discover that there is not an assailant to injure, but a near relative. Going forward, they shall meet with genial rain, and there will be good fortune."""
-})
+}
+def in38data():
+        return BuildHtml(in38info())
 
-def in39data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id39data()",
+def in39info():
+        return { 'imgSrc':"pyching_idimage_data.id39data()",
                 'title':""" 39. Tch'ien / Trouble""", 
                 'text':"""
 The trigram representing a mountain, and above it that for water, form Tch'ien. The superior person, in accordance with this, turns round and examines themself, and cultivates their virtue.
@@ -677,10 +799,12 @@ In the state indicated by Tch'ien advantage will be found in the south-west, and
                 4:"""six: shows its subject advancing, but only to greater difficulties. They remain stationary, and unite with the subject of the line above.""",
                 5:"""nine: shows its subject struggling with the greatest difficulties, while friends are coming to help them. """,
                 6:"""six: shows its subject going forward, only to increase the difficulties, while their remaining stationary will be productive of great merit. There will be good fortune, and it will be advantageous to meet with the great person."""
-})
+}
+def in39data():
+        return BuildHtml(in39info())
 
-def in40data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id40data()",
+def in40info():
+        return { 'imgSrc':"pyching_idimage_data.id40data()",
                 'title':""" 40. Tchieh / The Release, The Outcome""", 
                 'text':"""
 The trigram representing thunder and that for rain, with these phenomena in a state of manifestation, form Tchieh. The superior person, in accordance with this, forgives errors, and deals gently with crimes.
@@ -693,10 +817,12 @@ In the state indicated by Tchieh advantage will be found in the south-west. If n
                 4:"""nine: says of its subject, 'Remove your toes. Friends will then come, between you and they there will be mutual confidence.'""",
                 5:"""six: shows its subject, the superior person, executing their function of removing whatever is injurious to the idea of the hexagram, in which case there will be good fortune, and confidence in them will be shown even by the small people. """,
                 6:"""six: shows a feudal prince with their bow shooting at a falcon on the top of a high wall, and hitting it. The effect of their action will be in every way advantageous."""
-})
+}
+def in40data():
+        return BuildHtml(in40info())
 
-def in41data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id41data()",
+def in41info():
+        return { 'imgSrc':"pyching_idimage_data.id41data()",
                 'title':""" 41. Soun / Reduction""", 
                 'text':"""
 The trigram representing a mountain, and beneath it that for the waters of a marsh, form Soun. The superior person, in accordance with this, restrains their wrath and controls their desires.
@@ -709,10 +835,12 @@ In what is denoted by Soun, if there be sincerity in they who employs it, there
                 4:"""six: shows its subject diminishing the ailment under which they labour by making the subject of the first line hasten to their help, and making them glad. There will be no error. """,
                 5:"""six: shows parties adding to the stores of its subject ten pairs of tortoise shells, and accepting no refusal. There will be great good fortune.""",
                 6:"""nine: shows its subject giving increase to others without taking from themselves. There will be no error. With firm correctness there will be good fortune. There will be advantage in every movement that shall be made. They will find ministers more than can be counted by their clans."""
-})
+}
+def in41data():
+        return BuildHtml(in41info())
 
-def in42data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id42data()",
+def in42info():
+        return { 'imgSrc':"pyching_idimage_data.id42data()",
                 'title':""" 42. Yi / Increase""", 
                 'text':"""
 The trigram representing wind and that for thunder form Yi. The superior person, in accordance with this, when they see what is good, moves towards it; and when they see their errors, they turn from them.
@@ -725,10 +853,12 @@ Yi indicates that in the state which it denotes there will be advantage in every
                 4:"""six: shows its subject pursuing the due course. Their advice to their prince is followed. They can with advantage be relied on in such a movement as that of removing the capital. """,
                 5:"""nine: shows its subject with sincere heart seeking to benefit all below. There need be no question about it; the result will be great good fortune. All below will with sincere heart acknowledge their goodness. """,
                 6:"""nine: we see one to whose increase none will contribute, while persons will seek to assail them. They observe no regular rule in the ordering of their heart. There will be evil."""
-})
+}
+def in42data():
+        return BuildHtml(in42info())
 
-def in43data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id43data()",
+def in43info():
+        return { 'imgSrc':"pyching_idimage_data.id43data()",
                 'title':""" 43. Kouai / Resolution""", 
                 'text':"""
 The trigram representing heaven, and that for the waters of a marsh mounting above it, form Kouai. The superior person, in accordance with this, bestows emoluments on those below them, and dislike allowing their gifts to accumulate undispensed.
@@ -741,10 +871,12 @@ Kouai requires in those who would fulfil its meaning the exhibition of the culpr
                 4:"""nine: shows one from whose buttocks the skin has been stripped, and who walks slowly and with difficulty. If they could act like a sheep led after its companions, occasion for repentance would disappear.  But though they hear these words, they will not believe them.""",
                 5:"""nine: shows the small men like a bed of weeds, which ought to be uprooted with the utmost determination. If the subject of the line has such determination, their action, in harmony with their central position, will lead to no error or blame. """,
                 6:"""six: shows its subject without any helpers on whom to call. Their end will be evil."""
-})
+}
+def in43data():
+        return BuildHtml(in43info())
 
-def in44data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id44data()",
+def in44info():
+        return { 'imgSrc':"pyching_idimage_data.id44data()",
                 'title':""" 44. Keou / Contacting""", 
                 'text':"""
 The trigram representing wind, and that for the sky above it, form Keou. The sovereign, in accordance with this, delivers their charges, and promulgates their announcements throughout the four quarters of the kingdom.
@@ -757,10 +889,12 @@ Keou shows a subordinate who is bold and strong. It will not be good to partner
                 4:"""nine: shows its subject with their fish wallet, but no fish in it. This will give rise to evil. """,
                 5:"""nine: shows a medlar tree overspreading the gourd beneath it. If they keep their brilliant qualities concealed, a good issue will descend as from Heaven.""",
                 6:"""nine: shows its subject receiving others on their horns. There will be occasion for regret, but there will be no error."""
-})
+}
+def in44data():
+        return BuildHtml(in44info())
 
-def in45data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id45data()",
+def in45info():
+        return { 'imgSrc':"pyching_idimage_data.id45data()",
                 'title':""" 45. Ts'ouei / The Gathering""", 
                 'text':"""
 The trigram representing the earth, and that for the waters of a marsh raised above it, form Ts'ouei. The superior person, in accordance with this, has their weapons of war put in good repair, to be prepared against unforeseen contingencies.
@@ -773,10 +907,12 @@ In the state denoted by Ts'ouei, the king will repair to their ancestral temple.
                 4:"""nine: shows its subject in such a state that, if they be greatly fortunate, they will receive no blame. """,
                 5:"""nine: shows the union of all under its subject in the place of dignity. There will be no error. If any do not have confidence in them, let them see to it that their virtue be great, long-continued, and firmly correct, and all occasion for repentance will disappear. """,
                 6:"""six: shows its subject sighing and weeping; but there will be no error."""
-})
+}
+def in45data():
+        return BuildHtml(in45info())
 
-def in46data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id46data()",
+def in46info():
+        return { 'imgSrc':"pyching_idimage_data.id46data()",
                 'title':""" 46. Cheng / Promotion""", 
                 'text':"""
 The trigram representing wood, and that for the earth with the wood growing in the midst of it, form Cheng. The superior person, in accordance with this, pays careful attention to their virtue, and accumulates the small developments of it until it is high and great.
@@ -789,10 +925,12 @@ Cheng indicates that under its conditions there will be great progress and succe
                 4:"""six: shows its subject employed by the king to present their offerings on the mountain. There will be good fortune; there will be no mistake. """,
                 5:"""six: shows its subject firmly correct, and therefore enjoying good fortune. They ascend the stairs with all due ceremony. """,
                 6:"""six: shows its subject advancing upwards blindly. Advantage will be found in a ceaseless maintenance of firm correctness."""
-})
+}
+def in46data():
+        return BuildHtml(in46info())
 
-def in47data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id47data()",
+def in47info():
+        return { 'imgSrc':"pyching_idimage_data.id47data()",
                 'title':""" 47. K'oun / Weariness""", 
                 'text':"""
 The trigram representing a marsh, and below it for a defile, which has drained the other dry so that there is no water in it, form K'oun. The superior person, in accordance with this, will sacrifice their life in order to carry out their purpose.
@@ -805,10 +943,12 @@ In the condition denoted by K'oun there may yet be progress and success. For the
                 4:"""nine: shows its subject proceeding very slowly to help the subject of the first line, who is straitened by the carriage adorned with metal in front of them. There will be occasion for regret, but the end will be good. """,
                 5:"""nine: shows its subject with their nose and feet cut off. They are straitened by their ministers in their scarlet aprons. They are leisurely in their movements, however, and are satisfied. It will be well for them to be as sincere as in sacrificing to spiritual beings. """,
                 6:"""six: shows its subject straitened, as if bound with creepers; or in a high and dangerous position, and saying to themselves,  'If  I move, I shall repent it.' If they do repent of former errors, there will be good fortune in their going forward."""
-})
+}
+def in47data():
+        return BuildHtml(in47info())
 
-def in48data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id48data()",
+def in48info():
+        return { 'imgSrc':"pyching_idimage_data.id48data()",
                 'title':""" 48. Tsing / A Well""", 
                 'text':"""
 The trigram representing wood, and above it that for water, form Tsing. The superior person, in accordance with this, comforts the people, and stimulates them to mutual helpfulness.
@@ -821,10 +961,12 @@ Looking at Tsing, we think of how the site of a town may be changed, while the f
                 4:"""six: shows a well, the lining of which is well laid. There will be no error. """,
                 5:"""nine: shows a clear, limpid well, the waters from whose cold spring are freely drunk.""",
                 6:"""six: shows the water from the well brought to the top, which is not allowed to be covered. This suggests the idea of sincerity. There will be great good fortune."""
-})
+}
+def in48data():
+        return BuildHtml(in48info())
 
-def in49data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id49data()",
+def in49info():
+        return { 'imgSrc':"pyching_idimage_data.id49data()",
                 'title':""" 49. Keu / The Revolution""", 
                 'text':"""
 The trigram representing the waters of a marsh, and that for fire in the midst of them, form Keu. The superior person, in accordance with this, regulates their astronomical calculations, and makes clear the seasons and times.
@@ -837,10 +979,12 @@ What takes place as indicated by Keu is believed in only after it has been accom
                 4:"""nine: shows occasion for repentance disappearing from its subject. Let them be believed in; and though they change existing ordinances, there will be good fortune. """,
                 5:"""nine: shows the great person producing their changes as the tiger does when it changes its stripes. Before they divine and proceed to action, faith has been reposed in them. """,
                 6:"""six: shows the superior person producing their changes as the leopard does when it changes its spots, while small people change their faces and show their obedience. To go forward now would lead to evil, but there will be good fortune in abiding in the firm and correct."""
-})
+}
+def in49data():
+        return BuildHtml(in49info())
 
-def in50data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id50data()",
+def in50info():
+        return { 'imgSrc':"pyching_idimage_data.id50data()",
                 'title':""" 50. Ting / The Cauldron""", 
                 'text':"""
 The trigram representing wood, and above it that for fire, form Ting. The superior person, in accordance with this, keeps their every position correct, and maintains secure the appointment of Heaven.
@@ -853,10 +997,12 @@ Ting gives the intimation of great progress and success.
                 4:"""nine: shows the caldron with its feet broken; and its contents, designed for the ruler's use, overturned and spilt. Its subject will be made to blush for shame. There will be evil. """,
                 5:"""six: shows the caldron with yellow ears and rings of metal in them. There will be advantage through being firm and correct. """,
                 6:"""nine: shows the caldron with rings of jade. There will be great good fortune, and all action taken will be in every way advantageous."""
-})
+}
+def in50data():
+        return BuildHtml(in50info())
 
-def in51data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id51data()",
+def in51info():
+        return { 'imgSrc':"pyching_idimage_data.id51data()",
                 'title':""" 51. Tchen / The Thunder""", 
                 'text':"""
 The trigram representing thunder, being repeated, forms Tchen. The superior person, in accordance with this, is fearful and apprehensive, cultivates their virtues, and examines their faults.
@@ -869,10 +1015,12 @@ Tchen gives the intimation of ease and development. When the time of movement wh
                 4:"""nine: shows its subject amid the startling movements, supinely sinking deeper in the mud. """,
                 5:"""six: shows its subject going and coming amidst the startling movements of the time, and always in peril, but perhaps they will not incur loss, and find business which they can accomplish. """,
                 6:"""six: shows its subject, amidst the startling movements of the time, in breathless dismay and looking round them with trembling apprehension. If they take action, there will be evil. If, while the startling movements have not reached their own person and their neighbourhood, they were to take precautions, there would be no error, but their relatives might still speak against them."""
-})
+}
+def in51data():
+        return BuildHtml(in51info())
 
-def in52data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id52data()",
+def in52info():
+        return { 'imgSrc':"pyching_idimage_data.id52data()",
                 'title':""" 52. Ken / The Stilling, The Mountain""", 
                 'text':"""
 Two trigrams representing a mountain, one over the other, form Ken. The superior person, in accordance with this, does not go in their thoughts beyond the duties of the position in which they are.
@@ -885,10 +1033,12 @@ When one's resting is like that of the back, and they lose all consciousness of
                 4:"""six: shows its subject keeping their trunk at rest. There will be no error.""",
                 5:"""six: shows its subject keeping their jawbones at rest, so that their words are all orderly. Occasion for repentance will disappear. """,
                 6:"""nine: shows its subject devotedly maintaining their restfulness. There will be good fortune."""
-})
+}
+def in52data():
+        return BuildHtml(in52info())
 
-def in53data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id53data()",
+def in53info():
+        return { 'imgSrc':"pyching_idimage_data.id53data()",
                 'title':""" 53. Tchien / Gradual Progress""", 
                 'text':"""
 The trigram representing a mountain, and above it that for a tree, form Tchien. The superior person, in accordance with this, attains to and maintains their extraordinary virtue, and makes the manners of the people good.
@@ -901,10 +1051,12 @@ Tchien suggest to us the marriage of a young lady, and the good fortune attendin
                 4:"""six: shows the geese gradually advanced to the trees. They may light on the flat branches. There will be no error. """,
                 5:"""nine: shows the geese gradually advanced to a high mound. It suggests the idea of a wife who for three years does not become pregnant; but in the end the natural issue cannot they prevented. There will be good fortune. """,
                 6:"""nine: shows the geese gradually advanced to the large heights beyond. Their feathers can be used as ornaments. There will be good fortune."""
-})
+}
+def in53data():
+        return BuildHtml(in53info())
 
-def in54data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id54data()",
+def in54info():
+        return { 'imgSrc':"pyching_idimage_data.id54data()",
                 'title':""" 54. Kouei Mei / The Marriageable Maiden""", 
                 'text':"""
 The trigram representing the waters of a marsh, and over it that for thunder, form Kouei Mei. The superior person, in accordance with this, having regard to the far distant end, knows the mischief that may be done at the beginning.
@@ -917,10 +1069,12 @@ Kouei Mei indicates that under the conditions which it denotes action will be ev
                 4:"""nine: shows the younger sister who is to be married off protracting the time. She may be late in being married, but the time will come.""",
                 5:"""six: reminds us of the marrying of the younger sister of the king, when the sleeves of the princess were not equal to those of the still younger sister who accompanied her in an inferior capacity. The case suggests the thought of the moon almost full. There will be good fortune. """,
                 6:"""six: shows the young lady bearing the basket, but without anything in it, and the gentleman slaughtering the sheep, but without blood flowing from it. There will be no advantage in any way."""
-})
+}
+def in54data():
+        return BuildHtml(in54info())
 
-def in55data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id55data()",
+def in55info():
+        return { 'imgSrc':"pyching_idimage_data.id55data()",
                 'title':""" 55. Fong / Abundance, Fullness""", 
                 'text':"""
 The trigrams representing thunder and lightning combine to form Fong. The superior person, in accordance with this, decides cases of litigation, and apportions punishments with exactness.
@@ -933,10 +1087,12 @@ Fong intimates progress and development. When a king has reached the point which
                 4:"""nine: shows its subject in a tent so large and thick that at midday they can see from it the constellation of the Bushel. But they meet with the subject of the first line, as nine like themselves. There will be good fortune. """,
                 5:"""six: shows its subject bringing around them people of brilliant ability. There will be occasion for congratulation and praise. There will be good fortune.""",
                 6:"""six: shows its subject with their house made large, but only serving as a screen to their household. When they look at their door, it is still, and there is nobody about it. For three years no one is to be seen. There will be evil."""
-})
+}
+def in55data():
+        return BuildHtml(in55info())
 
-def in56data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id56data()",
+def in56info():
+        return { 'imgSrc':"pyching_idimage_data.id56data()",
                 'title':""" 56. Lu / The Traveler""", 
                 'text':"""
 The trigram representing a mountain, and above it that for fire, form Lu. The superior person, in accordance with this, exerts their wisdom and caution in the use of punishments and in not allowing litigations to continue.
@@ -949,10 +1105,12 @@ Lu intimates that in the condition which it denotes there may be some little att
                 4:"""nine: shows the traveller in a resting-place, having also the means of livelihood and the axe, but still saying, ' I am not at ease in my mind.' """,
                 5:"""six: shows its subject shooting a pheasant. They will lose their arrow, but in the end they will obtain praise and a high charge. """,
                 6:"""nine: suggests the idea of a bird burning its nest. The stranger, thus represented, first laughs and then cries out. They have lost their ox-like docility too readily and easily. There will be evil."""
-})
+}
+def in56data():
+        return BuildHtml(in56info())
 
-def in57data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id57data()",
+def in57info():
+        return { 'imgSrc':"pyching_idimage_data.id57data()",
                 'title':""" 57. Hsuan / Willing Submission, The Wind""", 
                 'text':"""
 The two trigrams representing wind, following each other, form Hsuan. The superior person, in accordance with this, reiterates their orders, and secures the practice of their affairs.
@@ -965,10 +1123,12 @@ Hsuan intimates that under the conditions which it denotes there will be some li
                 4:"""six: shows all occasion for repentance in its subject passed away. They take game for its threefold use in their hunting. """,
                 5:"""nine: shows that with firm correctness there will be good fortune for its subject. All occasion for repentance will disappear, and all their movements will be advantageous. There may have been no good beginning, but there will be a good end. Three days before making any changes, let them give notice of them; and three days after, let them reconsider them. There will thus be good fortune. """,
                 6:"""nine: shows the representative of Hsuan beneath a couch, and having lost the axe with which they executed their decisions. However firm and correct they may try to they, there will be evil."""
-})
+}
+def in57data():
+        return BuildHtml(in57info())
 
-def in58data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id58data()",
+def in58info():
+        return { 'imgSrc':"pyching_idimage_data.id58data()",
                 'title':""" 58. Touei / Happyness, The Lake""", 
                 'text':"""
 Two symbols representing the waters of a marsh, one over the other, form Touei. The superior person, in accordance with this, encourages the conversation of friends and the stimulus of their common practice.
@@ -981,10 +1141,12 @@ Touei intimates that under its conditions there will be progress and attainment,
                 4:"""nine: shows its subject deliberating about what to seek their pleasure in, and not at rest. They border on what would be injurious, but there will be cause for joy. """,
                 5:"""nine: shows its subject trusting in one who would injure them. The situation is perilous. """,
                 6:"""six: shows the pleasure of its subject in leading and attracting others."""
-})
+}
+def in58data():
+        return BuildHtml(in58info())
 
-def in59data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id59data()",
+def in59info():
+        return { 'imgSrc':"pyching_idimage_data.id59data()",
                 'title':""" 59. Houan / The Dissolution, The Scattering""", 
                 'text':"""
 The trigram representing water, and that for wind moving above the water, form Houan. The ancient kings, in accordance with this, presented offerings to the deity and established the ancestral temple.
@@ -997,10 +1159,12 @@ Houan intimates that under its conditions there will be progress and success. Th
                 4:"""six: shows its subject scattering the different parties in the the state; which leads to great good fortune. From the dispersion they collect again good people standing out, a crowd like a mound, which is what ordinary folk would not have thought of. """,
                 5:"""nine: shows its subject amidst the dispersion issuing their great announcements as the perspiration flows from their body. They scatter abroad also the accumulation in the royal granaries. There will be no error. """,
                 6:"""nine: shows its subject disposing of what may be called its bloody wounds, and going and separating themselves from their anxious fears. There will be no error."""
-})
+}
+def in59data():
+        return BuildHtml(in59info())
 
-def in60data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id60data()",
+def in60info():
+        return { 'imgSrc':"pyching_idimage_data.id60data()",
                 'title':""" 60. Tchieh / Limitation""", 
                 'text':"""
 The trigram representing a lake, and above it that for water, form Tchieh. The superior person, in accordance with this, constructs their methods of numbering and measurement, and discusses points of virtue and conduct.
@@ -1013,10 +1177,12 @@ Tchieh intimates that under its conditions there will be progress and attainment
                 4:"""six: shows its subject quietly and naturally attentive to all regulations. There will be progress and success. """,
                 5:"""nine: shows its subject sweetly and acceptably enacting their regulations. There will be good fortune. Their onward progress will afford grounds for admiration. """,
                 6:"""six: shows its subject enacting regulations severe and difficult. Even with Firmness and correctness there will be evil. But though there will be cause for repentance, it will by and by disappear."""
-})
+}
+def in60data():
+        return BuildHtml(in60info())
 
-def in61data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id61data()",
+def in61info():
+        return { 'imgSrc':"pyching_idimage_data.id61data()",
                 'title':""" 61. Tchong Fou / The Interior Truth""", 
                 'text':"""
 The trigram representing the waters of a marsh, and that for wind above it, form Tchong Fou. The superior person, in accordance with this, deliberates about causes of litigations and delays the infliction of death.
@@ -1029,10 +1195,12 @@ Tchong Fou moves even pigs and fish, and leads to good fortune. There will be ad
                 4:"""six: shows its subject like the moon nearly full, and like a horse in a chariot whose fellow disappears. There will be no error. """,
                 5:"""nine: shows its subject perfectly sincere, and linking others to them in closest union. There will be no error. """,
                 6:"""nine: shows its subject on a rooster trying to mount to heaven. Even with firm correctness there will be evil."""
-})
+}
+def in61data():
+        return BuildHtml(in61info())
 
-def in62data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id62data()",
+def in62info():
+        return { 'imgSrc':"pyching_idimage_data.id62data()",
                 'title':""" 62. Siao Kouo / The Small Get By""", 
                 'text':"""
 The trigram representing a hill, and that for thunder above it, form Siao Kouo. The superior person, in accordance with this, in their conduct exceeds in humility, in mourning exceeds in sorrow, and their expenditure exceeds in economy.
@@ -1045,10 +1213,12 @@ Siao Kouo indicates that in the circumstances which it implies there will be pro
                 4:"""nine: shows its subject falling into no error, but meeting the exigency of their situation, without exceeding in their natural course. If they go forward, there will be peril, and they must they cautious. There is no occasion for their using firmness perpetually. """,
                 5:"""six: suggests the idea of being in the west. It also shows the prince shooting their arrow, and taking the bird in a cave. """,
                 6:"""six: shows its subject not meeting the exigency of their situation, and exceeding their proper course. It suggests the idea of a bird flying far aloft. There will be evil. The case is one of calamity and self-produced injury."""
-})
+}
+def in62data():
+        return BuildHtml(in62info())
 
-def in63data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id63data()",
+def in63info():
+        return { 'imgSrc':"pyching_idimage_data.id63data()",
                 'title':""" 63. Tchi Tchi / After The Achievement""", 
                 'text':"""
 The trigram representing fire, and that for water above it, form Tchi Tchi. The superior person, in accordance with this, thinks of evil that may come, and beforehand guards against it.
@@ -1061,10 +1231,12 @@ Tchi Tchi intimates progress and success in small matters. There will be advanta
                 4:"""six: shows its subject with rags provided against any leak in their boat, and on their guard all day long. """,
                 5:"""nine: shows  the neighbour in the east who slaughters an ox for their sacrifice; but this is not equal to the small spring sacrifice of the neighbour in the west, whose sincerity receives the blessing. """,
                 6:"""six: shows its subject with even their head immersed. The position is perilous."""
-})
+}
+def in63data():
+        return BuildHtml(in63info())
 
-def in64data():
-        return BuildHtml({ 'imgSrc':"pyching_idimage_data.id64data()",
+def in64info():
+        return { 'imgSrc':"pyching_idimage_data.id64data()",
                 'title':""" 64. Wei Tchi / Before The Achievement""", 
                 'text':"""
 The trigram representing water, and that for fire above it, form Wei Tchi. The superior person, in accordance with this, carefully discriminates among the qualities of things, and the different positions they naturally occupy.
@@ -1077,6 +1249,8 @@ Wei Tchi intimates progress and success in the circumstances which it implies. W
                 4:"""nine: shows its subject by firm correctness obtaining good fortune, so that all occasion for repentance disappears. Let them stir themselves up, as if they were invading the Demon region, where for three years rewards will come to them and their troops from the great kingdom. """,
                 5:"""six: shows its subject by firm correctness obtaining good fortune, and having no occasion for repentance. We see in them the brightness of a superior person, and the possession of sincerity. There will be good fortune. """,
                 6:"""nine: shows its subject full of confidence and therefore feasting quietly. There will be no error. But if they cherish this confidence, till they are like the fox who gets their head immersed, it will fail of what is right."""
-})
+}
+def in64data():
+        return BuildHtml(in64info())
 
 ### end of module
@@ -31,6 +31,8 @@ Provides a text-based I Ching oracle experience
 import sys
 import os
 import re
+import time
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
 from typing import Optional
@@ -86,6 +88,12 @@ def html_to_text(html_string: str) -> str:
     return parser.get_text()
 
 
+@lru_cache(maxsize=128)
+def hexagram_text(number: str) -> str:
+    """Return the plain text interpretation of a hexagram, converted once and memoized"""
+    return html_to_text(getattr(pyching_int_data, f'in{number}data')())
+
+
 def print_banner() -> None:
     """Display the pyChing console banner"""
     pyching = pyching_engine.PychingAppDetails(createConfigDir=0)
@@ -178,10 +186,8 @@ def display_interpretation(hexes: pyching_engine.Hexagrams) -> None:
     print("-" * 70)
 
     try:
-        # Get the HTML data for hexagram 1
-        hex1_func = getattr(pyching_int_data, f'in{hexes.hex1.number}data')
-        hex1_html = hex1_func()
-        hex1_text = html_to_text(hex1_html)
+        # Get the text for hexagram 1
+        hex1_text = hexagram_text(hexes.hex1.number)
 
         # Wrap text to 70 columns
         print(wrap_text(hex1_text, 70))
@@ -195,9 +201,7 @@ def display_interpretation(hexes: pyching_engine.Hexagrams) -> None:
         print("-" * 70)
 
         try:
-            hex2_func = getattr(pyching_int_data, f'in{hexes.hex2.number}data')
-            hex2_html = hex2_func()
-            hex2_text = html_to_text(hex2_html)
+            hex2_text = hexagram_text(hexes.hex2.number)
 
             print(wrap_text(hex2_text, 70))
         except Exception as e:
@@ -329,51 +333,100 @@ def new_reading() -> None:
     save_reading(hexes)
 
 
+LOAD_PAGE_SIZE = 20  # saved readings listed per page
+LOAD_SORT_ORDERS = ('date', 'name', 'hexagram', 'question')  # cycled by the 's' command
+
+
+def format_save_entry(number: int, entry: pyching_engine.SaveEntry) -> str:
+    """Format one saved reading as a line of the load listing"""
+    if entry.timestamp:
+        date = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.timestamp))
+    else:
+        date = '(undated)'
+    if entry.currentLine is None: #a legacy save file, only known once loaded
+        hexagrams = "?"
+    elif entry.currentLine < 6:
+        hexagrams = f"{entry.currentLine}/6 lines"
+    elif entry.hex2:
+        hexagrams = f"{entry.hex1} -> {entry.hex2}"
+    else:
+        hexagrams = str(entry.hex1)
+    question = entry.question or '(no question)'
+    if len(question) > 36:
+        question = question[:35] + '…'
+    return f"  {number:>4}. {date:<16}  {hexagrams:<9}  {question:<36}  {entry.name}"
+
+
 def load_reading() -> None:
-    """Load and display a saved reading"""
+    """Load and display a saved reading, listed from the cached save index"""
     pyching = pyching_engine.PychingAppDetails()
 
     print(f"\nReadings are stored in: {pyching.savePath}")
 
-    # List available save files
+    # List available save files, only new or changed files are read
     try:
-        files = [f.name for f in pyching.savePath.iterdir()
-                if f.is_file() and f.name.endswith(pyching.saveFileExt)]
+        index = pyching_engine.SaveIndex(pyching.savePath, pyching.saveIndexFile)
+        index.refresh()
+        sort = LOAD_SORT_ORDERS[0]
+        readings = index.readings(sort)
 
-        if not files:
+        if not readings:
             print("No saved readings found.")
             return
 
-        print("\nAvailable readings:")
-        for i, filename in enumerate(files, 1):
-            print(f"  {i}. {filename}")
+        page = 0
+        pages = (len(readings) + LOAD_PAGE_SIZE - 1) // LOAD_PAGE_SIZE
+        while True:
+            first = page * LOAD_PAGE_SIZE
+            print(f"\nAvailable readings, by {sort} (page {page + 1} of {pages}):")
+            for i, entry in enumerate(readings[first:first + LOAD_PAGE_SIZE], first + 1):
+                print(format_save_entry(i, entry))
+
+            print()
+            try:
+                choice = input("Enter number to load, n/p for next/previous page, "
+                               "s to change order (or press ENTER to cancel): ").strip().lower()
+            except (EOFError, KeyboardInterrupt):
+                print("\nCancelled.")
+                return
+
+            if not choice:
+                return
+            if choice == 'n':
+                page = min(page + 1, pages - 1)
+            elif choice == 'p':
+                page = max(page - 1, 0)
+            elif choice == 's':
+                sort = LOAD_SORT_ORDERS[(LOAD_SORT_ORDERS.index(sort) + 1) % len(LOAD_SORT_ORDERS)]
+                readings = index.readings(sort, reverse=(sort == 'date'))
+                page = 0
+            else:
+                break
 
-        print()
         try:
-            choice = input("Enter number to load (or press ENTER to cancel): ").strip()
-        except (EOFError, KeyboardInterrupt):
-            print("\nCancelled.")
+            file_index = int(choice) - 1
+        except ValueError:
+            print("Invalid input. Please enter a number.")
             return
-
-        if not choice:
+        if not 0 <= file_index < len(readings):
+            print("Invalid selection.")
             return
+        filepath = pyching.savePath / readings[file_index].name
 
+        # Load the reading
+        hexes = pyching_engine.Hexagrams()
         try:
-            file_index = int(choice) - 1
-            if 0 <= file_index < len(files):
-                filepath = pyching.savePath / files[file_index]
-
-                # Load the reading
-                hexes = pyching_engine.Hexagrams()
-                hexes.Load(filepath)
+            hexes.Load(filepath)
+        except OSError as e:
+            print(f"Unable to read save file {filepath.name}: {e}")
+            return
+        except Exception as e: #changed since it was listed, and no longer a save file
+            print(f"The save file {filepath.name} is damaged and can't be loaded ({e}).")
+            return
 
-                # Display it
-                display_reading(hexes)
-                display_interpretation(hexes)
-            else:
-                print("Invalid selection.")
-        except ValueError:
-            print("Invalid input. Please enter a number.")
+        # Display it
+        display_reading(hexes)
+        display_interpretation(hexes)
     except FileNotFoundError:
         print(f"Directory not found: {pyching.savePath}")
     except Exception as e:
@@ -726,6 +726,9 @@ EWNBU5A6lhkJgkUJkxRxVXDIssrLkCYKAAA7"""
             #print '\n error: unable to write save file', fileName
             tkMessageBox.showerror(title='File Error',
                             message='Unable to write save file:\n'+fileName)
+        except ValueError as error: #the reading can't be stored in a save file
+            tkMessageBox.showerror(title='Save Error',
+                            message='Unable to save this reading:\n'+str(error))
         else:
             #print '\n saved file:', fileName
             self.labelStatus.configure(text='saved reading: '+fileName)
@@ -741,24 +744,27 @@ EWNBU5A6lhkJgkUJkxRxVXDIssrLkCYKAAA7"""
             self.labelLineHint.show = 1 #re-enable line hints
             return #user cancelled so get out
 
+        notSaveFile = ('The file you attempted to load:\n\n'+fileName+\
+                                        '\n\nis not a '+pyching.title+' save file.')
         tempHexes = pyching_engine.Hexagrams()
         try:
+            #check the header first, so files that aren't save files are never unpickled
+            pyching_engine.peek_save_info(fileName)
             saveFileID = tempHexes.Load(fileName)
         except IOError:
             #print '\n error: unable to read save file', fileName
             tkMessageBox.showerror(title='File Error',
                             message='Unable to load save file:\n'+fileName)
-        except Exception: #the file couldn't be unpickled, most likely it isn't a pickled file
-            #print '\n error: unable to unpickle file', fileName
+        except ValueError as error: #rejected by its header, say why
             tkMessageBox.showerror(title='Not A Save File',
-                            message='The file you attempted to load:\n\n'+fileName+\
-                                            '\n\nis not a '+pyching.title+' save file.')
+                            message=notSaveFile+'\n\n('+str(error)+')')
+        except Exception: #a legacy file that couldn't be unpickled
+            #print '\n error: unable to unpickle file', fileName
+            tkMessageBox.showerror(title='Not A Save File', message=notSaveFile)
         else:
             if not saveFileID[0] == pyching.saveFileID[0]: #this isn't a valid pyching savefile
                 #print '\n invalid save file:', fileName
-                tkMessageBox.showerror(title='Not A Save File',
-                                message='The file you attempted to load:\n\n'+fileName+\
-                                                '\n\nis not a '+pyching.title+' save file.')
+                tkMessageBox.showerror(title='Not A Save File', message=notSaveFile)
             #elif not saveFileID[1] == pyching.saveFileID[1]: #savefile fails version check
             # pass #handle any savefile version issues here
             else:     
@@ -0,0 +1,572 @@
+##---------------------------------------------------------------------------##
+##
+## pyChing -- a Python program to cast and interpret I Ching hexagrams
+##
+## Copyright (C) 1999-2006 Stephen M. Gava
+## Copyright (C) 2025 - Reading journal implementation
+##
+## This program is free software; you can redistribute it and/or modify
+## it under the terms of the GNU General Public License as published by
+## the Free Software Foundation; either version 2 of the License, or
+## (at your option) any later version.
+##
+## This program is distributed in the hope that it will be of some
+## interest to somebody, but WITHOUT ANY WARRANTY; without even the
+## implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+## See the GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with this program; see the file COPYING or COPYING.txt. If not,
+##  write to the Free Software Foundation, Inc.,
+## 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+## The license can also be found at the GNU/FSF website: http://www.gnu.org
+##
+##---------------------------------------------------------------------------##
+"""
+reading journal module for pyching
+keeps any number of readings in one sqlite database, indexed for fast queries,
+or in an append-only log file with a sparse offset index
+"""
+#python library imports
+import mmap
+import os
+import re
+import sqlite3
+import struct
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple, Optional
+
+#pyching imports
+import pyching_engine
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    lines INTEGER NOT NULL,
+    hex1 INTEGER NOT NULL,
+    hex2 INTEGER NOT NULL,
+    moving INTEGER NOT NULL,
+    oracle TEXT NOT NULL,
+    question TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS readingsByTime ON readings (timestamp);
+CREATE INDEX IF NOT EXISTS readingsByHex1 ON readings (hex1, timestamp);
+CREATE INDEX IF NOT EXISTS readingsByHex2 ON readings (hex2, timestamp);
+CREATE INDEX IF NOT EXISTS readingsByMoving ON readings (moving, timestamp);
+CREATE INDEX IF NOT EXISTS readingsByOracle ON readings (oracle, timestamp);
+"""
+
+# full text index of the questions, kept in step with the readings table by triggers
+_FULL_TEXT_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS questions USING fts5(question, content='readings', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS questionsInsert AFTER INSERT ON readings BEGIN
+    INSERT INTO questions (rowid, question) VALUES (new.id, new.question);
+END;
+CREATE TRIGGER IF NOT EXISTS questionsDelete AFTER DELETE ON readings BEGIN
+    INSERT INTO questions (questions, rowid, question) VALUES ('delete', old.id, old.question);
+END;
+"""
+
+_INSERT = 'INSERT INTO readings (timestamp, lines, hex1, hex2, moving, oracle, question) VALUES (?, ?, ?, ?, ?, ?, ?)'
+
+class JournalEntry(NamedTuple):
+    """
+    one reading from the journal, public class
+    """
+    id: int  # journal row id, in order of insertion
+    timestamp: float  # time the reading was cast, seconds since the epoch
+    reading: pyching_engine.Reading
+
+def _Seconds(when: float | datetime) -> float:
+    """
+    return a time as seconds since the epoch, private function
+    """
+    if isinstance(when, datetime):
+        return when.timestamp()
+    return when
+
+def _Row(lines: int, question: str, oracle: str, timestamp: float) -> tuple:
+    """
+    return the readings table row of one reading, private function
+    """
+    return (timestamp, lines, pyching_engine.HEX1_BY_PACKED[lines], pyching_engine.HEX2_BY_PACKED[lines],
+            pyching_engine.MOVING_BY_PACKED[lines], oracle, question)
+
+def _Words(text: str) -> list[str]:
+    """
+    return the words of text as the fts5 unicode61 tokenizer sees them, private function
+
+    words are runs of letters and digits, lower cased and without diacritics,
+    everything else separates them
+    """
+    text = ''.join(char for char in unicodedata.normalize('NFD', text.lower())
+                   if not unicodedata.combining(char))
+    return re.findall(r'[^\W_]+', text)
+
+def _HasWords(question: str, words: str) -> bool:
+    """
+    return whether question holds every one of the space separated words, private function
+
+    the sqlite function behind question searches without a full text index
+    """
+    return set(words.split()) <= set(_Words(question))
+
+class ReadingJournal:
+    """
+    sqlite database of readings, public class
+
+    every reading is stored with its timestamp, both hexagram numbers, its
+    moving line mask and oracle in indexed columns, so queries by date,
+    hexagram or moving lines only touch the matching rows. questions are
+    searchable through an fts5 full text index when the sqlite library has
+    fts5, otherwise by a (slower) scan. use it as a context manager, or call
+    close() when done.
+    """
+    def __init__(self, path: Path | str = ':memory:') -> None:
+        self.path: Path | str = path  # database file, or ':memory:'
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        if path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.create_function('has_words', 2, _HasWords, deterministic=True)
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+        try:
+            with self.connection:
+                self.connection.executescript(_FULL_TEXT_SCHEMA)
+        except sqlite3.OperationalError: #no fts5 in this sqlite build
+            self.fullText: bool = False
+        else:
+            self.fullText = True  # questions have a full text index
+
+    def __enter__(self) -> 'ReadingJournal':
+        return self
+
+    def __exit__(self, *excInfo: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        close the database, public method
+        """
+        self.connection.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT count(*) FROM readings').fetchone()[0]
+
+    def add(self, reading: 'pyching_engine.Hexagrams | pyching_engine.Reading',
+            timestamp: Optional[float] = None) -> int:
+        """
+        add one complete reading, returns its journal id, public method
+
+        timestamp defaults to a Hexagrams instance's own timestamp, and to 0.0
+        for a Reading
+        """
+        if isinstance(reading, pyching_engine.Hexagrams):
+            if timestamp is None: timestamp = reading.timestamp
+            reading = pyching_engine.Reading.from_hexagrams(reading)
+        with self.connection:
+            cursor = self.connection.execute(_INSERT, _Row(reading.lines, reading.question, reading.oracle,
+                                                           timestamp or 0.0))
+        return cursor.lastrowid
+
+    def add_many(self, readings: Iterable['pyching_engine.Reading | tuple[pyching_engine.Reading, float]']) -> int:
+        """
+        add many complete readings in a single transaction, returns how many, public method
+
+        readings can be Reading values, dated 0.0, or (Reading, timestamp) pairs
+        """
+        def Rows() -> Iterable[tuple]:
+            for item in readings:
+                reading, timestamp = item if isinstance(item, tuple) else (item, 0.0)
+                yield _Row(reading.lines, reading.question, reading.oracle, timestamp)
+        return self._Insert(Rows())
+
+    def add_batch(self, batch: pyching_engine.ReadingBatch) -> int:
+        """
+        add every reading of a ReadingBatch in a single transaction, returns how many, public method
+        """
+        oracle = batch.oracle
+        return self._Insert(_Row(lines, question, oracle, timestamp) for lines, question, timestamp
+                            in zip(batch.lines, batch.questions, batch.timestamps))
+
+    def _Insert(self, rows: Iterable[tuple]) -> int:
+        """
+        insert readings table rows in one transaction, returns how many, private method
+        """
+        inserted = 0
+        def Counted() -> Iterable[tuple]:
+            nonlocal inserted
+            for row in rows:
+                inserted = inserted + 1
+                yield row
+        with self.connection:
+            self.connection.executemany(_INSERT, Counted())
+        return inserted
+
+    def query(self, hexagram: Optional[int] = None, hex1: Optional[int] = None, hex2: Optional[int] = None,
+              start: Optional[float | datetime] = None, end: Optional[float | datetime] = None,
+              moving: Optional[int] = None, oracle: Optional[str] = None, text: Optional[str] = None,
+              limit: Optional[int] = None) -> list[JournalEntry]:
+        """
+        return the readings matching every given condition, oldest first, public method
+
+        hexagram matches either hex1 or hex2, hex1 and hex2 match one of them
+        (hex2=0 for readings with no moving lines). start and end are times
+        (seconds since the epoch or datetimes), start is included and end is
+        not. moving is an exact moving line mask. text matches questions
+        containing all of its words, whole words ignoring case and diacritics,
+        with or without the full text index. text without any words matches
+        every question.
+        """
+        where, parameters = self._Where(hexagram, hex1, hex2, start, end, moving, oracle, text)
+        sql = f'SELECT id, timestamp, lines, question, oracle FROM readings{where} ORDER BY timestamp, id'
+        if limit is not None:
+            sql = sql + ' LIMIT ?'
+            parameters.append(limit)
+        Reading = pyching_engine.Reading
+        return [JournalEntry(id, timestamp, Reading(lines, question, oracle))
+                for id, timestamp, lines, question, oracle in self.connection.execute(sql, parameters)]
+
+    def count(self, hexagram: Optional[int] = None, hex1: Optional[int] = None, hex2: Optional[int] = None,
+              start: Optional[float | datetime] = None, end: Optional[float | datetime] = None,
+              moving: Optional[int] = None, oracle: Optional[str] = None, text: Optional[str] = None) -> int:
+        """
+        return how many readings match every given condition (see query), public method
+        """
+        where, parameters = self._Where(hexagram, hex1, hex2, start, end, moving, oracle, text)
+        return self.connection.execute(f'SELECT count(*) FROM readings{where}', parameters).fetchone()[0]
+
+    def _Where(self, hexagram: Optional[int], hex1: Optional[int], hex2: Optional[int],
+               start: Optional[float | datetime], end: Optional[float | datetime], moving: Optional[int],
+               oracle: Optional[str], text: Optional[str]) -> tuple[str, list]:
+        """
+        return the where clause and parameters for the query conditions, private method
+        """
+        conditions, parameters = [], []
+        if hexagram is not None:
+            conditions.append('(hex1 = ? OR hex2 = ?)')
+            parameters.extend((hexagram, hexagram))
+        for column, value in (('hex1', hex1), ('hex2', hex2), ('moving', moving), ('oracle', oracle)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                parameters.append(value)
+        if start is not None:
+            conditions.append('timestamp >= ?')
+            parameters.append(_Seconds(start))
+        if end is not None:
+            conditions.append('timestamp < ?')
+            parameters.append(_Seconds(end))
+        words = _Words(text) if text is not None else []
+        if words:
+            if self.fullText: #every word as a quoted fts5 string
+                conditions.append('id IN (SELECT rowid FROM questions WHERE questions MATCH ?)')
+                parameters.append(' '.join(f'"{word}"' for word in words))
+            else:
+                conditions.append('has_words(question, ?)')
+                parameters.append(' '.join(words))
+        return (' WHERE ' + ' AND '.join(conditions) if conditions else ''), parameters
+
+#
+# append-only journal log
+######################
+
+LOG_MAGIC = b'PYCHLOG1'  # first bytes of a journal log file
+INDEX_MAGIC = b'PYCHIDX1'  # first bytes of its sparse offset index sidecar
+_INDEX_HEADER = struct.Struct('<8sI')  # index magic, stride
+_INDEX_ENTRY = struct.Struct('<Qd')  # log offset and timestamp of every stride-th record
+_LENGTH = struct.Struct('<I')  # length prefix of every log record
+# position of the timestamp in a record, after its length prefix and the save header fields before it
+_TIMESTAMP = struct.Struct('<d')
+_TIMESTAMP_OFFSET = _LENGTH.size + struct.calcsize('<4sBBHBB')
+
+def IndexPath(path: Path | str) -> Path:
+    """
+    return the path of the sparse offset index sidecar of a journal log
+    """
+    return Path(str(path) + '.idx')
+
+def _ScanRecords(data: bytes | mmap.mmap, offset: int, stop: int) -> Iterator[int]:
+    """
+    yield the offset of every complete record from offset up to stop, private function
+    """
+    while offset + _LENGTH.size <= stop:
+        end = offset + _LENGTH.size + _LENGTH.unpack_from(data, offset)[0]
+        if end > stop: #a torn final record
+            return
+        yield offset
+        offset = end
+
+def _ReadIndex(indexFile: BinaryIO, logSize: int, stride: int) -> tuple[int, array, array]:
+    """
+    return the stride, offsets and timestamps held by an index sidecar, private function
+
+    entries pointing beyond the end of the log are left out
+    """
+    indexFile.seek(0)
+    data = indexFile.read()
+    offsets, timestamps = array('Q'), array('d')
+    if len(data) >= _INDEX_HEADER.size:
+        magic, stride = _INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC:
+            raise ValueError('not a journal log index')
+        for offset, timestamp in _INDEX_ENTRY.iter_unpack(
+                data[_INDEX_HEADER.size:len(data) - (len(data) - _INDEX_HEADER.size) % _INDEX_ENTRY.size]):
+            if offset >= logSize:
+                break
+            offsets.append(offset)
+            timestamps.append(timestamp)
+    return stride, offsets, timestamps
+
+class JournalLog:
+    """
+    append-only journal log file of readings, public class
+
+    each record is a length prefixed binary save (see pyching_engine.encode_reading).
+    appends are buffered and written batchSize at a time, and the files are
+    fsynced when at least syncInterval seconds have passed since the last
+    fsync (0 fsyncs every write, None leaves it to the operating system). a
+    sparse index sidecar holds the offset and timestamp of every stride-th
+    record, see JournalLogReader. readings should be appended in time order.
+    opening a log repairs a torn final record and catches the index up with
+    the log. use it as a context manager, or call close() when done.
+    """
+    def __init__(self, path: Path | str, stride: int = 256, batchSize: int = 64,
+                 syncInterval: Optional[float] = 1.0) -> None:
+        self.path: Path = Path(path)  # log file
+        self.indexPath: Path = IndexPath(path)  # sparse offset index sidecar
+        self.batchSize: int = batchSize  # appends buffered before a write
+        self.syncInterval: Optional[float] = syncInterval  # least seconds between fsyncs
+        self._pending: list[bytes] = []  # records appended but not written yet
+        self._pendingIndex: list[bytes] = []  # index entries for them
+        self._lastSync: float = time.monotonic()
+        self._log: BinaryIO = open(self.path, 'a+b')
+        self._index: BinaryIO = open(self.indexPath, 'a+b')
+        self.stride: int = stride  # records per index entry, an existing index keeps its own
+        try:
+            self._Recover()
+        except Exception:
+            self._log.close()
+            self._index.close()
+            raise
+
+    def _Recover(self) -> None:
+        """
+        check both files, drop any torn record and add any missing index entries, private method
+        """
+        self._log.seek(0)
+        if self._log.read(len(LOG_MAGIC)) not in (LOG_MAGIC, b''):
+            raise ValueError(f'not a journal log: {self.path}')
+        logSize = self._log.seek(0, os.SEEK_END)
+        if logSize == 0:
+            self._log.write(LOG_MAGIC)
+            logSize = len(LOG_MAGIC)
+        self.stride, offsets, timestamps = _ReadIndex(self._index, logSize, self.stride)
+        self._index.truncate(_INDEX_HEADER.size + len(offsets) * _INDEX_ENTRY.size if offsets else 0)
+        if not offsets:
+            self._index.write(_INDEX_HEADER.pack(INDEX_MAGIC, self.stride))
+        self._log.seek(offsets[-1] if offsets else len(LOG_MAGIC))
+        tail = self._log.read()
+        start = offsets[-1] if offsets else len(LOG_MAGIC)
+        self.count: int = (len(offsets) - 1) * self.stride if offsets else 0  # records in the log
+        self.end: int = start  # offset just past the last record
+        newEntries = []
+        for offset in _ScanRecords(tail, 0, len(tail)):
+            if self.count % self.stride == 0 and self.count // self.stride >= len(offsets):
+                newEntries.append(_INDEX_ENTRY.pack(start + offset, _TIMESTAMP.unpack_from(tail, offset + _TIMESTAMP_OFFSET)[0]))
+            self.count = self.count + 1
+            self.end = start + offset + _LENGTH.size + _LENGTH.unpack_from(tail, offset)[0]
+        if self.end < logSize: #a record was torn by a crash mid-write
+            self._log.truncate(self.end)
+        kept = bisect_left(offsets, self.end) #an entry can point at the torn record itself
+        if kept < len(offsets):
+            self._index.truncate(_INDEX_HEADER.size + kept * _INDEX_ENTRY.size)
+        self._index.seek(0, os.SEEK_END)
+        self._index.write(b''.join(newEntries))
+        self.sync()
+
+    def __enter__(self) -> 'JournalLog':
+        return self
+
+    def __exit__(self, *excInfo: Any) -> None:
+        self.close()
+
+    def append(self, reading: 'pyching_engine.Hexagrams | pyching_engine.Reading',
+               timestamp: Optional[float] = None) -> int:
+        """
+        append one complete reading, returns its record number, public method
+
+        timestamp defaults to a Hexagrams instance's own timestamp, and to 0.0
+        for a Reading
+        """
+        if isinstance(reading, pyching_engine.Hexagrams):
+            if timestamp is None: timestamp = reading.timestamp
+            reading = pyching_engine.Reading.from_hexagrams(reading)
+        timestamp = timestamp or 0.0
+        record = pyching_engine.encode_reading(reading, timestamp)
+        if self.count % self.stride == 0:
+            self._pendingIndex.append(_INDEX_ENTRY.pack(self.end, timestamp))
+        self._pending.append(_LENGTH.pack(len(record)) + record)
+        self.end = self.end + _LENGTH.size + len(record)
+        self.count = self.count + 1
+        if len(self._pending) >= self.batchSize:
+            self.flush()
+        return self.count - 1
+
+    def _Write(self) -> None:
+        """
+        write out the pending records, then their index entries, private method
+        """
+        if self._pending:
+            self._log.write(b''.join(self._pending))
+            self._log.flush()
+            self._pending.clear()
+        if self._pendingIndex:
+            self._index.write(b''.join(self._pendingIndex))
+            self._index.flush()
+            self._pendingIndex.clear()
+
+    def flush(self) -> None:
+        """
+        write out the pending records, fsyncing if syncInterval has passed, public method
+        """
+        self._Write()
+        if self.syncInterval is not None and time.monotonic() - self._lastSync >= self.syncInterval:
+            self.sync()
+
+    def sync(self) -> None:
+        """
+        write out the pending records and fsync both files, public method
+        """
+        self._Write()
+        self._log.flush()
+        self._index.flush()
+        os.fsync(self._log.fileno())
+        os.fsync(self._index.fileno())
+        self._lastSync = time.monotonic()
+
+    def close(self) -> None:
+        """
+        write out and fsync the pending records and close the log, public method
+        """
+        if not self._log.closed:
+            self.sync()
+            self._log.close()
+            self._index.close()
+
+class JournalLogReader:
+    """
+    memory mapped reader of a journal log, public class
+
+    record N is found from the index entry of its stride and at most stride - 1
+    skipped records, and a timestamp by a binary search of the index entries,
+    so neither parses the log from the start. the reader sees the log as it
+    was when opened. without an index sidecar the log is scanned once to
+    build one in memory. use it as a context manager, or call close() when done.
+    """
+    def __init__(self, path: Path | str, stride: int = 256) -> None:
+        self.path: Path = Path(path)
+        with open(self.path, 'rb') as logFile:
+            self._map: mmap.mmap = mmap.mmap(logFile.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(LOG_MAGIC)] != LOG_MAGIC:
+            self._map.close()
+            raise ValueError(f'not a journal log: {self.path}')
+        try:
+            with open(IndexPath(path), 'rb') as indexFile:
+                self.stride, self.offsets, self.timestamps = _ReadIndex(indexFile, len(self._map), stride)
+        except FileNotFoundError:
+            self.stride = stride  # records per index entry
+            self.offsets: array = array('Q')  # log offset of every stride-th record
+            self.timestamps: array = array('d')  # timestamp of every stride-th record
+        self.count: int = (len(self.offsets) - 1) * self.stride if self.offsets else 0  # records in the log
+        start = self.offsets[-1] if self.offsets else len(LOG_MAGIC)
+        for offset in _ScanRecords(self._map, start, len(self._map)): #records after the last index entry
+            if self.count % self.stride == 0 and self.count // self.stride >= len(self.offsets):
+                self.offsets.append(offset)
+                self.timestamps.append(self._Timestamp(offset))
+            self.count = self.count + 1
+
+    def __enter__(self) -> 'JournalLogReader':
+        return self
+
+    def __exit__(self, *excInfo: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        unmap the log, public method
+        """
+        self._map.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _Timestamp(self, offset: int) -> float:
+        """
+        return the timestamp of the record at offset, private method
+        """
+        return _TIMESTAMP.unpack_from(self._map, offset + _TIMESTAMP_OFFSET)[0]
+
+    def _Offset(self, number: int) -> int:
+        """
+        return the log offset of record number, private method
+        """
+        entry = number // self.stride
+        offset = self.offsets[entry]
+        for skip in range(number - entry * self.stride):
+            offset = offset + _LENGTH.size + _LENGTH.unpack_from(self._map, offset)[0]
+        return offset
+
+    def _Entry(self, number: int, offset: int) -> JournalEntry:
+        """
+        return the record at offset as a JournalEntry, private method
+        """
+        length = _LENGTH.unpack_from(self._map, offset)[0]
+        saved = pyching_engine.decode_save(self._map[offset + _LENGTH.size:offset + _LENGTH.size + length])
+        return JournalEntry(number, saved.timestamp,
+                            pyching_engine.Reading(saved.lines, saved.question, saved.oracle))
+
+    def __getitem__(self, number: int) -> JournalEntry:
+        if number < 0: number = number + self.count
+        if not 0 <= number < self.count:
+            raise IndexError('journal log record number out of range')
+        return self._Entry(number, self._Offset(number))
+
+    def entries(self, start: int = 0, stop: Optional[int] = None) -> Iterator[JournalEntry]:
+        """
+        yield records start to stop - 1 in order, public method
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        if start >= stop:
+            return
+        offset = self._Offset(start)
+        for number in range(start, stop):
+            yield self._Entry(number, offset)
+            offset = offset + _LENGTH.size + _LENGTH.unpack_from(self._map, offset)[0]
+
+    def __iter__(self) -> Iterator[JournalEntry]:
+        return self.entries()
+
+    def seek_time(self, timestamp: float | datetime) -> int:
+        """
+        return the number of the first record at or after timestamp, public method
+
+        returns len(self) if there is none. relies on the records being in time order.
+        """
+        timestamp = _Seconds(timestamp)
+        entry = max(bisect_left(self.timestamps, timestamp) - 1, 0)
+        if not self.offsets:
+            return self.count
+        number = entry * self.stride
+        offset = self.offsets[entry]
+        while number < self.count and self._Timestamp(offset) < timestamp:
+            offset = offset + _LENGTH.size + _LENGTH.unpack_from(self._map, offset)[0]
+            number = number + 1
+        return number
@@ -0,0 +1,187 @@
+##---------------------------------------------------------------------------##
+##
+## pyChing -- a Python program to cast and interpret I Ching hexagrams
+##
+## Copyright (C) 1999-2006 Stephen M. Gava
+## Copyright (C) 2025 - Hexagram relationship index
+##
+## This program is free software; you can redistribute it and/or modify
+## it under the terms of the GNU General Public License as published by
+## the Free Software Foundation; either version 2 of the License, or
+## (at your option) any later version.
+##
+## This program is distributed in the hope that it will be of some
+## interest to somebody, but WITHOUT ANY WARRANTY; without even the 
+## implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+## See the GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with this program; see the file COPYING or COPYING.txt. If not, 
+##  write to the Free Software Foundation, Inc.,
+## 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+## The license can also be found at the GNU/FSF website: http://www.gnu.org
+##
+##---------------------------------------------------------------------------##
+"""
+hexagram relationship index for pyching
+trigrams, nuclear, inverse and complementary hexagrams, and the traditional
+sequence orders, all precomputed as flat tuples indexed by hexagram code
+(see pyching_engine.hexagram_code)
+"""
+#python library imports
+from typing import NamedTuple
+
+#pyching imports
+from pyching_engine import CODE_BY_NUMBER, NAME_BY_CODE, NUMBER_BY_CODE
+
+#
+# trigrams
+################
+
+# a trigram code is 3 bits, bit 0 holds the bottom line, yang = 1. the lower
+# trigram of a hexagram is bits 0-2 of its code and the upper trigram bits 3-5
+
+# trigram names, from the hexagram made of the trigram doubled, indexed by trigram code
+TRIGRAM_NAMES: tuple[str, ...] = tuple(NAME_BY_CODE[trigram * 9] for trigram in range(8))
+# trigram images, indexed by trigram code
+TRIGRAM_IMAGES: tuple[str, ...] = ('earth', 'thunder', 'water', 'lake',
+                                   'mountain', 'fire', 'wind', 'heaven')
+
+LOWER_TRIGRAM: tuple[int, ...] = tuple(code & 7 for code in range(64))
+UPPER_TRIGRAM: tuple[int, ...] = tuple(code >> 3 for code in range(64))
+
+#
+# related hexagrams
+################
+
+# nuclear hexagram: lines 2-4 become the lower trigram and lines 3-5 the upper
+NUCLEAR: tuple[int, ...] = tuple((code >> 1) & 7 | ((code >> 2) & 7) << 3 for code in range(64))
+# inverse hexagram: the hexagram turned upside down
+INVERSE: tuple[int, ...] = tuple(int(format(code, '06b')[::-1], 2) for code in range(64))
+# complementary hexagram: every line changed
+COMPLEMENT: tuple[int, ...] = tuple(code ^ 63 for code in range(64))
+
+#
+# sequence orders
+################
+
+# position (1-64) of each hexagram code in the King Wen sequence
+KING_WEN: tuple[int, ...] = NUMBER_BY_CODE
+# position (1-64) of each hexagram code in the Fu Xi binary sequence, which
+# reads the lines as a binary number with the bottom line most significant
+FU_XI: tuple[int, ...] = tuple(INVERSE[code] + 1 for code in range(64))
+
+def _MawangduiOrder() -> tuple[int, ...]:
+    """
+    build the positions of the Mawangdui silk manuscript sequence, private function
+
+    the sequence is in eight groups of eight sharing an upper trigram. each group
+    starts with its trigram doubled, then takes the remaining lower trigrams in
+    a fixed order.
+    """
+    # Tch'ien, Ken, K'an, Tchen, Koun, Touei, Li, Hsuan
+    upperOrder = (7, 4, 2, 1, 0, 3, 5, 6)
+    # Tch'ien, Koun, Ken, Touei, K'an, Li, Tchen, Hsuan
+    lowerOrder = (7, 0, 4, 3, 2, 5, 1, 6)
+    positions = [0] * 64
+    position = 1
+    for upper in upperOrder:
+        for lower in (upper,) + tuple(lower for lower in lowerOrder if lower != upper):
+            positions[upper << 3 | lower] = position
+            position = position + 1
+    return tuple(positions)
+
+# position (1-64) of each hexagram code in the Mawangdui sequence
+MAWANGDUI: tuple[int, ...] = _MawangduiOrder()
+
+def _Inverse(positions: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    return the hexagram codes indexed by sequence position (index 0 is unused, -1), private function
+    """
+    codes = [-1] * 65
+    for code, position in enumerate(positions):
+        codes[position] = code
+    return tuple(codes)
+
+# the sequence orders by name, each as (position by code, code by position)
+ORDERS: dict[str, tuple[tuple[int, ...], tuple[int, ...]]] = {
+    'king wen': (KING_WEN, CODE_BY_NUMBER),
+    'fu xi': (FU_XI, _Inverse(FU_XI)),
+    'mawangdui': (MAWANGDUI, _Inverse(MAWANGDUI)),
+}
+
+def convert_order(position: int, fromOrder: str, toOrder: str) -> int:
+    """
+    convert a hexagram's position in one sequence order to its position in another, public function
+
+    orders are named in ORDERS ('king wen', 'fu xi' or 'mawangdui'), positions are 1-64
+    """
+    return ORDERS[toOrder][0][ORDERS[fromOrder][1][position]]
+
+#
+# relations by King Wen number
+################
+
+class Relations(NamedTuple):
+    """
+    the related hexagrams and trigrams of one hexagram, public class
+
+    hexagrams are given by King Wen number, trigrams by trigram code
+    """
+    number: int
+    lowerTrigram: int
+    upperTrigram: int
+    nuclear: int
+    inverse: int
+    complement: int
+
+# the relations of every hexagram, indexed by King Wen number, index 0 is unused (None)
+_RELATIONS: tuple = (None,) + tuple(
+    Relations(number, LOWER_TRIGRAM[code], UPPER_TRIGRAM[code], KING_WEN[NUCLEAR[code]],
+              KING_WEN[INVERSE[code]], KING_WEN[COMPLEMENT[code]])
+    for number, code in enumerate(CODE_BY_NUMBER[1:], 1))
+
+def relations(number: int) -> Relations:
+    """
+    return the related hexagrams and trigrams of the hexagram with King Wen number, public function
+    """
+    return _RELATIONS[number]
+
+#
+# similarity
+################
+
+# Hamming distance (number of differing lines) between two hexagram codes,
+# as a 64 x 64 matrix indexed [code][code]
+HAMMING: tuple[tuple[int, ...], ...] = tuple(
+    tuple(bin(a ^ b).count('1') for b in range(64)) for a in range(64))
+# trigram overlap between two hexagram codes: 1 for a shared lower trigram
+# plus 1 for a shared upper trigram, as a 64 x 64 matrix indexed [code][code]
+TRIGRAM_OVERLAP: tuple[tuple[int, ...], ...] = tuple(
+    tuple((a & 7 == b & 7) + (a >> 3 == b >> 3) for b in range(64)) for a in range(64))
+# bitmask of the hexagram codes exactly m lines away from a code, indexed [code][m]
+DISTANCE_MASKS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(sum(1 << b for b in range(64) if HAMMING[a][b] == m) for m in range(7)) for a in range(64))
+# every hexagram code ordered from most to least similar to a code, starting
+# with the code itself: fewest differing lines first, then most shared
+# trigrams, then King Wen order
+NEIGHBOURS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(sorted(range(64), key=lambda b: (HAMMING[a][b], -TRIGRAM_OVERLAP[a][b], KING_WEN[b])))
+    for a in range(64))
+
+def nearest(number: int, k: int) -> list[int]:
+    """
+    return the k hexagrams most similar to the hexagram with King Wen number, public function
+
+    returns King Wen numbers, most similar first, see NEIGHBOURS for the ordering
+    """
+    return [KING_WEN[code] for code in NEIGHBOURS[CODE_BY_NUMBER[number]][1:k + 1]]
+
+def reachable(number: int, lines: int) -> list[int]:
+    """
+    return the hexagrams reached by changing exactly lines lines of a hexagram, public function
+
+    takes and returns King Wen numbers, the result is in King Wen order
+    """
+    mask = DISTANCE_MASKS[CODE_BY_NUMBER[number]][lines]
+    return sorted(KING_WEN[code] for code in range(64) if mask >> code & 1)
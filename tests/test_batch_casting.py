@@ -0,0 +1,54 @@
+"""
+Test Batch Casting
+==================
+
+These tests ensure multi-process batch tallies are reproducible and keep the
+coin method probabilities over much larger samples than step by step casting.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_batch
+
+
+class TestBatchTally:
+    """Test casting and tallying readings in batches"""
+
+    def test_process_pool_matches_single_process(self):
+        """The merged tally must not depend on the number of workers"""
+        single = pyching_batch.tally_readings(50000, seed=11, workers=1, taskSize=8192)
+        pooled = pyching_batch.tally_readings(50000, seed=11, workers=2, taskSize=8192)
+        assert pooled.packedCounts == single.packedCounts
+        assert pooled.readings == 50000
+
+    def test_progress_reports_every_reading(self):
+        """Progress must be reported per task and finish at the total"""
+        reports = []
+        pyching_batch.tally_readings(10000, seed=3, workers=1, taskSize=4096,
+                                     progress=lambda done, total: reports.append((done, total)))
+        assert len(reports) == 3
+        assert reports[-1] == (10000, 10000)
+
+    def test_derived_counts(self):
+        """hex1, hex2 and pair counts must all add up to the number of readings"""
+        tally = pyching_batch.tally_readings(20000, seed=5, workers=1)
+        assert sum(tally.hex1_counts()) == 20000
+        assert sum(tally.hex2_counts()) == 20000
+        assert sum(map(sum, tally.pair_counts())) == 20000
+        assert tally.hex1_counts()[0] == 0
+
+    def test_no_moving_lines_frequency(self):
+        """About (3/4)**6 = 17.8% of a large sample must have no moving lines"""
+        tally = pyching_batch.tally_readings(400000, seed=2025, workers=1)
+        unmoving = tally.hex2_counts()[0] / tally.readings
+        assert 0.174 < unmoving < 0.182, \
+            f"No moving lines should be ~17.8%, got {unmoving*100:.2f}%"
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,133 @@
+"""
+Test Entropy Sources
+====================
+
+These tests ensure every selectable entropy source can drive the oracle and
+that the pooled os.urandom reader hands out well formed random bits.
+"""
+
+import random
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+
+class TestEntropySelection:
+    """Test choosing an entropy source for Hexagrams"""
+
+    def test_default_is_per_thread(self):
+        """With no entropy source each thread casts from its own generator"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        assert hexagrams.rng is pyching_engine.thread_rng()
+        assert hexagrams.rng is not random
+        others = []
+        thread = threading.Thread(target=lambda: others.append(pyching_engine.Hexagrams().rng))
+        thread.start()
+        thread.join()
+        assert others[0] is not hexagrams.rng
+
+    def test_concurrent_casting(self):
+        """Threads casting at once with the default generators must all complete valid readings"""
+        def cast(results):
+            for _ in range(200):
+                hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+                for _ in range(6):
+                    hexagrams.NewLine()
+                results.append(hexagrams.hex1.number)
+            results.extend(str(pyching_engine.HEX1_BY_PACKED[lines])
+                           for lines in pyching_engine.cast_many(200))
+        results = [[] for _ in range(4)]
+        threads = [threading.Thread(target=cast, args=(result,)) for result in results]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for result in results:
+            assert len(result) == 400
+            assert all(1 <= int(number) <= 64 for number in result)
+
+    @pytest.mark.parametrize('name', sorted(pyching_engine.ENTROPY_SOURCES))
+    def test_named_sources_cast_valid_readings(self, name):
+        """Every named entropy source must cast a complete, valid reading"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin', entropy=name)
+        for _ in range(6):
+            hexagrams.NewLine()
+            assert all(coin in (2, 3) for coin in hexagrams.currentOracleValues)
+        assert all(value in (6, 7, 8, 9) for value in hexagrams.hex1.lineValues)
+        assert hexagrams.hex1.number != ''
+
+    def test_named_sources_are_kept_per_thread(self):
+        """A named source must be made once per thread, not once per reading"""
+        first = pyching_engine.Hexagrams(entropy='urandom')
+        assert pyching_engine.Hexagrams(entropy='urandom').rng is first.rng
+        others = []
+        thread = threading.Thread(target=lambda: others.append(pyching_engine.Hexagrams(entropy='urandom').rng))
+        thread.start()
+        thread.join()
+        assert others[0] is not first.rng
+
+    def test_urandom_readings_share_one_block(self, monkeypatch):
+        """Many urandom readings must cost a single os.urandom call between them"""
+        calls = []
+        urandom = pyching_engine.os.urandom
+        monkeypatch.setattr(pyching_engine.os, 'urandom', lambda n: calls.append(n) or urandom(n))
+        def cast():
+            for _ in range(100):
+                pyching_engine.Hexagrams(entropy='urandom').recast()
+        thread = threading.Thread(target=cast) #a new thread, so the pool starts empty
+        thread.start()
+        thread.join()
+        assert len(calls) == 1
+
+    def test_instance_is_used_as_is(self):
+        """A seeded generator passed in must make casting reproducible"""
+        first = pyching_engine.Hexagrams(entropy=random.Random(99))
+        second = pyching_engine.Hexagrams(entropy=random.Random(99))
+        for _ in range(6):
+            first.NewLine()
+            second.NewLine()
+        assert first.hex1.lineValues == second.hex1.lineValues
+
+    def test_unknown_source_raises(self):
+        """Unknown entropy source names must be rejected"""
+        with pytest.raises(ValueError):
+            pyching_engine.Hexagrams(entropy='dice')
+
+
+class TestUrandomPool:
+    """Test the pooled os.urandom reader"""
+
+    def test_getrandbits_range(self):
+        """getrandbits(k) must stay below 2**k, including across block refills"""
+        pool = pyching_engine.UrandomPool(blockSize=16)
+        for k in (0, 1, 3, 18, 53, 64, 65, 200):
+            for _ in range(50):
+                assert 0 <= pool.getrandbits(k) < 2 ** k
+
+    def test_bits_are_balanced(self):
+        """Each 3 bit pattern should be about equally likely"""
+        pool = pyching_engine.UrandomPool(blockSize=64)
+        counts = [0] * 8
+        for _ in range(16000):
+            counts[pool.getrandbits(3)] += 1
+        assert all(1700 < count < 2300 for count in counts), \
+            f"3 bit patterns should each appear about 2000 times, got {counts}"
+
+    def test_random_and_seed(self):
+        """random() must be in [0, 1) and seeding must be a harmless no-op"""
+        pool = pyching_engine.UrandomPool()
+        pool.seed(1)
+        assert all(0.0 <= pool.random() < 1.0 for _ in range(1000))
+        with pytest.raises(NotImplementedError):
+            pool.getstate()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,114 @@
+"""
+Test Hexagram Relationship Index
+================================
+
+These tests check the precomputed trigram, nuclear, inverse and
+complementary relations and the traditional sequence orders against
+well known values.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_relations
+
+
+class TestTrigrams:
+    """Test trigram decomposition"""
+
+    def test_trigram_names(self):
+        """Doubled trigrams give the eight trigram names"""
+        assert pyching_relations.TRIGRAM_NAMES[7] == "Tch'ien"
+        assert pyching_relations.TRIGRAM_NAMES[0] == "Koun"
+        assert pyching_relations.TRIGRAM_IMAGES[2] == 'water'
+
+    def test_hexagram_3_trigrams(self):
+        """T'oun (3) is water over thunder"""
+        related = pyching_relations.relations(3)
+        assert pyching_relations.TRIGRAM_IMAGES[related.lowerTrigram] == 'thunder'
+        assert pyching_relations.TRIGRAM_IMAGES[related.upperTrigram] == 'water'
+
+
+class TestRelatedHexagrams:
+    """Test nuclear, inverse and complementary hexagrams"""
+
+    def test_known_relations(self):
+        """Spot check traditional relations by King Wen number"""
+        assert pyching_relations.relations(3).nuclear == 23
+        assert pyching_relations.relations(3).inverse == 4
+        assert pyching_relations.relations(1).complement == 2
+        assert pyching_relations.relations(29).complement == 30
+        assert pyching_relations.relations(63).nuclear == 64
+        assert pyching_relations.relations(1).nuclear == 1
+
+    def test_relations_are_involutions(self):
+        """Inverting or complementing twice must give back the same hexagram"""
+        for code in range(64):
+            assert pyching_relations.INVERSE[pyching_relations.INVERSE[code]] == code
+            assert pyching_relations.COMPLEMENT[pyching_relations.COMPLEMENT[code]] == code
+
+
+class TestSequenceOrders:
+    """Test conversions between King Wen, Fu Xi and Mawangdui orders"""
+
+    def test_fu_xi_order(self):
+        """The Fu Xi binary sequence starts Koun, Po, Pi, Kouan and ends with Tch'ien"""
+        start = [pyching_relations.convert_order(position, 'fu xi', 'king wen') for position in range(1, 5)]
+        assert start == [2, 23, 8, 20]
+        assert pyching_relations.convert_order(64, 'fu xi', 'king wen') == 1
+
+    def test_mawangdui_order(self):
+        """The Mawangdui sequence starts with the Tch'ien and Ken groups"""
+        start = [pyching_relations.convert_order(position, 'mawangdui', 'king wen') for position in range(1, 17)]
+        assert start == [1, 12, 33, 10, 6, 13, 25, 44, 52, 26, 23, 41, 4, 22, 27, 18]
+        assert pyching_relations.convert_order(64, 'mawangdui', 'king wen') == 42
+
+    def test_orders_are_permutations(self):
+        """Every order must be a permutation of 1-64 that round trips"""
+        for name in pyching_relations.ORDERS:
+            for position in range(1, 65):
+                kingWen = pyching_relations.convert_order(position, name, 'king wen')
+                assert pyching_relations.convert_order(kingWen, 'king wen', name) == position
+
+
+class TestSimilarity:
+    """Test the similarity matrices and neighbour queries"""
+
+    def test_matrices_are_symmetric(self):
+        """Distance and overlap must not depend on argument order"""
+        for a in range(64):
+            for b in range(64):
+                assert pyching_relations.HAMMING[a][b] == pyching_relations.HAMMING[b][a]
+                assert pyching_relations.TRIGRAM_OVERLAP[a][b] == pyching_relations.TRIGRAM_OVERLAP[b][a]
+            assert pyching_relations.HAMMING[a][a] == 0
+            assert pyching_relations.TRIGRAM_OVERLAP[a][a] == 2
+
+    def test_reachable_counts(self):
+        """Changing m of 6 lines reaches 6-choose-m hexagrams"""
+        from math import comb
+        for lines in range(7):
+            assert len(pyching_relations.reachable(29, lines)) == comb(6, lines)
+        assert pyching_relations.reachable(1, 6) == [2]
+        assert pyching_relations.reachable(1, 0) == [1]
+
+    def test_nearest_hexagrams(self):
+        """The closest hexagrams to Tch'ien (1) are those with one yin line"""
+        assert pyching_relations.nearest(1, 6) == [9, 10, 13, 14, 43, 44]
+        assert pyching_relations.nearest(1, 63)[-1] == 2
+        assert 1 not in pyching_relations.nearest(1, 63)
+
+    def test_nearest_prefers_shared_trigrams(self):
+        """Among equally distant hexagrams, those sharing a trigram come first"""
+        code = pyching_relations.CODE_BY_NUMBER[11]
+        twoAway = pyching_relations.nearest(11, 21)[6:]
+        overlaps = [pyching_relations.TRIGRAM_OVERLAP[code][pyching_relations.CODE_BY_NUMBER[n]]
+                    for n in twoAway]
+        assert overlaps == sorted(overlaps, reverse=True)
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,103 @@
+"""
+Test Hexagram Lookup Tables
+===========================
+
+These tests ensure the packed 6 bit hexagram codes and the King Wen lookup
+tables built from them agree with the traditional line patterns.
+
+Hexagram codes hold the bottom line in bit 0, with yang = 1 and yin = 0.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+
+class TestHexagramCode:
+    """Test packing line values into hexagram codes"""
+
+    def test_all_yang_and_all_yin(self):
+        """All yang is code 63, all yin is code 0"""
+        assert pyching_engine.hexagram_code([7, 7, 7, 7, 7, 7]) == 63
+        assert pyching_engine.hexagram_code([8, 8, 8, 8, 8, 8]) == 0
+
+    def test_bottom_line_is_bit_zero(self):
+        """The bottom line must be the least significant bit"""
+        assert pyching_engine.hexagram_code([7, 8, 8, 8, 8, 8]) == 0b000001
+        assert pyching_engine.hexagram_code([8, 8, 8, 8, 8, 7]) == 0b100000
+
+    def test_moving_lines_use_unmoving_form(self):
+        """Old yin (6) codes as yin and old yang (9) codes as yang"""
+        assert pyching_engine.hexagram_code([6, 9, 6, 9, 6, 9]) == \
+            pyching_engine.hexagram_code([8, 7, 8, 7, 8, 7])
+
+    def test_invalid_line_values_raise(self):
+        """Incomplete or invalid line values must be rejected"""
+        for lineValues in ([7, 7, 7, 0, 0, 0], [7, 7, 7], [5, 7, 7, 7, 7, 7]):
+            try:
+                pyching_engine.hexagram_code(lineValues)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{lineValues} should raise ValueError")
+
+
+class TestLookupTables:
+    """Test the King Wen lookup tables"""
+
+    def test_tables_are_inverse(self):
+        """Number to code and code to number must round trip for all 64"""
+        for number in range(1, 65):
+            code = pyching_engine.CODE_BY_NUMBER[number]
+            assert pyching_engine.NUMBER_BY_CODE[code] == number
+        assert sorted(pyching_engine.NUMBER_BY_CODE) == list(range(1, 65))
+
+    def test_names_agree(self):
+        """Names by code and names by number must agree"""
+        for code in range(64):
+            number = pyching_engine.NUMBER_BY_CODE[code]
+            assert pyching_engine.NAME_BY_CODE[code] == pyching_engine.NAME_BY_NUMBER[number]
+
+    def test_known_hexagrams(self):
+        """Spot check some traditional line patterns"""
+        # 29 K'an: yin, yang, yin, yin, yang, yin from the bottom
+        assert pyching_engine.hexagram_details(0b010010) == ('29', "K'an")
+        # 63 Tchi Tchi: alternating lines, yang at the bottom
+        assert pyching_engine.hexagram_details(0b010101) == ('63', "Tchi Tchi")
+        assert pyching_engine.hexagram_details(0b101010) == ('64', "Wei Tchi")
+
+
+class TestCompletionTable:
+    """Test the precomputed completion of all 4096 packed readings"""
+
+    def test_pack_unpack_round_trip(self):
+        """Packing and unpacking line values must round trip"""
+        for packed in range(4096):
+            lineValues = pyching_engine.unpack_lines(packed)
+            assert pyching_engine.pack_lines(lineValues) == packed
+
+    def test_completions_match_step_by_step_casting(self):
+        """Every completion must match the traditional 6->7, 9->8 transformation"""
+        for packed, completion in enumerate(pyching_engine.COMPLETIONS):
+            lineValues = pyching_engine.unpack_lines(packed)
+            hex1Key = [{6: 8, 9: 7}.get(value, value) for value in lineValues]
+            assert completion.hex1Code == pyching_engine.hexagram_code(hex1Key)
+            assert completion.hex1InfoSource == f'pyching_int_data.in{completion.hex1Number}data()'
+            if 6 in lineValues or 9 in lineValues:
+                hex2Lines = [{6: 7, 9: 8}.get(value, value) for value in lineValues]
+                assert list(completion.hex2LineValues) == hex2Lines
+                assert (completion.hex2Number, completion.hex2Name) == \
+                    pyching_engine.hexagram_details(pyching_engine.hexagram_code(hex2Lines))
+            else:
+                assert completion.movingMask == 0
+                assert completion.hex2Number == ''
+                assert completion.hex2InfoSource is None
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,161 @@
+"""
+Test Hexagrams Reuse
+====================
+
+These tests ensure a reset or recast Hexagrams instance behaves exactly like
+a new one while reusing its own objects, and that HexagramsPool hands out
+clean instances.
+"""
+
+import random
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+
+def state(hexes):
+    """Return everything a reading holds, for comparison"""
+    return (hexes.question, hexes.oracle, hexes.currentLine, list(hexes.currentOracleValues),
+            [(h.number, h.name, list(h.lineValues), h.infoSource) for h in (hexes.hex1, hexes.hex2)])
+
+
+def cast_with_moving_lines(hexes):
+    """Cast readings until one has moving lines, so both Hexagrams are filled"""
+    while True:
+        hexes.recast('first question')
+        if hexes.hex2.number:
+            return hexes
+
+
+class TestReset:
+    """Test resetting a Hexagrams instance in place"""
+
+    def test_reset_matches_new_instance(self):
+        """A reset instance must hold the same state as a new one"""
+        hexes = cast_with_moving_lines(pyching_engine.Hexagrams('coin', random.Random(1)))
+        hexes.reset('second question')
+        fresh = pyching_engine.Hexagrams('coin')
+        fresh.SetQuestion('second question')
+        assert state(hexes) == state(fresh)
+
+    def test_reset_reuses_objects(self):
+        """Reset and recast must keep the same Hexagram and line values objects"""
+        hexes = pyching_engine.Hexagrams('coin', random.Random(2))
+        objects = [hexes.hex1, hexes.hex2, hexes.hex1.lineValues, hexes.hex2.lineValues]
+        for _ in range(20):
+            hexes.recast()
+        assert all(a is b for a, b in zip(
+            [hexes.hex1, hexes.hex2, hexes.hex1.lineValues, hexes.hex2.lineValues], objects))
+
+    def test_recast_matches_new_instance(self):
+        """Recasting must give the same readings as new instances with the same random numbers"""
+        reused = pyching_engine.Hexagrams('coin', random.Random(3))
+        rng = random.Random(3)
+        for _ in range(50):
+            reused.recast('question')
+            fresh = pyching_engine.Hexagrams('coin', rng)
+            fresh.SetQuestion('question')
+            for _ in range(6):
+                fresh.NewLine()
+            assert state(reused) == state(fresh)
+            assert reused.ReadingAsText() == fresh.ReadingAsText()
+
+    def test_reset_after_tuple_oracle_values(self, monkeypatch):
+        """Oracles may return their oracle values as a tuple, reset must still work"""
+        class TupleOracle(pyching_engine.Oracle):
+            name = 'tuple coins'
+            def cast_line(self, rng):
+                return tuple(pyching_engine.get_oracle('coin').cast_line(rng))
+        monkeypatch.setitem(pyching_engine.ORACLES, TupleOracle.name, TupleOracle())
+        hexes = pyching_engine.Hexagrams(TupleOracle.name, random.Random(4))
+        hexes.recast('first')
+        assert isinstance(hexes.currentOracleValues, tuple)
+        hexes.recast('second')
+        hexes.reset()
+        assert hexes.currentOracleValues == []
+
+
+
+class TestHexagramsPool:
+    """Test the pool of reusable Hexagrams instances"""
+
+    def test_released_instances_are_reused(self):
+        """A released instance must come back reset"""
+        pool = pyching_engine.HexagramsPool()
+        with pool.reading('first') as hexes:
+            hexes.recast('first')
+        with pool.reading('second') as again:
+            assert again is hexes
+            assert again.question == 'second'
+            assert again.currentLine == 0
+            assert again.hex1.lineValues == [0, 0, 0, 0, 0, 0]
+
+    def test_pool_size_is_bounded(self):
+        """No more than size idle instances are kept"""
+        pool = pyching_engine.HexagramsPool(size=2)
+        acquired = [pool.acquire() for _ in range(5)]
+        for hexes in acquired:
+            pool.release(hexes)
+        assert len(pool._idle) == 2
+
+    def test_reused_instance_takes_acquiring_threads_generator(self):
+        """An instance acquired in another thread must cast from that thread's generator"""
+        pool = pyching_engine.HexagramsPool()
+        pool.release(pool.acquire())
+        rngs = []
+        def acquire():
+            hexes = pool.acquire()
+            rngs.append((hexes.rng, pyching_engine.thread_rng()))
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        thread.join()
+        assert rngs[0][0] is rngs[0][1]
+
+    def test_entropy_instance_is_not_shared_between_threads(self):
+        """A random.Random passed to the pool must seed one generator per thread, never be cast from"""
+        shared = random.Random(17)
+        pool = pyching_engine.HexagramsPool(entropy=shared)
+        first = pool.acquire()
+        pool.release(first)
+        assert first.rng is not shared
+        assert pool.acquire().rng is first.rng
+        rngs = []
+        thread = threading.Thread(target=lambda: rngs.append(pool.acquire().rng))
+        thread.start()
+        thread.join()
+        assert rngs[0] is not first.rng and rngs[0] is not shared
+
+    def test_os_entropy_instances_stay_os_entropy(self):
+        """SystemRandom must be used as is, and a UrandomPool must give a pool per thread"""
+        system = random.SystemRandom()
+        assert pyching_engine.HexagramsPool(entropy=system).acquire().rng is system
+        shared = pyching_engine.UrandomPool(blockSize=64)
+        pool = pyching_engine.HexagramsPool(entropy=shared)
+        first = pool.acquire().rng
+        rngs = []
+        thread = threading.Thread(target=lambda: rngs.append(pool.acquire().rng))
+        thread.start()
+        thread.join()
+        for rng in (first, rngs[0]):
+            assert type(rng) is pyching_engine.UrandomPool and rng is not shared
+            assert rng.blockSize == 64
+        assert rngs[0] is not first
+
+    def test_entropy_instance_stays_reproducible(self):
+        """Pools seeded alike must cast the same readings in a single thread"""
+        readings = []
+        for _ in range(2):
+            pool = pyching_engine.HexagramsPool(entropy=random.Random(18))
+            with pool.reading() as hexes:
+                readings.append(list(hexes.recast().hex1.lineValues))
+        assert readings[0] == readings[1]
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,156 @@
+"""
+Test Journal Log
+================
+
+These tests ensure the append-only journal log gives back every reading,
+finds records by number and by timestamp through its sparse offset index,
+and recovers from torn writes and missing or stale index sidecars.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+import pyching_journal
+
+READINGS = 500
+
+
+@pytest.fixture
+def readings():
+    """Readings with distinct questions and rising timestamps"""
+    lines = pyching_engine.cast_many(READINGS, random.Random(23))
+    return [(pyching_engine.Reading(packed, f'question {number}'), 1000.0 + 2 * number)
+            for number, packed in enumerate(lines)]
+
+
+@pytest.fixture
+def logPath(tmp_path, readings):
+    """A journal log holding the readings, indexed every 16 records"""
+    path = tmp_path / 'readings.log'
+    with pyching_journal.JournalLog(path, stride=16, batchSize=7) as log:
+        for reading, timestamp in readings:
+            log.append(reading, timestamp)
+    return path
+
+
+class TestJournalLog:
+    """Test writing and reading the journal log"""
+
+    def test_every_record_reads_back(self, logPath, readings):
+        """Records must read back by number, by slice and in order"""
+        with pyching_journal.JournalLogReader(logPath) as reader:
+            assert len(reader) == READINGS
+            assert reader.stride == 16
+            for number in (0, 1, 15, 16, 17, 255, READINGS - 1):
+                entry = reader[number]
+                assert (entry.id, entry.reading, entry.timestamp) == (number, *readings[number])
+            assert [(entry.reading, entry.timestamp) for entry in reader] == readings
+            assert [entry.id for entry in reader.entries(490, 600)] == list(range(490, 500))
+            assert reader[-1].id == READINGS - 1
+            with pytest.raises(IndexError):
+                reader[READINGS]
+
+    def test_index_is_sparse(self, logPath):
+        """The sidecar must hold one small entry per stride records"""
+        entries = -(-READINGS // 16)
+        assert pyching_journal.IndexPath(logPath).stat().st_size == 12 + 16 * entries
+
+    def test_seek_time(self, logPath):
+        """seek_time must find the first record at or after a time"""
+        with pyching_journal.JournalLogReader(logPath) as reader:
+            assert reader.seek_time(0) == 0
+            assert reader.seek_time(1000.0 + 2 * 100) == 100
+            assert reader.seek_time(1000.0 + 2 * 100 + 1) == 101
+            assert reader.seek_time(1e12) == READINGS
+
+    def test_hexagrams_are_dated(self, tmp_path):
+        """Appending a Hexagrams instance must keep its own timestamp"""
+        hexagrams = pyching_engine.Hexagrams()
+        hexagrams.recast('Dated')
+        with pyching_journal.JournalLog(tmp_path / 'dated.log') as log:
+            assert log.append(hexagrams) == 0
+        with pyching_journal.JournalLogReader(tmp_path / 'dated.log') as reader:
+            assert reader[0].timestamp == hexagrams.timestamp
+            assert reader[0].reading == pyching_engine.Reading.from_hexagrams(hexagrams)
+
+
+class TestJournalLogRecovery:
+    """Test reopening logs after crashes"""
+
+    def test_torn_record_is_dropped(self, logPath, readings):
+        """A partly written final record must be cut off, and appends carry on after it"""
+        size = logPath.stat().st_size
+        with open(logPath, 'ab') as logFile:
+            logFile.write(b'\x40\x00\x00\x00PYCH')
+        with pyching_journal.JournalLogReader(logPath) as reader:
+            assert len(reader) == READINGS
+        with pyching_journal.JournalLog(logPath) as log:
+            assert log.count == READINGS
+            assert logPath.stat().st_size == size
+            log.append(*readings[0])
+        with pyching_journal.JournalLogReader(logPath) as reader:
+            assert reader[READINGS].reading == readings[0][0]
+
+    def test_torn_record_after_stride_boundary(self, tmp_path, readings):
+        """A torn record with its own index entry must lose that entry too"""
+        path = tmp_path / 'torn.log'
+        with pyching_journal.JournalLog(path, stride=16) as log:
+            for reading, timestamp in readings[:33]:
+                log.append(reading, timestamp)
+        with open(path, 'r+b') as logFile: #tear record 32, the first of the third stride
+            logFile.truncate(path.stat().st_size - 5)
+        with pyching_journal.JournalLogReader(path) as reader:
+            assert len(reader) == 32
+            assert [entry.reading for entry in reader] == [reading for reading, _ in readings[:32]]
+        with pyching_journal.JournalLog(path) as log:
+            assert log.count == 32
+            for reading, timestamp in readings[32:40]:
+                log.append(reading, timestamp)
+        with pyching_journal.JournalLogReader(path) as reader:
+            assert list(reader.offsets) == sorted(set(reader.offsets))
+            assert len(reader.offsets) == 3
+            assert [(entry.reading, entry.timestamp) for entry in reader] == readings[:40]
+            assert reader.seek_time(readings[35][1]) == 35
+
+    def test_missing_index_is_rebuilt(self, logPath, readings):
+        """Without its sidecar a log must still be readable, and a writer must rebuild it"""
+        indexPath = pyching_journal.IndexPath(logPath)
+        size = indexPath.stat().st_size
+        indexPath.unlink()
+        with pyching_journal.JournalLogReader(logPath, stride=16) as reader:
+            assert reader[300].reading == readings[300][0]
+        with pyching_journal.JournalLog(logPath, stride=16):
+            pass
+        assert indexPath.stat().st_size == size
+
+    def test_stale_index_is_caught_up(self, logPath, readings):
+        """Index entries missing from the end must be added back"""
+        indexPath = pyching_journal.IndexPath(logPath)
+        data = indexPath.read_bytes()
+        indexPath.write_bytes(data[:12 + 16 * 3])
+        with pyching_journal.JournalLogReader(logPath) as reader:
+            assert len(reader.offsets) == len(data[12:]) // 16
+            assert reader.seek_time(readings[400][1]) == 400
+        with pyching_journal.JournalLog(logPath):
+            pass
+        assert indexPath.read_bytes() == data
+
+    def test_foreign_file_is_rejected(self, tmp_path):
+        """Files that aren't journal logs must not be opened or appended to"""
+        path = tmp_path / 'other.log'
+        path.write_bytes(b'something else entirely')
+        with pytest.raises(ValueError):
+            pyching_journal.JournalLogReader(path)
+        with pytest.raises(ValueError):
+            pyching_journal.JournalLog(path)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -17,6 +17,7 @@ THESE TESTS MUST PASS AFTER PYTHON 3 MIGRATION.
 """
 
 import sys
+from itertools import product
 from pathlib import Path
 
 # Add parent directory to path to import pyching_engine
@@ -127,6 +128,40 @@ class TestOracleProbabilities:
             f"Frequency of 8 should be ~37.5%, got {freq_8*100:.1f}%"
 
 
+    def test_exact_line_value_probabilities(self):
+        """
+        The analytic coin probabilities must match enumerating all 8 coin outcomes exactly.
+        """
+        from fractions import Fraction
+        counts = {6: 0, 7: 0, 8: 0, 9: 0}
+        for coins in product([2, 3], repeat=3):
+            counts[sum(coins)] += 1
+        expected = {value: Fraction(count, 8) for value, count in counts.items()}
+        assert pyching_engine.line_probabilities('coin') == expected
+
+    def test_each_coin_draw_gives_distinct_faces(self):
+        """
+        Each of the 8 possible 3 bit draws must toss a different set of coin
+        faces, so every coin outcome is equally likely.
+        """
+        class CountingRandom:
+            """Hands out every 3 bit draw in turn"""
+            def __init__(self):
+                self.draws = iter(range(8))
+            def getrandbits(self, k):
+                assert k == 3, "a line must be cast from a single 3 bit draw"
+                return next(self.draws)
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin', entropy=CountingRandom())
+        outcomes = []
+        for _ in range(8):
+            hexagrams.reset()
+            hexagrams.NewLine()
+            coins = list(hexagrams.currentOracleValues)
+            assert hexagrams.hex1.lineValues[0] == sum(coins)
+            outcomes.append(tuple(coins))
+        assert sorted(outcomes) == sorted(product([2, 3], repeat=3))
+
+
 class TestHexagramCompletion:
     """Test that hexagrams are properly completed after 6 lines"""
 
@@ -269,6 +304,72 @@ class TestHexagramLookup:
             f"All old yang should transform to Hexagram 2, got {hexagrams.hex2.number}"
 
 
+class TestBulkCasting:
+    """Test that the bulk casting API keeps the coin method probabilities"""
+
+    def test_coin_table_has_exact_probabilities(self):
+        """Each line of the 512 equally likely coin patterns must be 6:7:8:9 = 1:3:3:1"""
+        counts = {6: 0, 7: 0, 8: 0, 9: 0}
+        for packed in pyching_engine._COIN_LOW:
+            for value in pyching_engine.unpack_lines(packed)[:3]:
+                counts[value] += 1
+        assert counts == {6: 192, 7: 576, 8: 576, 9: 192}, \
+            f"Coin table line counts should be in 1:3:3:1 ratio, got {counts}"
+
+    def test_cast_many_line_value_frequencies(self):
+        """Bulk cast line values must appear with coin method frequencies"""
+        readings = pyching_engine.cast_many(5000)
+        counts = {6: 0, 7: 0, 8: 0, 9: 0}
+        for packed in readings:
+            for value in pyching_engine.unpack_lines(packed):
+                counts[value] += 1
+        total = 6 * len(readings)
+        assert 0.10 < counts[6] / total < 0.15
+        assert 0.10 < counts[9] / total < 0.15
+        assert 0.34 < counts[7] / total < 0.41
+        assert 0.34 < counts[8] / total < 0.41
+
+    def test_iter_readings_matches_cast_many(self):
+        """The generator and the batch call must give the same readings for the same rng"""
+        import random
+        batch = pyching_engine.cast_many(100, random.Random(42))
+        streamed = list(pyching_engine.iter_readings(100, random.Random(42), chunkSize=7))
+        assert list(batch) == streamed
+
+
+class TestVectorizedCasting:
+    """Test the column array casting backend and its pure Python fallback"""
+
+    def check_columns(self, result):
+        """Every column must agree with the completion table"""
+        for packed, moving, hex1, hex2 in zip(result.lines, result.movingMasks,
+                                              result.hex1, result.hex2):
+            completion = pyching_engine.COMPLETIONS[int(packed)]
+            assert moving == completion.movingMask
+            assert str(hex1) == completion.hex1Number
+            assert hex2 == int(completion.hex2Number or 0)
+
+    def test_fallback_columns(self, monkeypatch):
+        """Without numpy, cast_arrays must fall back to cast_many"""
+        import random
+        monkeypatch.setattr(pyching_engine, '_Numpy', lambda: None)
+        result = pyching_engine.cast_arrays(500, seed=7)
+        assert list(result.lines) == list(pyching_engine.cast_many(500, random.Random(7)))
+        self.check_columns(result)
+
+    def test_numpy_columns(self):
+        """With numpy, the vectorized columns must agree with the completion table"""
+        import pytest
+        numpy = pytest.importorskip('numpy')
+        result = pyching_engine.cast_arrays(2000, seed=7)
+        assert isinstance(result.lines, numpy.ndarray)
+        self.check_columns(result)
+        # no moving lines happens with probability (3/4)**6
+        unmoving = float((result.hex2 == 0).mean())
+        assert 0.13 < unmoving < 0.23, \
+            f"About 17.8% of readings should have no moving lines, got {unmoving*100:.1f}%"
+
+
 if __name__ == '__main__':
     # Simple test runner for manual testing
     import pytest
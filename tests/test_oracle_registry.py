@@ -0,0 +1,153 @@
+"""
+Test Oracle Registry
+====================
+
+These tests ensure every registered casting method honours the oracle
+contract: step by step casting, batch casting of lines and readings, and
+vectorized casting all give the method's own exact line probabilities.
+"""
+
+import random
+import sys
+from fractions import Fraction
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+ORACLES = tuple(pyching_engine.ORACLES)
+
+
+def chi_squared(lineValues, probabilities):
+    """Chi-squared statistic of observed line values against exact probabilities"""
+    counts = {6: 0, 7: 0, 8: 0, 9: 0}
+    for value in lineValues:
+        counts[value] += 1
+    total = len(lineValues)
+    return sum((counts[value] - total * p) ** 2 / (total * p)
+               for value, p in probabilities.items() if p)
+
+
+class TestRegistry:
+    """Test registering and looking up casting methods"""
+
+    def test_builtin_oracles_registered(self):
+        """All the built in casting methods must be registered"""
+        for name in ('coin', 'yarrow', 'yarrow-stalks', 'sixteen-marble', 'two-dice'):
+            assert pyching_engine.get_oracle(name).name == name
+
+    def test_duplicate_name_rejected(self):
+        """A name can only be registered once"""
+        with pytest.raises(ValueError):
+            pyching_engine.register_oracle(pyching_engine.CoinOracle())
+
+    def test_new_oracle_works_everywhere(self):
+        """A method providing only cast_line must cast step by step and in bulk"""
+        class AlwaysYang(pyching_engine.Oracle):
+            name = 'test-always-yang'
+            def cast_line(self, rng):
+                return [7]
+        pyching_engine.register_oracle(AlwaysYang())
+        try:
+            hexagrams = pyching_engine.Hexagrams(oracleType='test-always-yang')
+            for _ in range(6):
+                hexagrams.NewLine()
+            assert hexagrams.hex1.number == '1'
+            assert set(pyching_engine.cast_many(10, random.Random(1), 'test-always-yang')) == \
+                {pyching_engine.pack_lines([7] * 6)}
+            arrays = pyching_engine.cast_arrays(10, seed=1, oracle='test-always-yang')
+            assert set(arrays.hex1) == {1}
+        finally:
+            del pyching_engine.ORACLES['test-always-yang']
+
+    def test_probabilities_without_line_weights(self):
+        """A method without lineWeights must get exact probabilities from its cast_line"""
+        class CoinAndDie(pyching_engine.Oracle):
+            name = 'test-coin-and-die'
+            def cast_line(self, rng):
+                #a coin, then a die only on heads: 9 on a six, 7 otherwise, tails gives 6 or 8
+                if rng.getrandbits(1):
+                    return [9 if rng.randint(1, 6) == 6 else 7]
+                return [rng.choice((6, 8, 8))]
+        class Continuous(pyching_engine.Oracle):
+            name = 'test-continuous'
+            def cast_line(self, rng):
+                return [6 if rng.random() < 0.5 else 7]
+        pyching_engine.register_oracle(CoinAndDie())
+        pyching_engine.register_oracle(Continuous())
+        try:
+            assert pyching_engine.line_probabilities('test-coin-and-die') == {
+                6: Fraction(1, 6), 7: Fraction(5, 12), 8: Fraction(1, 3), 9: Fraction(1, 12)}
+            assert pyching_engine.outcome_distribution('test-coin-and-die').probability(1) == \
+                Fraction(5, 12) ** 6
+            with pytest.raises(ValueError):
+                pyching_engine.get_oracle('test-continuous').line_probabilities()
+        finally:
+            del pyching_engine.ORACLES['test-coin-and-die']
+            del pyching_engine.ORACLES['test-continuous']
+
+    @pytest.mark.parametrize('oracle', ['coin', 'yarrow', 'sixteen-marble', 'two-dice'])
+    def test_enumerated_probabilities_match_line_weights(self, oracle):
+        """Working the probabilities out from cast_line must agree with lineWeights"""
+        method = pyching_engine.get_oracle(oracle)
+        assert pyching_engine._EnumerateLineProbabilities(method) == method.line_probabilities()
+
+
+class TestOracleContract:
+    """Test each registered method against its exact line probabilities"""
+
+    @pytest.mark.parametrize('oracle', ORACLES)
+    def test_step_by_step_casting(self, oracle):
+        """NewLine must give the method's line values"""
+        hexagrams = pyching_engine.Hexagrams(oracleType=oracle, entropy=random.Random(3))
+        method = pyching_engine.get_oracle(oracle)
+        for _ in range(6):
+            hexagrams.NewLine()
+            line_value = hexagrams.hex1.lineValues[hexagrams.currentLine - 1]
+            assert line_value == method.line_value(hexagrams.currentOracleValues)
+        assert hexagrams.hex1.number != ''
+
+    @pytest.mark.parametrize('oracle', ORACLES)
+    def test_batch_lines_fit_probabilities(self, oracle):
+        """cast_lines must fit the exact line probabilities"""
+        method = pyching_engine.get_oracle(oracle)
+        lineValues = method.cast_lines(random.Random(11), 12000)
+        # 3 degrees of freedom, 0.1% critical value 16.27
+        assert chi_squared(lineValues, method.line_probabilities()) < 16.27
+
+    @pytest.mark.parametrize('oracle', ORACLES)
+    def test_bulk_readings_fit_probabilities(self, oracle):
+        """cast_many must fit the exact line probabilities"""
+        probabilities = pyching_engine.line_probabilities(oracle)
+        lineValues = [value for packed in pyching_engine.cast_many(2000, random.Random(12), oracle)
+                      for value in pyching_engine.unpack_lines(packed)]
+        assert chi_squared(lineValues, probabilities) < 16.27
+
+    @pytest.mark.parametrize('oracle', ORACLES)
+    def test_vectorized_readings_fit_probabilities(self, oracle):
+        """cast_arrays must fit the exact line probabilities, on either backend"""
+        probabilities = pyching_engine.line_probabilities(oracle)
+        arrays = pyching_engine.cast_arrays(2000, seed=13, oracle=oracle)
+        lineValues = [value for packed in arrays.lines
+                      for value in pyching_engine.unpack_lines(int(packed))]
+        assert chi_squared(lineValues, probabilities) < 16.27
+
+    def test_two_dice_faces(self):
+        """Two dice must record both faces and look up the line value"""
+        method = pyching_engine.get_oracle('two-dice')
+        rng = random.Random(4)
+        for _ in range(200):
+            faces = method.cast_line(rng)
+            assert len(faces) == 2 and all(1 <= face <= 4 for face in faces)
+        lineValues = [method.line_value([first, second])
+                      for first in range(1, 5) for second in range(1, 5)]
+        assert sorted(lineValues) == list(pyching_engine.SIXTEEN_LINES)
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,117 @@
+"""
+Test Oracle Yarrow Stalk Method
+===============================
+
+These tests ensure the yarrow stalk oracle gives the traditional line
+probabilities, both from the faithful stalk division simulation and from
+the fast alias table sampler:
+  - 6 (old yin):  1/16
+  - 7 (yang):     5/16
+  - 8 (yin):      7/16
+  - 9 (old yang): 3/16
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+YARROW_PROBABILITIES = {6: 1 / 16, 7: 5 / 16, 8: 7 / 16, 9: 3 / 16}
+
+
+def line_frequencies(lineValues):
+    """Return the relative frequency of each line value"""
+    counts = {6: 0, 7: 0, 8: 0, 9: 0}
+    for value in lineValues:
+        counts[value] += 1
+    return {value: count / len(lineValues) for value, count in counts.items()}
+
+
+class TestAliasTable:
+    """Test the exactness of the alias table sampler"""
+
+    def test_yarrow_table_is_exact(self):
+        """Every possible random draw must map to outcomes in exactly 1:5:7:3 proportion"""
+        table = pyching_engine.YARROW_LINES
+        counts = {6: 0, 7: 0, 8: 0, 9: 0}
+        for draw in range(table.size):
+            column, threshold = divmod(draw, table.total)
+            outcome = table.outcomes[column] if threshold < table.accept[column] else table.alias[column]
+            counts[outcome] += 1
+        assert counts == {6: 4, 7: 20, 8: 28, 9: 12}
+
+    def test_uneven_weights(self):
+        """Alias tables must work for any integer weights"""
+        table = pyching_engine.AliasTable('abc', (1, 0, 6))
+        rng = random.Random(1)
+        samples = [table.sample(rng) for _ in range(7000)]
+        assert 'b' not in samples
+        assert 800 < samples.count('a') < 1200
+
+
+class TestYarrowCasting:
+    """Test casting readings with the yarrow oracles"""
+
+    def test_stalk_counts_are_valid(self):
+        """Each stalk division must count 2 or 3"""
+        rng = random.Random(5)
+        for _ in range(500):
+            counts = pyching_engine.YarrowStalkCounts(rng)
+            assert len(counts) == 3
+            assert all(count in (2, 3) for count in counts)
+
+    def test_hexagrams_cast_with_both_yarrow_oracles(self):
+        """Both yarrow oracles must complete a reading step by step"""
+        for oracle in ('yarrow', 'yarrow-stalks'):
+            hexagrams = pyching_engine.Hexagrams(oracleType=oracle)
+            for _ in range(6):
+                hexagrams.NewLine()
+                line_value = hexagrams.hex1.lineValues[hexagrams.currentLine - 1]
+                assert line_value == sum(hexagrams.currentOracleValues)
+            assert all(value in (6, 7, 8, 9) for value in hexagrams.hex1.lineValues)
+            assert hexagrams.hex1.number != ''
+
+    def test_unknown_oracle_raises(self):
+        """An unknown oracle type must be rejected when the Hexagrams are made"""
+        try:
+            pyching_engine.Hexagrams(oracleType='tortoise shell')
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Unknown oracle type should raise ValueError")
+        hexagrams = pyching_engine.Hexagrams()
+        hexagrams.oracle = 'tortoise shell' #as loaded from a save file by a newer version
+        try:
+            hexagrams.NewLine()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Casting with an unknown oracle type should raise ValueError")
+
+
+class TestYarrowEquivalence:
+    """Test that the faithful and fast yarrow methods are statistically equivalent"""
+
+    def test_both_methods_match_yarrow_probabilities(self):
+        """Both methods must give the yarrow line probabilities within sampling error"""
+        rng = random.Random(2025)
+        faithful = [value for packed in pyching_engine.cast_many(4000, rng, 'yarrow-stalks')
+                    for value in pyching_engine.unpack_lines(packed)]
+        fast = [value for packed in pyching_engine.cast_many(4000, rng, 'yarrow')
+                for value in pyching_engine.unpack_lines(packed)]
+        for name, lineValues in (('faithful', faithful), ('fast', fast)):
+            frequencies = line_frequencies(lineValues)
+            # chi-squared goodness of fit, 3 degrees of freedom, 0.1% critical value 16.27
+            chiSquared = sum((frequencies[value] - p) ** 2 / p * len(lineValues)
+                             for value, p in YARROW_PROBABILITIES.items())
+            assert chiSquared < 16.27, \
+                f"{name} yarrow line frequencies {frequencies} don't fit the yarrow probabilities"
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])
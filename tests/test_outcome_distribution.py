@@ -0,0 +1,82 @@
+"""
+Test Outcome Distributions
+==========================
+
+These tests check the exact (hex1, hex2) outcome probabilities computed by
+enumerating all 4096 line configurations, with no sampling involved.
+"""
+
+import sys
+from fractions import Fraction
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+ORACLES = ('coin', 'yarrow', 'yarrow-stalks')
+
+
+class TestLineProbabilities:
+    """Test the per-line probabilities of each oracle"""
+
+    @pytest.mark.parametrize('oracle', ORACLES)
+    def test_line_probabilities_sum_to_one(self, oracle):
+        """Line value probabilities must be a distribution"""
+        assert sum(pyching_engine.line_probabilities(oracle).values()) == 1
+
+    def test_yarrow_stalks_near_ideal_yarrow(self):
+        """The stalk simulation must be within 0.001% of the ideal yarrow probabilities"""
+        stalks = pyching_engine.line_probabilities('yarrow-stalks')
+        ideal = pyching_engine.line_probabilities('yarrow')
+        for value in (6, 7, 8, 9):
+            assert abs(stalks[value] - ideal[value]) < Fraction(1, 100000)
+
+    def test_unknown_oracle_raises(self):
+        """Unknown oracle types must be rejected"""
+        with pytest.raises(ValueError):
+            pyching_engine.line_probabilities('tortoise shell')
+
+
+class TestOutcomeDistribution:
+    """Test exact reading outcome probabilities"""
+
+    @pytest.mark.parametrize('oracle', ORACLES)
+    def test_outcomes_sum_to_one(self, oracle):
+        """All 4096 configurations and all 64 x 64 outcomes must each sum to 1"""
+        distribution = pyching_engine.outcome_distribution(oracle)
+        assert sum(distribution.packed) == 1
+        assert sum(map(sum, distribution.matrix())) == 1
+
+    @pytest.mark.parametrize('oracle', ('coin', 'yarrow'))
+    def test_hex1_is_uniform(self, oracle):
+        """Yang and yin are equally likely in both methods, so every hex1 is 1/64"""
+        probabilities = pyching_engine.outcome_distribution(oracle).hex1_probabilities()
+        assert probabilities[1:] == [Fraction(1, 64)] * 64
+
+    def test_coin_known_outcomes(self):
+        """Spot check coin outcomes against hand calculation"""
+        distribution = pyching_engine.outcome_distribution('coin')
+        # all six lines old yang: (1/8)**6
+        assert distribution.probability(1, 2) == Fraction(1, 8) ** 6
+        # no moving lines at all: (3/4)**6 spread evenly over 64 hexagrams
+        assert distribution.probability(29) == Fraction(3, 4) ** 6 / 64
+        assert distribution.probability(29, 29) == distribution.probability(29)
+
+    def test_matrix_layout(self):
+        """Rows are hex1 and columns hex2, both King Wen number - 1"""
+        matrix = pyching_engine.outcome_distribution('coin').matrix(exact=False)
+        assert len(matrix) == 64 and all(len(row) == 64 for row in matrix)
+        assert matrix[0][1] == pytest.approx(float(Fraction(1, 8) ** 6))
+        assert isinstance(matrix[0][0], float)
+
+    def test_distribution_is_cached(self):
+        """Each oracle's distribution must only be computed once"""
+        assert pyching_engine.outcome_distribution('coin') is pyching_engine.outcome_distribution('coin')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,130 @@
+"""
+Test Reading Journal
+====================
+
+These tests ensure readings stored in the sqlite journal come back intact and
+that every indexed query condition selects exactly the matching readings.
+"""
+
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+import pyching_journal
+
+START_2025 = datetime(2025, 1, 1).timestamp()
+START_2026 = datetime(2026, 1, 1).timestamp()
+
+
+@pytest.fixture
+def batch():
+    """2000 coin readings spread over 2024 to 2026, with a few kinds of question"""
+    rng = random.Random(22)
+    batch = pyching_engine.ReadingBatch()
+    timestamps = sorted(rng.uniform(datetime(2024, 1, 1).timestamp(), datetime(2027, 1, 1).timestamp())
+                        for _ in range(2000))
+    questions = [('Will it rain?', 'Should I move house?', 'Is the job right for me?')[i % 3]
+                 for i in range(2000)]
+    batch.extend(pyching_engine.cast_many(2000, rng), questions, timestamps)
+    return batch
+
+
+@pytest.fixture
+def journal(batch):
+    """An in memory journal holding the batch"""
+    with pyching_journal.ReadingJournal() as journal:
+        assert journal.add_batch(batch) == len(batch)
+        yield journal
+
+
+class TestJournalStorage:
+    """Test adding readings to the journal"""
+
+    def test_hexagrams_round_trip(self, tmp_path):
+        """A cast reading must come back with its timestamp, question and oracle"""
+        hexagrams = pyching_engine.Hexagrams('yarrow')
+        hexagrams.recast('Journal test')
+        with pyching_journal.ReadingJournal(tmp_path / 'journal.db') as journal:
+            rowId = journal.add(hexagrams)
+        with pyching_journal.ReadingJournal(tmp_path / 'journal.db') as journal:
+            entries = journal.query()
+        assert entries == [pyching_journal.JournalEntry(
+            rowId, hexagrams.timestamp, pyching_engine.Reading.from_hexagrams(hexagrams))]
+
+    def test_add_many(self):
+        """Readings with and without timestamps must all be added in one call"""
+        readings = [pyching_engine.Reading(packed, 'q') for packed in pyching_engine.cast_many(10)]
+        with pyching_journal.ReadingJournal() as journal:
+            assert journal.add_many(readings[:5] + [(reading, 5.0) for reading in readings[5:]]) == 10
+            assert len(journal) == 10
+            assert [entry.reading for entry in journal.query()] == readings
+            assert journal.count(start=1.0) == 5
+
+
+class TestJournalQueries:
+    """Test the indexed query conditions against a plain scan of the batch"""
+
+    def expected(self, batch, keep):
+        """Return the batch rows that keep accepts"""
+        return [(reading, timestamp) for reading, timestamp in zip(batch, batch.timestamps)
+                if keep(reading, timestamp)]
+
+    def test_hexagram_in_a_year(self, batch, journal):
+        """All readings of hexagram 29 in 2025, as either hex1 or hex2"""
+        entries = journal.query(hexagram=29, start=datetime(2025, 1, 1), end=datetime(2026, 1, 1))
+        assert [(entry.reading, entry.timestamp) for entry in entries] == self.expected(
+            batch, lambda reading, timestamp: 29 in (reading.hex1, reading.hex2) and
+            START_2025 <= timestamp < START_2026)
+        assert entries
+
+    def test_indexed_columns(self, batch, journal):
+        """hex1, hex2 and moving line conditions must each match the scan"""
+        assert journal.count(hex1=1) == len(self.expected(batch, lambda r, t: r.hex1 == 1))
+        assert journal.count(hex2=0) == len(self.expected(batch, lambda r, t: r.hex2 == 0))
+        assert journal.count(moving=0b000001) == \
+            len(self.expected(batch, lambda r, t: r.movingMask == 1))
+        assert journal.count(oracle='coin') == len(batch)
+        assert journal.count(oracle='yarrow') == 0
+
+    def test_question_text(self, batch, journal):
+        """Text must match questions containing every word"""
+        assert journal.count(text='rain') == len(self.expected(batch, lambda r, t: 'rain' in r.question))
+        assert journal.count(text='move house') == journal.count(text='house')
+        assert journal.count(text='rain house') == 0
+
+    def test_order_and_limit(self, journal):
+        """Entries come oldest first, and limit cuts the list"""
+        entries = journal.query(limit=50)
+        assert len(entries) == 50
+        assert [entry.timestamp for entry in entries] == sorted(entry.timestamp for entry in entries)
+
+    def test_without_full_text_index(self, batch, journal):
+        """The scanning fallback must find the same questions as the full text index"""
+        fullText = journal.count(text='right job')
+        journal.fullText = False
+        assert journal.count(text='right job') == fullText
+        assert journal.count(text='100%') == 0
+
+    @pytest.mark.parametrize('text, expected', [
+        ('cafe', 1), ('café', 1), ('rain*', 2), ('rain?', 2), ('RAIN', 2),
+        ('rain go', 1), ('?', 4), ('rai', 0), ('100%', 0)])
+    def test_both_backends_match_whole_words(self, text, expected):
+        """With and without the full text index, text must match the same whole words"""
+        questions = ('Will it rain?', 'Is the café open?', 'Rain, rain, go away', 'raining again')
+        with pyching_journal.ReadingJournal() as journal:
+            journal.add_many(pyching_engine.Reading(0, question) for question in questions)
+            counts = [journal.count(text=text)]
+            journal.fullText = False
+            counts.append(journal.count(text=text))
+        assert counts == [expected, expected]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
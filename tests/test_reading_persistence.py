@@ -7,10 +7,14 @@ These tests ensure that readings can be saved, loaded, and include questions.
 THESE TESTS MUST PASS AFTER PYTHON 3 MIGRATION.
 """
 
+import pickle
 import sys
 import tempfile
+import time
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -155,6 +159,165 @@ class TestReadingSaveLoad:
                 temp_path.unlink()
 
 
+
+class TestBinarySaveFormat:
+    """Test the versioned binary save format and loading legacy pickle files"""
+
+    def cast(self, question="Binary test"):
+        """Return a complete coin reading"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        hexagrams.SetQuestion(question)
+        for _ in range(6):
+            hexagrams.NewLine()
+        return hexagrams
+
+    def test_binary_is_default_and_compact(self):
+        """Save must write the fixed header, three coins and the utf-8 question"""
+        hexagrams = self.cast("Größe?")
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'reading.psv'
+            hexagrams.Save(path)
+            data = path.read_bytes()
+        assert data.startswith(pyching_engine.SAVE_MAGIC)
+        assert len(data) == pyching_engine.SAVE_HEADER.size + 3 + len("Größe?".encode())
+        saved = pyching_engine.decode_save(data)
+        assert saved.lines == pyching_engine.pack_lines(hexagrams.hex1.lineValues)
+        assert saved.question == "Größe?"
+        assert saved.oracleValues == tuple(hexagrams.currentOracleValues)
+
+    def test_round_trip_keeps_everything(self):
+        """Every saved attribute must load back unchanged"""
+        hexagrams = self.cast()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'reading.psv'
+            hexagrams.Save(path)
+            loaded = pyching_engine.Hexagrams()
+            assert loaded.Load(path) == (pyching_engine.pyching.saveFileID[0],
+                                         str(pyching_engine.SAVE_VERSION))
+        assert loaded.key() == hexagrams.key()
+        assert loaded.timestamp == hexagrams.timestamp > 0
+        assert loaded.currentOracleValues == hexagrams.currentOracleValues
+        assert loaded.ReadingAsText() == hexagrams.ReadingAsText()
+        assert vars(loaded.hex2) == vars(hexagrams.hex2)
+
+    def test_unlisted_oracle_name_is_kept(self):
+        """Oracles without a save file id must be saved by name"""
+        hexagrams = self.cast()
+        hexagrams.oracle = 'tortoise shell'
+        data = pyching_engine.encode_save(hexagrams)
+        assert pyching_engine.decode_save(data).oracle == 'tortoise shell'
+
+    def test_long_questions_round_trip(self):
+        """Questions longer than 65535 utf-8 bytes must save and load"""
+        hexagrams = self.cast("é" * 40000)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'long.psv'
+            hexagrams.Save(path)
+            loaded = pyching_engine.Hexagrams()
+            loaded.Load(path)
+            assert pyching_engine.peek_save_info(path).hex1 == int(hexagrams.hex1.number)
+        assert loaded.question == hexagrams.question
+
+    def test_unsaveable_reading_raises_value_error(self):
+        """A reading too large for the header must raise ValueError and write nothing"""
+        hexagrams = self.cast()
+        hexagrams.currentOracleValues = [2] * 300
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'large.psv'
+            with pytest.raises(ValueError):
+                hexagrams.Save(path)
+            assert not path.exists()
+
+    def test_legacy_pickle_files_still_load(self):
+        """Pickle save files must load, dated by their modification time"""
+        hexagrams = self.cast("Legacy test")
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'legacy.psv'
+            hexagrams.Save(path, fileFormat='pickle')
+            assert not path.read_bytes().startswith(pyching_engine.SAVE_MAGIC)
+            loaded = pyching_engine.Hexagrams()
+            assert loaded.Load(path) == pyching_engine.pyching.saveFileID
+            assert loaded.timestamp == path.stat().st_mtime
+        assert loaded.key() == hexagrams.key()
+
+    def test_bad_files_are_rejected(self):
+        """Damaged, newer or foreign files must raise rather than load"""
+        good = pyching_engine.encode_save(self.cast())
+        newer = good[:4] + bytes([pyching_engine.SAVE_VERSION + 1]) + good[5:]
+        for data in (good[:10], good[:-3], newer):
+            with pytest.raises(ValueError):
+                pyching_engine.decode_save(data)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'foreign.psv'
+            path.write_bytes(b'not a save file')
+            with pytest.raises(Exception):
+                pyching_engine.Hexagrams().Load(path)
+
+
+class TestPeekSaveInfo:
+    """Test summarising save files from their first bytes"""
+
+    def test_binary_summary_matches_reading(self):
+        """A complete binary save must report its version, time and hexagram numbers"""
+        hexagrams = TestBinarySaveFormat().cast()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'reading.psv'
+            hexagrams.Save(path)
+            info = pyching_engine.peek_save_info(path)
+        assert info.fileType == 'binary'
+        assert info.version == str(pyching_engine.SAVE_VERSION)
+        assert info.timestamp == hexagrams.timestamp
+        assert info.currentLine == 6
+        assert info.hex1 == int(hexagrams.hex1.number)
+        assert info.hex2 == int(hexagrams.hex2.number or 0)
+
+    def test_partial_reading_has_no_hexagrams(self):
+        """A reading saved part way through must report its lines but no hexagrams"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        for _ in range(3):
+            hexagrams.NewLine()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'partial.psv'
+            before = time.time()
+            hexagrams.Save(path)
+            info = pyching_engine.peek_save_info(path)
+            index = pyching_engine.SaveIndex(directory)
+            index.refresh()
+        assert (info.currentLine, info.hex1, info.hex2) == (3, 0, 0)
+        assert before <= info.timestamp <= time.time()
+        assert index.entries['partial.psv'].timestamp == info.timestamp
+
+    def test_undated_reading_uses_modification_time(self):
+        """A binary save without a timestamp must be dated by its modification time"""
+        reading = pyching_engine.Reading(pyching_engine.pack_lines([7] * 6), 'Undated')
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'undated.psv'
+            path.write_bytes(pyching_engine.encode_reading(reading))
+            assert pyching_engine.peek_save_info(path).timestamp == path.stat().st_mtime
+
+    def test_legacy_pickle_is_recognised_unloaded(self):
+        """Pickle saves must report their program version without being unpickled"""
+        hexagrams = TestBinarySaveFormat().cast()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'legacy.psv'
+            hexagrams.Save(path, fileFormat='pickle')
+            info = pyching_engine.peek_save_info(path)
+            assert info == ('pickle', pyching_engine.pyching.saveFileID[1],
+                            path.stat().st_mtime, None, 0, 0)
+
+    def test_bad_files_are_rejected(self):
+        """Foreign, other pickles, truncated and newer files must raise ValueError"""
+        good = pyching_engine.encode_save(TestBinarySaveFormat().cast())
+        newer = good[:4] + bytes([pyching_engine.SAVE_VERSION + 1]) + good[5:]
+        other = pickle.dumps(('another_program', '1.0'))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'bad.psv'
+            for data in (b'not a save file', other, good[:10], good[:-3], newer):
+                path.write_bytes(data)
+                with pytest.raises(ValueError):
+                    pyching_engine.peek_save_info(path)
+
+
 class TestReadingAsText:
     """Test that readings can be converted to text representation"""
 
@@ -218,6 +381,167 @@ class TestReadingAsText:
             "Text should contain 'no moving lines' when there are none"
 
 
+class TestReadingValue:
+    """Test the compact, immutable Reading value type"""
+
+    def test_round_trip_through_hexagrams(self):
+        """A Reading must carry everything needed to rebuild the Hexagrams"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        hexagrams.SetQuestion("Value test")
+        for _ in range(6):
+            hexagrams.NewLine()
+
+        reading = pyching_engine.Reading.from_hexagrams(hexagrams)
+        assert str(reading.hex1) == hexagrams.hex1.number
+        assert reading.hex2 == int(hexagrams.hex2.number or 0)
+        assert list(reading.lineValues) == hexagrams.hex1.lineValues
+
+        rebuilt = reading.to_hexagrams()
+        assert rebuilt.ReadingAsText() == hexagrams.ReadingAsText()
+        assert rebuilt.hex2.lineValues == hexagrams.hex2.lineValues
+
+    def test_reading_is_immutable_and_slotted(self):
+        """Readings must not have an instance __dict__ or accept new values"""
+        import dataclasses
+        import pytest
+        reading = pyching_engine.Reading(0, "Immutable", 'coin')
+        assert not hasattr(reading, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            reading.question = "Changed"
+
+    def test_incomplete_reading_rejected(self):
+        """Only complete readings have a Reading value"""
+        import pytest
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        for _ in range(3):
+            hexagrams.NewLine()
+        with pytest.raises(ValueError):
+            pyching_engine.Reading.from_hexagrams(hexagrams)
+
+
+class TestReadingBatch:
+    """Test the columnar ReadingBatch store"""
+
+    def test_columns_match_completion_table(self):
+        """Column accessors must agree with completing each reading on its own"""
+        import random
+        batch = pyching_engine.ReadingBatch.cast(2000, random.Random(3), question="Batch", timestamp=1.5)
+        hex1, hex2, moving = batch.hex1_numbers(), batch.hex2_numbers(), batch.moving_masks()
+        for i, reading in enumerate(batch):
+            completion = reading.completion
+            assert str(hex1[i]) == completion.hex1Number
+            assert hex2[i] == int(completion.hex2Number or 0)
+            assert moving[i] == completion.movingMask
+        assert batch[0].question == "Batch" and batch.timestamps[-1] == 1.5
+
+    def test_hexagram_counts(self):
+        """Hexagram counts must add up to the number of readings"""
+        batch = pyching_engine.ReadingBatch()
+        batch.extend([0, 0, pyching_engine.pack_lines([9, 9, 9, 9, 9, 9])])
+        hex1Counts = batch.hexagram_counts(1)
+        hex2Counts = batch.hexagram_counts(2)
+        assert hex1Counts[1] == 1 and hex1Counts[2] == 2
+        # packed 0 is all old yin: Koun (2) becomes Tch'ien (1)
+        assert hex2Counts[1] == 2 and hex2Counts[2] == 1
+        assert sum(hex1Counts) == sum(hex2Counts) == len(batch) == 3
+
+    def test_side_columns_must_line_up(self):
+        """Questions and timestamps must have one entry per reading"""
+        import pytest
+        batch = pyching_engine.ReadingBatch()
+        with pytest.raises(ValueError):
+            batch.extend([1, 2, 3], questions=["only one"])
+
+
+class TestReadingShapes:
+    """Test the interned reading shapes shared between readings"""
+
+    def test_shapes_are_interned(self):
+        """Readings with the same line values must share one shape object"""
+        packed = pyching_engine.pack_lines([7, 8, 9, 6, 7, 8])
+        first = pyching_engine.Reading(packed, "First question")
+        second = pyching_engine.Reading(packed, "Second question")
+        assert first.shape is second.shape
+        assert first.shape.movingLines == (3, 4)
+        assert first.shape.completion is pyching_engine.COMPLETIONS[packed]
+
+    def test_shape_diagram_matches_reading_text(self):
+        """The shared diagram must be the reading text without its question"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        hexagrams.SetQuestion("Diagram test")
+        hexagrams.hex1.lineValues = [9, 7, 8, 6, 7, 7]
+        hexagrams.currentLine = 6
+        hexagrams.NewLine()
+        shape = pyching_engine.Reading.from_hexagrams(hexagrams).shape
+        direct = pyching_engine.ReadingDiagram(hexagrams.hex1, hexagrams.hex2)
+        assert shape.diagram == direct
+        assert hexagrams.ReadingAsText() == direct + '\n Diagram test\n\n'
+
+    def test_partial_reading_text(self):
+        """Partly cast readings are rendered directly, without a shape"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        hexagrams.SetQuestion("Partial")
+        for _ in range(2):
+            hexagrams.NewLine()
+        assert hexagrams.ReadingAsText().endswith('\n Partial\n\n')
+
+
+
+class TestReadingKeys:
+    """Test the canonical reading keys used for memoizing rendered output"""
+
+    def complete(self, question, lineValues=(9, 7, 8, 6, 7, 7)):
+        """Return a complete coin reading with the given question and line values"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        hexagrams.SetQuestion(question)
+        hexagrams.hex1.lineValues = list(lineValues)
+        hexagrams.currentLine = 6
+        hexagrams.NewLine()
+        return hexagrams
+
+    def test_key_is_canonical(self):
+        """Readings differing only in question whitespace must share one hashable key"""
+        first = self.complete("Will it  rain?")
+        second = self.complete("  Will it rain? ")
+        assert first.key() == second.key()
+        assert hash(first.key()) == hash(second.key())
+        assert first.key() == pyching_engine.ReadingKey(
+            pyching_engine.pack_lines([9, 7, 8, 6, 7, 7]), 'coin', "Will it rain?")
+        assert first.key() != self.complete("will it rain?").key()
+
+    def test_reading_and_hexagrams_keys_agree(self):
+        """A Reading must have the same key as the Hexagrams it came from"""
+        hexagrams = self.complete("Key test")
+        reading = pyching_engine.Reading.from_hexagrams(hexagrams)
+        assert reading.key() == hexagrams.key()
+        assert len({reading, pyching_engine.Reading.from_hexagrams(hexagrams)}) == 1
+        assert hash(reading.shape) == hash(pyching_engine.ReadingShape.build(reading.lines))
+
+    def test_partial_reading_has_no_key(self):
+        """A key needs all six lines"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        hexagrams.NewLine()
+        with pytest.raises(ValueError):
+            hexagrams.key()
+
+    def test_memoized_text_is_unchanged(self):
+        """Memoized and directly rendered reading text must match, whatever the question spacing"""
+        for question in ("Memo test", " Memo  test "):
+            hexagrams = self.complete(question)
+            direct = pyching_engine.ReadingDiagram(hexagrams.hex1, hexagrams.hex2) + \
+                '\n ' + question + '\n\n'
+            assert hexagrams.ReadingAsText() == direct
+        assert pyching_engine.reading_text(hexagrams.key()) is \
+            pyching_engine.reading_text(self.complete("Memo test").key())
+
+    def test_memoized_html(self):
+        """Reading html must be built once per plan, and match building it from the plan"""
+        import pyching_int_data
+        key = self.complete("Html test").key()
+        html = pyching_int_data.ReadingHtml(pyching_engine.reading_plan(key))
+        assert html is pyching_int_data.ReadingHtml(pyching_engine.reading_plan(key))
+        assert html == pyching_int_data.BuildPlanHtml(pyching_engine.reading_plan(key))
+
 if __name__ == '__main__':
     import pytest
     pytest.main([__file__, '-v'])
@@ -0,0 +1,107 @@
+"""
+Test Reading Plans
+==================
+
+These tests ensure the precomputed reading plans pick the traditional
+texts for each number of moving lines, and that plan html only holds the
+planned parts of the Legge translation.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+import pyching_int_data
+
+JUDGEMENT = pyching_engine.JUDGEMENT
+
+
+def plan(lineValues, ruleSet='zhu xi'):
+    """Return the reading plan for a list of line values"""
+    return pyching_engine.reading_plan(pyching_engine.pack_lines(lineValues), ruleSet).parts
+
+
+class TestZhuXiRules:
+    """Test Zhu Xi's moving line rules, using Tchi Tchi (63) as hex1"""
+
+    def test_no_moving_lines(self):
+        """Read the judgement of hex1"""
+        assert plan([7, 8, 7, 8, 7, 8]) == ((63, (JUDGEMENT,)),)
+
+    def test_one_moving_line(self):
+        """Read the moving line of hex1"""
+        assert plan([7, 8, 7, 6, 7, 8]) == ((63, (4,)),)
+
+    def test_two_moving_lines(self):
+        """Read both moving lines of hex1, the upper one first"""
+        assert plan([9, 6, 7, 8, 7, 8]) == ((63, (2, 1)),)
+
+    def test_three_moving_lines(self):
+        """Read the judgements of hex1 and hex2"""
+        assert plan([9, 6, 9, 8, 7, 8]) == ((63, (JUDGEMENT,)), (29, (JUDGEMENT,)))
+
+    def test_four_and_five_moving_lines(self):
+        """Read the unmoving lines of hex2, the lower one first"""
+        assert plan([9, 6, 9, 6, 7, 8]) == ((47, (5, 6)),)
+        assert plan([9, 6, 9, 6, 9, 8]) == ((40, (6,)),)
+
+    def test_six_moving_lines(self):
+        """Read the judgement of hex2"""
+        assert plan([9, 9, 9, 9, 9, 9]) == ((2, (JUDGEMENT,)),)
+
+
+class TestRuleSets:
+    """Test rule set tables"""
+
+    def test_whole_text_plan(self):
+        """The whole text rule set reads everything of both hexagrams"""
+        everything = (JUDGEMENT, 1, 2, 3, 4, 5, 6)
+        assert plan([9, 8, 7, 8, 7, 8], 'whole text') == ((63, everything), (39, everything))
+        assert plan([7, 8, 7, 8, 7, 8], 'whole text') == ((63, everything),)
+
+    def test_tables_are_cached(self):
+        """Each rule set's table must be built once, with one plan per configuration"""
+        plans = pyching_engine.reading_plans('zhu xi')
+        assert plans is pyching_engine.reading_plans('zhu xi')
+        assert len(plans) == 4096
+
+    def test_plan_of_hexagrams_and_reading(self):
+        """Plans can be looked up from Hexagrams and Reading values alike"""
+        hexagrams = pyching_engine.Hexagrams(oracleType='coin')
+        for _ in range(6):
+            hexagrams.NewLine()
+        reading = pyching_engine.Reading.from_hexagrams(hexagrams)
+        assert pyching_engine.reading_plan(hexagrams) == pyching_engine.reading_plan(reading)
+
+    def test_unknown_rule_set_raises(self):
+        """Unknown rule sets must be rejected"""
+        with pytest.raises(ValueError):
+            pyching_engine.reading_plans('coin flipping')
+
+
+class TestPlanHtml:
+    """Test building html from reading plans"""
+
+    def test_info_dicts_rebuild_the_original_html(self):
+        """HexagramInfo must hold exactly what each data function builds its html from"""
+        for number in range(1, 65):
+            info = pyching_int_data.HexagramInfo(number)
+            assert pyching_int_data.BuildHtml(info) == getattr(pyching_int_data, f'in{number}data')()
+
+    def test_plan_html_only_holds_planned_lines(self):
+        """Plan html must include the planned line texts and nothing else"""
+        info = pyching_int_data.HexagramInfo(47)
+        html = pyching_int_data.BuildPlanHtml(pyching_engine.ReadingPlan(((47, (5, 6)),)))
+        assert info[5] in html and info[6] in html
+        assert info[1] not in html
+        assert info['title'] in html
+        assert html.startswith('<html>') and html.endswith('</html>')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
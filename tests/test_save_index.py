@@ -0,0 +1,170 @@
+"""
+Test Save Index
+===============
+
+These tests ensure the cached save directory index summarises every save
+file, re-reads only files that changed, survives a damaged cache and drives
+the sorted, paged console listing.
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyching_engine
+
+
+def save(directory, name, question, seed=None):
+    """Save a complete coin reading and return it"""
+    hexagrams = pyching_engine.Hexagrams('coin', None if seed is None else random.Random(seed))
+    hexagrams.recast(question)
+    hexagrams.Save(Path(directory) / name)
+    return hexagrams
+
+
+class TestSaveIndex:
+    """Test building and refreshing the save directory index"""
+
+    def test_entries_summarise_save_files(self, tmp_path):
+        """Each save file must be summarised with its date, question and hexagrams"""
+        hexagrams = save(tmp_path, 'one.psv', 'First question')
+        legacy = pyching_engine.Hexagrams('coin')
+        legacy.recast('Legacy question')
+        legacy.Save(tmp_path / 'legacy.psv', fileFormat='pickle')
+        index = pyching_engine.SaveIndex(tmp_path)
+        assert index.refresh()
+        entry = index.entries['one.psv']
+        assert (entry.fileType, entry.question, entry.timestamp) == \
+            ('binary', 'First question', hexagrams.timestamp)
+        assert (entry.hex1, entry.hex2) == (int(hexagrams.hex1.number), int(hexagrams.hex2.number or 0))
+        entry = index.entries['legacy.psv']
+        assert (entry.fileType, entry.question, entry.currentLine, entry.hex1) == \
+            ('pickle', 'Legacy question', None, 0)
+        assert pyching_engine.SaveIndex(tmp_path).entries == index.entries
+
+    def test_legacy_files_are_never_unpickled(self, tmp_path, monkeypatch):
+        """Listing legacy save files must not run the unpickler on them"""
+        legacy = pyching_engine.Hexagrams('coin')
+        legacy.recast('Legacy question')
+        legacy.question = pyching_engine.pyching.saveFileID[1] #the version object, pickled as a memo reference
+        legacy.Save(tmp_path / 'legacy.psv', fileFormat='pickle')
+        def refuse(*args, **kwargs):
+            raise AssertionError('legacy save file unpickled')
+        monkeypatch.setattr(pyching_engine.pickle, 'loads', refuse)
+        monkeypatch.setattr(pyching_engine.pickle, 'load', refuse)
+        index = pyching_engine.SaveIndex(tmp_path)
+        index.refresh()
+        assert index.entries['legacy.psv'].question == pyching_engine.pyching.saveFileID[1]
+
+    def test_long_questions_are_indexed(self, tmp_path):
+        """Questions longer than 65535 utf-8 bytes must be cached and listed"""
+        save(tmp_path, 'long.psv', 'x' * 70000)
+        index = pyching_engine.SaveIndex(tmp_path)
+        assert index.refresh()
+        assert pyching_engine.SaveIndex(tmp_path).entries['long.psv'].question == 'x' * 70000
+        assert [entry.name for entry in index.readings()] == ['long.psv']
+
+    def test_cache_is_reused_and_invalidated(self, tmp_path, monkeypatch):
+        """Only added or changed files may be read again, removed files must be dropped"""
+        for number in range(3):
+            save(tmp_path, f'{number}.psv', f'Question {number}')
+        pyching_engine.SaveIndex(tmp_path).refresh()
+        read = []
+        summarise = pyching_engine._SummariseSave
+        monkeypatch.setattr(pyching_engine, '_SummariseSave',
+                            lambda path, *args: read.append(path.name) or summarise(path, *args))
+        index = pyching_engine.SaveIndex(tmp_path)
+        assert not index.refresh()
+        assert read == []
+        save(tmp_path, '1.psv', 'Changed question')
+        os.utime(tmp_path / '1.psv', ns=(1, 1)) #make sure the change shows, whatever the clock
+        save(tmp_path, '3.psv', 'New question')
+        (tmp_path / '0.psv').unlink()
+        assert index.refresh()
+        assert sorted(read) == ['1.psv', '3.psv']
+        assert sorted(index.entries) == ['1.psv', '2.psv', '3.psv']
+        assert pyching_engine.SaveIndex(tmp_path).entries == index.entries
+
+    def test_unreadable_files_are_remembered_but_not_listed(self, tmp_path):
+        """Files that aren't save files must stay out of the listing"""
+        save(tmp_path, 'good.psv', 'Good')
+        (tmp_path / 'bad.psv').write_bytes(b'not a save file')
+        (tmp_path / 'notes.txt').write_text('ignored')
+        index = pyching_engine.SaveIndex(tmp_path)
+        index.refresh()
+        assert index.entries['bad.psv'].fileType == ''
+        assert 'notes.txt' not in index.entries
+        assert [entry.name for entry in index.readings()] == ['good.psv']
+
+    def test_damaged_cache_is_rebuilt(self, tmp_path):
+        """A damaged cache file must be ignored and rewritten"""
+        save(tmp_path, 'one.psv', 'Question')
+        index = pyching_engine.SaveIndex(tmp_path)
+        index.refresh()
+        data = index.indexFile.read_bytes()
+        index.indexFile.write_bytes(data[:-4])
+        damaged = pyching_engine.SaveIndex(tmp_path)
+        assert damaged.entries == {}
+        assert damaged.refresh()
+        assert damaged.indexFile.read_bytes() == data
+
+    def test_sort_orders(self, tmp_path):
+        """Readings must sort newest first by default and by each named order"""
+        for number, question in enumerate(('banana', 'Apple', 'cherry')):
+            save(tmp_path, f'{number}.psv', question, seed=number)
+        index = pyching_engine.SaveIndex(tmp_path)
+        index.refresh()
+        assert [entry.name for entry in index.readings()] == ['2.psv', '1.psv', '0.psv']
+        assert [entry.question for entry in index.readings('question', reverse=False)] == \
+            ['Apple', 'banana', 'cherry']
+        hexagrams = [entry.hex1 for entry in index.readings('hexagram', reverse=False)]
+        assert hexagrams == sorted(hexagrams)
+        with pytest.raises(ValueError):
+            index.readings('size')
+
+
+class TestConsoleListing:
+    """Test the paged console listing of saved readings"""
+
+    def test_pages_and_loads_by_number(self, tmp_path, monkeypatch, capsys):
+        """Paging forward must list the next readings and a number must load that reading"""
+        import pyching_interface_console as console
+        monkeypatch.setenv('HOME', str(tmp_path))
+        savePath = pyching_engine.PychingAppDetails().savePath
+        for number in range(console.LOAD_PAGE_SIZE + 5):
+            save(savePath, f'{number:02}.psv', f'Question {number}')
+        answers = iter(['n', 's', str(console.LOAD_PAGE_SIZE + 1)])
+        monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+        loaded = []
+        monkeypatch.setattr(console, 'display_reading', loaded.append)
+        monkeypatch.setattr(console, 'display_interpretation', lambda hexes: None)
+        console.load_reading()
+        output = capsys.readouterr().out
+        assert 'page 2 of 2' in output
+        assert 'by name (page 1 of 2)' in output
+        assert loaded[0].question == f'Question {console.LOAD_PAGE_SIZE}'
+
+    def test_damaged_file_is_reported(self, tmp_path, monkeypatch, capsys):
+        """A save file damaged after it was listed must be reported as damaged, not as bad input"""
+        import pyching_interface_console as console
+        monkeypatch.setenv('HOME', str(tmp_path))
+        savePath = pyching_engine.PychingAppDetails().savePath
+        save(savePath, 'reading.psv', 'Question')
+        def damage(prompt=''):
+            (savePath / 'reading.psv').write_bytes(pyching_engine.SAVE_MAGIC + b'\xff')
+            return '1'
+        monkeypatch.setattr('builtins.input', damage)
+        console.load_reading()
+        output = capsys.readouterr().out
+        assert 'reading.psv is damaged' in output
+        assert 'Please enter a number' not in output
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])